@@ -6,16 +6,29 @@ Public API exports domain classes and storage functions.
 from .dhtypes import (
     Backtest,
     Candle,
+    CandleFrame,
     Chart,
+    CHART_REGISTRY,
+    ChartRegistry,
     Day,
+    DayBuilder,
+    dt_strs_to_epochs,
+    epochs_to_dt_strs,
     Event,
+    EventIndex,
+    expected_candle_epochs,
     Indicator,
     IndicatorDataPoint,
+    IndicatorDataPoints,
     IndicatorEMA,
     IndicatorRSI,
     IndicatorSMA,
+    IndicatorSweep,
+    LazyCandle,
+    next_candle_start_epochs,
     StoredImage,
     Symbol,
+    this_candle_start_epochs,
     Trade,
     TradePlan,
     TradeSeries,
@@ -24,6 +37,7 @@ from .dhtypes import (
 from .dhcommon import (
     bot,
     check_tf_th_compatibility,
+    clear_dt_caches,
     DEFAULT_OBJ_NAME,
     diff_dicts,
     dow_name,
@@ -56,6 +70,7 @@ from .dhutil import (
     compare_candles_vs_csv,
     generate_zero_volume_candle,
     read_candles_from_csv,
+    rebuild_candles_from_1m,
     remediate_candle_gaps,
     store_candles_from_csv,
 )
@@ -84,6 +99,7 @@ try:
         get_all_trades,
         get_all_tradeseries,
         get_backtests_by_field,
+        get_candle_frame,
         get_candles,
         get_events,
         get_indicator,
@@ -96,6 +112,7 @@ try:
         get_tradeseries_by_field,
         list_indicators_names,
         reconstruct_tradeplan,
+        refresh_events_cache,
         review_backtests,
         review_candles,
         review_indicators,
@@ -138,19 +155,24 @@ __all__ = [
     'Backtest',
     'bot',
     'Candle',
+    'CandleFrame',
     'Chart',
+    'CHART_REGISTRY',
+    'ChartRegistry',
     'check_integrity_future_datetimes',
     'check_integrity_no_nameless_objects',
     'check_integrity_no_test_orphans',
     'check_integrity_orphaned_images',
     'check_integrity_unique_fields',
     'check_tf_th_compatibility',
+    'clear_dt_caches',
     'clear_events',
     'COLL_PATTERNS',
     'COLLECTIONS',
     'compare_candles_vs_csv',
     'DEFAULT_OBJ_NAME',
     'Day',
+    'DayBuilder',
     'delete_backtests',
     'delete_backtests_by_field',
     'delete_candles',
@@ -171,9 +193,13 @@ __all__ = [
     'dt_as_str',
     'dt_as_time',
     'dt_from_epoch',
+    'dt_strs_to_epochs',
     'dt_to_epoch',
+    'epochs_to_dt_strs',
     'Event',
+    'EventIndex',
     'expected_candle_datetimes',
+    'expected_candle_epochs',
     'find_repo_root',
     'generate_zero_volume_candle',
     'get_all_custom_documents',
@@ -182,6 +208,7 @@ __all__ = [
     'get_backtests_by_field',
     'get_all_trades',
     'get_all_tradeseries',
+    'get_candle_frame',
     'get_candles',
     'get_custom_documents_by_field',
     'get_events',
@@ -199,9 +226,12 @@ __all__ = [
     'ImageResponse',
     'Indicator',
     'IndicatorDataPoint',
+    'IndicatorDataPoints',
     'IndicatorEMA',
     'IndicatorRSI',
     'IndicatorSMA',
+    'IndicatorSweep',
+    'LazyCandle',
     'list_custom_documents',
     'list_images',
     'list_indicators_names',
@@ -209,12 +239,14 @@ __all__ = [
     'MARKET_ERAS',
     'new_uuid',
     'next_candle_start',
+    'next_candle_start_epochs',
     'normalize_list_of_strings',
     'OperationTimer',
     'ProgBar',
     'prompt_yn',
     'rangify_candle_times',
     'read_candles_from_csv',
+    'rebuild_candles_from_1m',
     'remediate_candle_gaps',
     'review_backtests',
     'review_candles',
@@ -224,6 +256,7 @@ __all__ = [
     'review_trades',
     'review_tradeseries',
     'reconstruct_tradeplan',
+    'refresh_events_cache',
     'sort_dict',
     'store_backtests',
     'store_candle',
@@ -242,6 +275,7 @@ __all__ = [
     'StoredImage',
     'TF_TH_MAP',
     'this_candle_start',
+    'this_candle_start_epochs',
     'timeframe_delta',
     'Trade',
     'TradePlan',
@@ -31,6 +31,7 @@ including dhstore, dhutil, and dhtypes.
 from datetime import datetime as dt
 from datetime import timedelta, date, time
 from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 import re
 import logging
@@ -66,6 +67,8 @@ DT_STR_FLEX_REGEX = re.compile(
     r"^\s*(\d{2,4})-(\d{1,2})-(\d{1,2})\s+"
     r"(\d{1,2}):(\d{1,2}):(\d{1,2})\s*$"
 )
+# Most distinct datetime strings remembered by each conversion memo
+DT_CACHE_SIZE = 65536
 TIMEFRAME_DELTAS = {
     "1m": timedelta(minutes=1),
     "5m": timedelta(minutes=5),
@@ -374,20 +377,30 @@ def valid_event_category(c, exit=True):
         return False
 
 
-def dt_as_dt(d):
-    """Return a datetime from the given datetime, string, or None input.
+def _is_canonical_dt_str(d: str) -> bool:
+    """Return True if d is in the canonical YYYY-mm-dd HH:MM:SS format.
+
+    Same result as DT_STR_CANONICAL_REGEX.fullmatch() using fixed
+    position checks only.
     """
-    if d is None:
-        return None
-    if isinstance(d, dt):
-        return d
+    return (len(d) == 19
+            and d[4] == "-" and d[7] == "-" and d[10] == " "
+            and d[13] == ":" and d[16] == ":"
+            and (d[:4] + d[5:7] + d[8:10] + d[11:13] + d[14:16]
+                 + d[17:]).isdecimal())
 
-    if not isinstance(d, str):
-        raise TypeError(f"d must be str, datetime, or None. Got {type(d)}")
 
-    # First attempt to match the standard canonical format
-    if DT_STR_CANONICAL_REGEX.fullmatch(d):
-        return dt.strptime(d, DT_STR_FORMAT)
+@lru_cache(maxsize=DT_CACHE_SIZE)
+def _dt_from_str(d: str):
+    """Parse a datetime string, remembering recent results.
+
+    Canonical strings are sliced at fixed positions rather than going
+    through regex and strptime.  Datetimes are immutable so cached
+    results are safe to share.
+    """
+    if _is_canonical_dt_str(d):
+        return dt(int(d[:4]), int(d[5:7]), int(d[8:10]),
+                  int(d[11:13]), int(d[14:16]), int(d[17:]))
 
     # If that fails, attempt to match the more flexible format which may
     # exclude leading zeroes in single digit values or reduce years to 2 digits
@@ -403,14 +416,44 @@ def dt_as_dt(d):
         second = int(match.group(6))
         return dt(year, month, day, hour, minute, second)
 
-    # All supported regex patterns exhausted; the input format is not
-    # recognized.
+    # All supported formats exhausted; the input format is not recognized.
     raise ValueError(
         f"Unsupported datetime string format: {d}. Expected "
         "YYYY-mm-dd HH:MM:SS or shorthand with '-' separators."
     )
 
 
+@lru_cache(maxsize=DT_CACHE_SIZE)
+def _epoch_from_str(d: str):
+    """Return the local-time epoch of a datetime string, memoized."""
+    return int(_dt_from_str(d).timestamp())
+
+
+def clear_dt_caches():
+    """Forget all memoized datetime string conversions.
+
+    Only needed if the process timezone is changed after conversions
+    have already been made, as cached epochs reflect the timezone in
+    effect when they were first computed.
+    """
+    _dt_from_str.cache_clear()
+    _epoch_from_str.cache_clear()
+
+
+def dt_as_dt(d):
+    """Return a datetime from the given datetime, string, or None input.
+    """
+    if d is None:
+        return None
+    if isinstance(d, dt):
+        return d
+
+    if not isinstance(d, str):
+        raise TypeError(f"d must be str, datetime, or None. Got {type(d)}")
+
+    return _dt_from_str(d)
+
+
 def dt_as_str(d):
     """Return a string from the given datetime, string, or None input.
     """
@@ -419,12 +462,16 @@ def dt_as_str(d):
 
     # If a string is given, return an equivalent string in the standard format
     if isinstance(d, str):
-        if DT_STR_CANONICAL_REGEX.fullmatch(d):
+        if _is_canonical_dt_str(d):
             return d
-        return dt_as_dt(d).strftime(DT_STR_FORMAT)
+        return _dt_from_str(d).strftime(DT_STR_FORMAT)
 
-    # If a datetime is given, convert to a string in the standard format
+    # If a datetime is given, convert to a string in the standard format.
+    # isoformat() matches DT_STR_FORMAT for naive datetimes with 4 digit
+    # years and is several times faster than strftime().
     if isinstance(d, dt):
+        if d.tzinfo is None and d.year >= 1000:
+            return d.isoformat(" ", "seconds")
         return d.strftime(DT_STR_FORMAT)
 
     # Raise an error if the input was not a string, datetime, or None
@@ -450,6 +497,8 @@ def dt_to_epoch(d):
     """Return an epoch integer from a datetime or string."""
     if d is None:
         return None
+    if isinstance(d, str):
+        return _epoch_from_str(d)
     return int(dt_as_dt(d).timestamp())
 
 
@@ -508,6 +557,29 @@ def dict_of_weeks(start_dt, end_dt, template):
     return result
 
 
+# Period and minute-of-hour anchor of timeframes that align within the hour
+_MINUTE_ALIGNMENTS = {
+    "1m": (1, 0),
+    "5m": (5, 0),
+    "15m": (15, 0),
+    "r1h": (60, 30),
+    "e1h": (60, 0),
+}
+
+
+def _align_up(dt, timeframe: str):
+    """Return the first candle start at or after a whole-minute dt.
+
+    Only supports timeframes in _MINUTE_ALIGNMENTS.
+    """
+    period, anchor = _MINUTE_ALIGNMENTS[timeframe]
+    minutes_ahead = (anchor - dt.minute) % period
+    if minutes_ahead:
+        dt = dt + timedelta(minutes=minutes_ahead)
+
+    return dt
+
+
 def this_candle_start(dt, timeframe: str):
     """Return the parent candle start datetime for the given dt and timeframe.
 
@@ -515,24 +587,15 @@ def this_candle_start(dt, timeframe: str):
     not confirm market open and may not be able to answer in all cases.
     """
     this_dt = dt_as_dt(dt)
-    min_delta = timedelta(minutes=1)
     # Start by removing secs and microsecs to get to the whole minute
     this_dt = this_dt.replace(microsecond=0, second=0)
-    # Align to the timeframe's period boundary by stepping back one minute.
-    if timeframe == "1m":
-        pass
-    elif timeframe == "5m":
-        while this_dt.minute % 5 != 0:
-            this_dt = this_dt - min_delta
-    elif timeframe == "15m":
-        while this_dt.minute % 15 != 0:
-            this_dt = this_dt - min_delta
-    elif timeframe == "r1h":
-        while this_dt.minute != 30:
-            this_dt = this_dt - min_delta
-    elif timeframe == "e1h":
-        while this_dt.minute != 0:
-            this_dt = this_dt - min_delta
+    # Align to the timeframe's period boundary by stepping back the number
+    # of minutes past it.
+    if timeframe in _MINUTE_ALIGNMENTS:
+        period, anchor = _MINUTE_ALIGNMENTS[timeframe]
+        minutes_back = (this_dt.minute - anchor) % period
+        if minutes_back:
+            this_dt = this_dt - timedelta(minutes=minutes_back)
     elif timeframe == "e1d":
         # ETH daily sessions start at 18:00; find the most recent 18:00
         # boundary (same or prior day depending on current time).
@@ -575,6 +638,9 @@ def next_candle_start(dt,
     """Return the next valid candle start datetime during open market hours.
 
     symbol must be a Symbol-like object implementing market_is_open().
+    Symbols that also implement next_open_epoch() let intraday
+    timeframes jump straight past closed periods (weekends, holidays)
+    rather than checking each candidate in turn.
     """
     if isinstance(symbol, str):
         raise TypeError("symbol must be a Symbol object, not str")
@@ -587,23 +653,17 @@ def next_candle_start(dt,
         hasattr(symbol, "build_market_hours_context"),
         hasattr(symbol, "is_open_dt"),
     ])
+    # Prefer the symbol's cached trading calendar where available
+    use_calendar = hasattr(symbol, "get_trading_calendar")
+    use_jump = (use_context and hasattr(symbol, "next_open_epoch")
+                and timeframe in _MINUTE_ALIGNMENTS)
     context = None
 
     done = False
     while not done:
         next_dt = next_dt + min_delta
-        if timeframe == "5m":
-            while next_dt.minute % 5 != 0:
-                next_dt = next_dt + min_delta
-        elif timeframe == "15m":
-            while next_dt.minute % 15 != 0:
-                next_dt = next_dt + min_delta
-        elif timeframe == "r1h":
-            while next_dt.minute != 30:
-                next_dt = next_dt + min_delta
-        elif timeframe == "e1h":
-            while next_dt.minute != 0:
-                next_dt = next_dt + min_delta
+        if timeframe in _MINUTE_ALIGNMENTS:
+            next_dt = _align_up(next_dt, timeframe)
         elif timeframe == "e1d":
             # e1d candles start at 18:00:00
             # Return the next 18:00:00 after current datetime
@@ -641,7 +701,11 @@ def next_candle_start(dt,
             # Reuse context for 14-day window, rebuilding when moved beyond end
             if (context is None
                     or dt_to_epoch(next_dt) > context["end_epoch"]):
-                context = symbol.build_market_hours_context(
+                if use_calendar:
+                    build_context = symbol.get_trading_calendar
+                else:
+                    build_context = symbol.build_market_hours_context
+                context = build_context(
                     trading_hours=trading_hours,
                     events=events,
                     start_dt=next_dt,
@@ -649,6 +713,16 @@ def next_candle_start(dt,
                 )
             done = symbol.is_open_dt(target_dt=next_dt,
                                      context=context)
+            if not done and use_jump:
+                # Jump to the first open moment, rounded up to a whole
+                # minute, then step back one so the next pass lands on it
+                open_epoch = symbol.next_open_epoch(
+                    target_epoch=dt_to_epoch(next_dt),
+                    context=context,
+                )
+                open_epoch = open_epoch + (-open_epoch % 60)
+                next_dt = max(next_dt,
+                              dt_from_epoch(open_epoch) - min_delta)
         else:
             done = symbol.market_is_open(trading_hours=trading_hours,
                                          target_dt=next_dt,
@@ -696,10 +770,15 @@ def expected_candle_datetimes(start_dt,
 
     ender = dt_as_dt(end_dt)
 
-    # Build one shared context for entire date range for efficient lookups
+    # Build one shared context for entire date range for efficient lookups,
+    # preferring the symbol's cached trading calendar where available
     context = None
     if this <= ender:
-        context = symbol.build_market_hours_context(
+        if hasattr(symbol, "get_trading_calendar"):
+            build_context = symbol.get_trading_calendar
+        else:
+            build_context = symbol.build_market_hours_context
+        context = build_context(
             trading_hours=trading_hours,
             events=closed_events,
             start_dt=this,
@@ -0,0 +1,483 @@
+"""Array-in, array-out calculation kernels for the built-in indicators.
+
+Each kernel takes a 1-D sequence of candle values and returns a float64
+array of the same length, holding NaN wherever the indicator is not yet
+defined.  They reproduce the per-candle calculations IndicatorSMA,
+IndicatorEMA, and IndicatorRSI have always used, so results match them
+to the last bit:
+
+- sma(): Simple moving average from one exact running sum
+- ema(): Exponential moving average seeded by a rounded simple average
+- rsi(): Relative strength index with wilder, exponential, or simple
+  averaging of gains and losses, built from rsi_averages() by
+  rsi_from_averages()
+- sma_sweep(), ema_sweep(), rsi_sweep(): The same for many lengths or
+  periods at once, returned as one row per variant, with
+  rsi_sweep_averages() behind rsi_sweep()
+- round_values(): Round a whole array exactly as round() would
+
+The EMA and RSI recurrences run as sequential loops over the candles
+rather than closed-form array expressions, as reordering their floating
+point operations would change results.  Single series loop over plain
+floats.  Sweeps with at least SWEEP_VECTOR_COLUMNS recurrences step them
+all forward together, a few array operations per candle, and smaller
+sweeps loop over each row as a single series would.  Array operations
+cost far more per candle than a float loop, so sweeps only pay off for
+many variants.  Over 100,000 closes one ema() takes about 0.02s; an
+ema_sweep() of 3 lengths costs the same as 3 ema() calls, about 0.05s,
+while one of 50 lengths takes about 0.3s against 0.8s for 50 calls, 15
+times one ema() rather than the cost of one.  RSI sweeps step two
+recurrences per period, so they switch to arrays from 8 periods.
+Everything around the recurrences is done on whole arrays.  ema() and
+rsi_averages() accept a prior to carry on from where an earlier call on
+the preceding values stopped, giving the same values as one call over
+all of them.
+
+ARCHITECTURE NOTE: This module depends only on numpy and the standard
+library, never on other dhtrader modules, so dhtypes can import it
+without creating circular imports.
+"""
+import logging
+from math import fsum
+import numpy as np
+
+log = logging.getLogger("dhkernels")
+log.addHandler(logging.NullHandler())
+
+# Scale that turns prices on a 1/1024 grid, including 0.25 ticks, into
+# integers, and the largest total such integers can reach while float64
+# still holds every running sum exactly
+EXACT_SUM_SCALE = 1024.0
+EXACT_SUM_LIMIT = 2 ** 53
+# Values whose scaled value sits this close to a rounding boundary, or
+# is this large, are rounded by round() rather than on the whole array
+ROUND_TIE_TOLERANCE = 1e-6
+ROUND_FAST_LIMIT = 1e9
+RSI_SMOOTHING = ["wilder", "simple", "exponential"]
+# Fewest recurrence columns stepped forward together as arrays; below it
+# each column runs as its own plain float loop, which is cheaper
+SWEEP_VECTOR_COLUMNS = 16
+
+
+def _as_values(values) -> np.ndarray:
+    """Return values as a 1-D float64 array."""
+    return np.asarray(values, dtype=np.float64).reshape(-1)
+
+
+def _check_length(name: str, length: int):
+    """Raise ValueError unless length is a positive whole number."""
+    if int(length) != length or length < 1:
+        msg = f"{name} must be a positive integer, got {length}"
+        log.critical(msg)
+        raise ValueError(msg)
+
+
+def _window_means(values: np.ndarray, lengths: list) -> list:
+    """Return the means of each full window for each of lengths.
+
+    Item k holds one mean per full window of lengths[k] consecutive
+    values, where mean i is of values[i:i + lengths[k]] and equals
+    statistics.fmean() of that window exactly.  Values on a 1/1024 grid,
+    such as prices in 0.25 ticks and their differences, are scaled to
+    integers and summed with one cumulative sum shared by all lengths,
+    which is exact; any other values fall back to math.fsum() of each
+    window.
+    """
+    scaled = values * EXACT_SUM_SCALE
+    whole = np.rint(scaled)
+    if (np.array_equal(scaled, whole)
+            and np.abs(whole).sum() < EXACT_SUM_LIMIT):
+        sums = np.concatenate(([0], np.cumsum(whole.astype(np.int64))))
+        return [((sums[length:] - sums[:-length]) / EXACT_SUM_SCALE) / length
+                if length <= len(values) else np.empty(0, dtype=np.float64)
+                for length in lengths]
+    data = values.tolist()
+
+    return [np.array([fsum(data[i:i + length]) / length
+                      for i in range(len(data) - length + 1)],
+                     dtype=np.float64)
+            for length in lengths]
+
+
+def _check_lengths(name: str, lengths) -> list:
+    """Return lengths as a list after checking each is usable."""
+    lengths = list(lengths)
+    for length in lengths:
+        _check_length(name, length)
+
+    return [int(length) for length in lengths]
+
+
+def _per_variant(name: str, setting, count: int) -> list:
+    """Return setting repeated count times unless it is already a list."""
+    if not isinstance(setting, (list, tuple, np.ndarray)):
+        return [setting] * count
+    if len(setting) != count:
+        msg = f"{name} needs {count} entries, got {len(setting)}"
+        log.critical(msg)
+        raise ValueError(msg)
+
+    return list(setting)
+
+
+def _column_recurrences(terms: np.ndarray,
+                        weights: list,
+                        seeds: list,
+                        seed_rows: list,
+                        ) -> np.ndarray:
+    """Do what _recurrences() does with a plain float loop per column."""
+    for k, (weight, row) in enumerate(zip(weights, seed_rows)):
+        terms[:row, k] = np.nan
+        if row >= len(terms):
+            continue
+        keep = 1 - weight
+        prior = seeds[k]
+        results = [prior]
+        for term in terms[row + 1:, k].tolist():
+            prior = term + (prior * keep)
+            results.append(prior)
+        terms[row:, k] = results
+
+    return terms
+
+
+def _recurrences(terms: np.ndarray,
+                 weights: list,
+                 seeds: list,
+                 seed_rows: list,
+                 ) -> np.ndarray:
+    """Turn weighted terms into one recurrence per column, in place.
+
+    Fewer than SWEEP_VECTOR_COLUMNS columns go to _column_recurrences().
+
+    terms holds values[i] * weights[k] at row i of column k.  Column k
+    becomes seeds[k] at row seed_rows[k] and, for each later row i,
+    terms[i, k] + (prior * (1 - weights[k])), the same float operations
+    as a scalar loop.  Rows before a seed, and columns whose seed row is
+    past the end, become NaN.  Returns terms.
+    """
+    if len(weights) < SWEEP_VECTOR_COLUMNS:
+        return _column_recurrences(terms, weights, seeds, seed_rows)
+    keeps = 1 - np.array(weights, dtype=np.float64)
+    starts = {}
+    for k, row in enumerate(seed_rows):
+        terms[:row, k] = np.nan
+        if row < len(terms):
+            starts.setdefault(row, []).append(k)
+    if not starts:
+        return terms
+    prior = np.empty(len(weights))
+    first = min(starts)
+    for i in range(first, len(terms)):
+        row = terms[i]
+        if i > first:
+            np.multiply(terms[i - 1], keeps, out=prior)
+            np.add(row, prior, out=row)
+        if i in starts:
+            row[starts[i]] = [seeds[k] for k in starts[i]]
+
+    return terms
+
+
+def round_values(values, places: int = 2) -> np.ndarray:
+    """Return values rounded to places exactly as round() rounds them.
+
+    numpy.round() scales before rounding and can land one unit away from
+    round() in the last place.  Values are rounded on whole arrays, and
+    only those whose scaled value is too close to a rounding boundary to
+    be sure of, or too large, go through round().  NaN values are kept
+    and the shape of values is preserved.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    scale = 10.0 ** places
+    scaled = values * scale
+    whole = np.rint(scaled)
+    out = whole / scale
+    with np.errstate(invalid="ignore"):
+        unsure = ((np.abs(scaled - np.floor(scaled) - 0.5)
+                   < ROUND_TIE_TOLERANCE)
+                  | ~(np.abs(scaled) < ROUND_FAST_LIMIT))
+    if unsure.any():
+        out[unsure] = [round(v, places) for v in values[unsure].tolist()]
+
+    return out
+
+
+def sma(values, length: int) -> np.ndarray:
+    """Return the simple moving average of values over length values.
+
+    out[i] is the mean of values[i - length + 1:i + 1] and is NaN for the
+    first length - 1 positions.
+    """
+    _check_length("length", length)
+    values = _as_values(values)
+    out = np.full(len(values), np.nan)
+    out[length - 1:] = _window_means(values, [length])[0]
+
+    return out
+
+
+def sma_sweep(values, lengths) -> np.ndarray:
+    """Return the simple moving average of values for each of lengths.
+
+    Row k matches sma(values, lengths[k]).  All lengths share one running
+    sum of values.
+    """
+    lengths = _check_lengths("length", lengths)
+    values = _as_values(values)
+    out = np.full((len(lengths), len(values)), np.nan)
+    for k, means in enumerate(_window_means(values, lengths)):
+        out[k, lengths[k] - 1:] = means
+
+    return out
+
+
+def ema(values,
+        length: int,
+        smoothing: int = 2,
+        prior: float = None,
+        ) -> np.ndarray:
+    """Return the exponential moving average of values.
+
+    The average is seeded with the mean of the first length values,
+    rounded to 2 places, and each later value weighs in at
+    smoothing / (length + 1).  out[i] is NaN for the first length
+    positions, where only the seed is being built.  Callers wanting
+    settled values should skip further, IndicatorEMA keeps values from
+    position 4 * length on.
+
+    Given the unrounded average at the value just before values as
+    prior, the average carries on from it instead and every position is
+    defined.
+    """
+    _check_length("length", length)
+    values = _as_values(values)
+    out = np.full(len(values), np.nan)
+    data = values.tolist()
+    if prior is None:
+        if len(values) <= length:
+            return out
+        prior = round(fsum(data[:length]) / length, 2)
+        start = length
+    else:
+        start = 0
+    weight = smoothing / (length + 1)
+    keep = 1 - weight
+    results = []
+    for v in data[start:]:
+        prior = (v * weight) + (prior * keep)
+        results.append(prior)
+    out[start:] = results
+
+    return out
+
+
+def ema_sweep(values, lengths, smoothing=2) -> np.ndarray:
+    """Return the exponential moving average of values for each of lengths.
+
+    Row k matches ema(values, lengths[k], smoothing), where smoothing may
+    be one value for all rows or a list with one per row.  Rows are
+    stepped forward together, one candle at a time, once there are
+    SWEEP_VECTOR_COLUMNS of them.
+    """
+    lengths = _check_lengths("length", lengths)
+    smoothings = _per_variant("smoothing", smoothing, len(lengths))
+    values = _as_values(values)
+    data = values.tolist()
+    seeds = [round(fsum(data[:length]) / length, 2)
+             if length < len(data) else np.nan
+             for length in lengths]
+    weights = [s / (length + 1) for length, s in zip(lengths, smoothings)]
+    # Each seed sits on the last value it averages, where ema() has NaN
+    out = _recurrences(np.multiply.outer(values, weights),
+                       weights=weights,
+                       seeds=seeds,
+                       seed_rows=[length - 1 for length in lengths],
+                       ).T.copy()
+    for k, length in enumerate(lengths):
+        out[k, :length] = np.nan
+
+    return out
+
+
+def rsi_from_averages(avg_gain: np.ndarray,
+                      avg_loss: np.ndarray,
+                      ) -> np.ndarray:
+    """Return RSI for each pair of average gain and average loss.
+
+    Flat pairs are 50, pairs without losses 100, and pairs without gains
+    0.  Pairs holding NaN give NaN.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rs = avg_gain / avg_loss
+        result = 100.0 - (100.0 / (1.0 + rs))
+    no_gain = avg_gain == 0
+    no_loss = avg_loss == 0
+    result[no_gain] = 0.0
+    result[no_loss] = 100.0
+    result[no_gain & no_loss] = 50.0
+
+    return result
+
+
+def _check_smoothing(smoothing: str):
+    """Raise ValueError unless smoothing is a supported RSI mode."""
+    if smoothing not in RSI_SMOOTHING:
+        msg = (f"smoothing {smoothing} not supported, must be one of: "
+               f"{RSI_SMOOTHING}")
+        log.critical(msg)
+        raise ValueError(msg)
+
+
+def rsi_averages(values,
+                 period: int = 14,
+                 smoothing: str = "wilder",
+                 prior: tuple = None,
+                 ):
+    """Return the average gains and average losses behind rsi() of values.
+
+    Gains and losses between consecutive values start from their simple
+    average over the first period changes.  Later averages are updated
+    with weight 1 / period for wilder or 2 / (period + 1) for
+    exponential smoothing, or taken over a sliding window of the last
+    period changes for simple smoothing.  Returns two float64 arrays the
+    same length as values, NaN for the first period positions.
+
+    Given prior, a tuple of the value just before values and the
+    unrounded average gain and average loss at it, wilder and
+    exponential averages carry on from it instead and every position is
+    defined.  Simple averages have no prior; prepend the last period
+    values instead.
+    """
+    _check_length("period", period)
+    _check_smoothing(smoothing)
+    values = _as_values(values)
+    avg_gain = np.full(len(values), np.nan)
+    avg_loss = np.full(len(values), np.nan)
+    if prior is None:
+        if len(values) <= period:
+            return avg_gain, avg_loss
+        deltas = np.diff(values)
+    elif smoothing == "simple":
+        msg = "simple smoothing can not carry on from a prior"
+        log.critical(msg)
+        raise ValueError(msg)
+    else:
+        deltas = np.diff(values, prepend=prior[0])
+    gains = np.where(deltas > 0, deltas, 0.0)
+    losses = np.where(deltas < 0, -deltas, 0.0)
+    if smoothing == "simple":
+        # Window j holds the changes into values[j + 1:j + period + 1]
+        avg_gain[period:] = _window_means(gains, [period])[0]
+        avg_loss[period:] = _window_means(losses, [period])[0]
+        return avg_gain, avg_loss
+    if smoothing == "wilder":
+        alpha = 1 / period
+    else:
+        alpha = 2 / (period + 1)
+    keep = 1 - alpha
+    gain_list = gains.tolist()
+    loss_list = losses.tolist()
+    if prior is None:
+        g = fsum(gain_list[:period]) / period
+        lo = fsum(loss_list[:period]) / period
+        avg_gains = [g]
+        avg_losses = [lo]
+        start = period
+        gain_list = gain_list[period:]
+        loss_list = loss_list[period:]
+    else:
+        g, lo = prior[1], prior[2]
+        avg_gains = []
+        avg_losses = []
+        start = 0
+    for gain, loss in zip(gain_list, loss_list):
+        g = (gain * alpha) + (g * keep)
+        lo = (loss * alpha) + (lo * keep)
+        avg_gains.append(g)
+        avg_losses.append(lo)
+    avg_gain[start:] = avg_gains
+    avg_loss[start:] = avg_losses
+
+    return avg_gain, avg_loss
+
+
+def rsi(values,
+        period: int = 14,
+        smoothing: str = "wilder",
+        prior: tuple = None,
+        ) -> np.ndarray:
+    """Return the relative strength index of values.
+
+    Averages gains and losses as rsi_averages() does, with the same
+    prior, so out[i] is NaN for the first period positions unless
+    carrying on from a prior.
+    """
+    return rsi_from_averages(*rsi_averages(values, period, smoothing, prior))
+
+
+def rsi_sweep_averages(values, periods, smoothing="wilder"):
+    """Return the average gains and losses behind rsi_sweep() of values.
+
+    Row k of each matches rsi_averages(values, periods[k], smoothing),
+    where smoothing may be one mode for all rows or a list with one per
+    row.  All rows share the gains and losses of values; simple rows
+    share their running sums and wilder and exponential rows are stepped
+    forward together once their average gains and losses make
+    SWEEP_VECTOR_COLUMNS recurrences.
+    """
+    periods = _check_lengths("period", periods)
+    smoothings = _per_variant("smoothing", smoothing, len(periods))
+    for mode in smoothings:
+        _check_smoothing(mode)
+    values = _as_values(values)
+    avg_gain = np.full((len(periods), len(values)), np.nan)
+    avg_loss = np.full((len(periods), len(values)), np.nan)
+    # Only periods with at least one value to report are calculated
+    rows = [k for k, p in enumerate(periods) if p < len(values)]
+    if not rows:
+        return avg_gain, avg_loss
+    deltas = np.diff(values)
+    gains = np.where(deltas > 0, deltas, 0.0)
+    losses = np.where(deltas < 0, -deltas, 0.0)
+    simple = [k for k in rows if smoothings[k] == "simple"]
+    if simple:
+        lengths = [periods[k] for k in simple]
+        avg_gains = _window_means(gains, lengths)
+        avg_losses = _window_means(losses, lengths)
+        for k, g, lo in zip(simple, avg_gains, avg_losses):
+            avg_gain[k, periods[k]:] = g
+            avg_loss[k, periods[k]:] = lo
+    smoothed = [k for k in rows if smoothings[k] != "simple"]
+    if smoothed:
+        weights = [1 / periods[k] if smoothings[k] == "wilder"
+                   else 2 / (periods[k] + 1)
+                   for k in smoothed]
+        gain_list = gains.tolist()
+        loss_list = losses.tolist()
+        # Average gains and average losses step forward in one pass, as
+        # the first and second half of the columns
+        averages = _recurrences(
+            np.concatenate((np.multiply.outer(gains, weights),
+                            np.multiply.outer(losses, weights)), axis=1),
+            weights=weights * 2,
+            seeds=([fsum(gain_list[:periods[k]]) / periods[k]
+                    for k in smoothed]
+                   + [fsum(loss_list[:periods[k]]) / periods[k]
+                      for k in smoothed]),
+            seed_rows=[periods[k] - 1 for k in smoothed] * 2)
+        for c, k in enumerate(smoothed):
+            avg_gain[k, periods[k]:] = averages[periods[k] - 1:, c]
+            avg_loss[k, periods[k]:] = averages[periods[k] - 1:,
+                                                c + len(smoothed)]
+
+    return avg_gain, avg_loss
+
+
+def rsi_sweep(values, periods, smoothing="wilder") -> np.ndarray:
+    """Return the relative strength index of values for each of periods.
+
+    Row k matches rsi(values, periods[k], smoothing), averaging gains and
+    losses as rsi_sweep_averages() does.
+    """
+    return rsi_from_averages(*rsi_sweep_averages(values, periods, smoothing))
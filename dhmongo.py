@@ -20,6 +20,7 @@ from pymongo.errors import BulkWriteError
 import logging
 from dotenv import load_dotenv, find_dotenv
 from datetime import datetime as dt
+import numpy as np
 from .dhcommon import (
     ProgBar, prompt_yn, valid_timeframe, dt_as_str, dt_from_epoch,
     dt_to_epoch)
@@ -27,6 +28,19 @@ from .dhcommon import (
 log = logging.getLogger("dhmongo")
 log.addHandler(logging.NullHandler())
 
+# Cursor batch size for columnar candle fetches.  Large batches cut the
+# number of server round trips when streaming years of 1m candles.
+CANDLE_ARRAY_BATCH_SIZE = 50000
+# Candle fields and dtypes filled by get_candle_arrays()
+CANDLE_ARRAY_FIELDS = {
+    "c_epoch": np.int64,
+    "c_open": np.float64,
+    "c_high": np.float64,
+    "c_low": np.float64,
+    "c_close": np.float64,
+    "c_volume": np.int64,
+}
+
 
 # Establish mongo connection parameters and client
 MONGO_ENV_FILE = 'mongo.env'
@@ -1065,6 +1079,67 @@ def get_candles(start_epoch: int,
     return result
 
 
+def get_candle_arrays(start_epoch: int,
+                      end_epoch: int,
+                      timeframe: str,
+                      symbol: str,
+                      batch_size: int = CANDLE_ARRAY_BATCH_SIZE,
+                      show_progress: bool = False,
+                      ):
+    """Return candle fields within the epochs, inclusive, as arrays.
+
+    Projects only the OHLCV fields and fills preallocated NumPy arrays
+    straight from the cursor, so no per-candle objects are kept.  Returns
+    a dict of field name to array, sorted by c_epoch.
+    """
+    c = db[f"candles_{symbol}_{timeframe}"]
+    candle_filter = {
+        "$and": [
+            {"c_epoch": {"$gte": start_epoch}},
+            {"c_epoch": {"$lte": end_epoch}},
+        ]
+    }
+    projection = {f: 1 for f in CANDLE_ARRAY_FIELDS}
+    projection["_id"] = 0
+    total = c.count_documents(candle_filter)
+    pbar = start_progbar(show_progress, total,
+                         f"{symbol} {timeframe} candles fetched")
+    epochs = np.empty(total, dtype=np.int64)
+    opens = np.empty(total, dtype=np.float64)
+    highs = np.empty(total, dtype=np.float64)
+    lows = np.empty(total, dtype=np.float64)
+    closes = np.empty(total, dtype=np.float64)
+    volumes = np.empty(total, dtype=np.int64)
+    cursor = c.find(candle_filter, projection, batch_size=batch_size)
+    cursor = cursor.sort("c_epoch", pymongo.ASCENDING)
+    i = 0
+    for doc in cursor:
+        # Documents written after the count was taken would overflow the
+        # preallocated arrays, stop at the counted total
+        if i >= total:
+            log.warning(f"More {symbol} {timeframe} candles arrived than the "
+                        f"{total} counted, ignoring the extras")
+            break
+        epochs[i] = doc["c_epoch"]
+        opens[i] = doc["c_open"]
+        highs[i] = doc["c_high"]
+        lows[i] = doc["c_low"]
+        closes[i] = doc["c_close"]
+        volumes[i] = doc["c_volume"]
+        i += 1
+        update_progbar(pbar, i, total)
+    finish_progbar(pbar)
+
+    # Trim in case documents were removed after the count was taken
+    return {"c_epoch": epochs[:i],
+            "c_open": opens[:i],
+            "c_high": highs[:i],
+            "c_low": lows[:i],
+            "c_close": closes[:i],
+            "c_volume": volumes[:i],
+            }
+
+
 def review_candles(timeframe: str,
                    symbol: str,
                    ):
@@ -5,14 +5,15 @@ backtests, indicators, and events. It abstracts the underlying MongoDB
 implementation (dhmongo.py) to allow future migration to different storage
 solutions without changing higher-level code.
 
-Core datetime-calculation utilities (expected_candle_datetimes,
-next_candle_start) are imported from dhcommon, which provides the base
+Core datetime-calculation utilities (this_candle_start,
+rangify_candle_times) are imported from dhcommon, which provides the base
 utility layer with no storage dependencies.
 """
 
 import json
 import re
 import time
+from bisect import bisect_left, bisect_right
 from collections import Counter, defaultdict, namedtuple
 from datetime import datetime as dt
 from datetime import timedelta
@@ -20,12 +21,14 @@ from copy import deepcopy
 import logging
 from pathlib import Path
 from .dhtypes import (
-    Candle, Event, IndicatorDataPoint, Symbol, IndicatorSMA, IndicatorEMA,
-    IndicatorRSI, Trade, TradeSeries, TradePlan, StoredImage)
+    Candle, CandleFrame, CHART_REGISTRY, LazyCandle, Event,
+    IndicatorDataPoint, Symbol,
+    IndicatorSMA, IndicatorEMA, IndicatorRSI, Trade, TradeSeries, TradePlan,
+    StoredImage, epochs_to_dt_strs, expected_candle_epochs)
 from .dhcommon import (
     dt_as_str, dt_as_dt, dt_from_epoch, dt_to_epoch, valid_timeframe,
     this_candle_start, summarize_candles, log_say, sort_dict,
-    rangify_candle_times, expected_candle_datetimes, new_uuid,
+    rangify_candle_times, new_uuid,
     ProgBar, OperationTimer,
     DEFAULT_OBJ_NAME, MARKET_ERAS)
 from . import dhmongo as dhm
@@ -59,6 +62,15 @@ COLL_PATTERNS: dict = {
 # Cache for Symbol instances to avoid repeated creation
 SYMBOL_CACHE = {}
 
+# Cache of every stored event per (ticker, categories, tags) query, sliced
+# by epoch range in memory.  Entries record the events version of their
+# ticker when fetched and are refetched once it moves on.
+EVENTS_CACHE = {}
+EVENTS_VERSIONS = defaultdict(int)
+# Epoch bounds used to fetch all of a ticker's events at once
+_EVENTS_EPOCH_MIN = -(2 ** 62)
+_EVENTS_EPOCH_MAX = 2 ** 62
+
 log = logging.getLogger("dhstore")
 log.addHandler(logging.NullHandler())
 
@@ -2499,6 +2511,7 @@ def get_indicator(ind_id: str,
                               autoload_chart=autoload_chart,
                               name=i["name"],
                               parameters=i["parameters"],
+                              state=i.get("state"),
                               )
     elif i["class_name"] == "IndicatorEMA":
         result = IndicatorEMA(description=i["description"],
@@ -2511,6 +2524,7 @@ def get_indicator(ind_id: str,
                               autoload_chart=autoload_chart,
                               name=i["name"],
                               parameters=i["parameters"],
+                              state=i.get("state"),
                               )
     elif i["class_name"] == "IndicatorRSI":
         result = IndicatorRSI(description=i["description"],
@@ -2523,6 +2537,7 @@ def get_indicator(ind_id: str,
                               autoload_chart=autoload_chart,
                               name=i["name"],
                               parameters=i["parameters"],
+                              state=i.get("state"),
                               )
     else:
         raise ValueError(f"Unable to match class_name of {i['class_name']} "
@@ -2793,6 +2808,7 @@ def get_indicators_by_name(name: str,
                       autoload_chart=autoload_chart,
                       name=doc["name"],
                       parameters=doc["parameters"],
+                      state=doc.get("state"),
                       )
         if doc["class_name"] == "IndicatorSMA":
             ind = IndicatorSMA(**common)
@@ -2853,10 +2869,16 @@ def get_symbol_by_ticker(ticker: str):
 
 
 def store_candle(candle):
-    """Write a single Candle() to central storage."""
+    """Write a single Candle() to central storage.
+
+    Charts of the same symbol and timeframe held in CHART_REGISTRY are
+    discarded so they are reloaded with this candle.
+    """
     log.debug(f"Storing {candle.c_symbol.ticker} "
               f"{candle.c_timeframe} candle at {candle.c_datetime}")
     valid_timeframe(candle.c_timeframe)
+    CHART_REGISTRY.discard(symbol=candle.c_symbol.ticker,
+                           timeframe=candle.c_timeframe)
     dhm.store_candle(c_datetime=candle.c_datetime,
                      c_timeframe=candle.c_timeframe,
                      c_open=candle.c_open,
@@ -2883,8 +2905,12 @@ def get_candles(start_epoch: int,
                 timeframe: str,
                 symbol: str = "ES",
                 show_progress: bool = False,
+                lazy: bool = False,
                 ):
     """Return candle docs within the given start and end epochs, inclusive.
+
+    With lazy=True LazyCandle objects are returned, deferring derived
+    field calculations until they are first read.
     """
     # Retrieve candle dictionaries from storage
     log_sym = symbol if isinstance(symbol, str) else symbol.ticker
@@ -2906,18 +2932,20 @@ def get_candles(start_epoch: int,
     total = len(result)
     pbar = start_progbar(show_progress, total,
                          f"{symbol} {timeframe} Candle objects built")
+    candle_class = LazyCandle if lazy else Candle
     for i, r in enumerate(result, start=1):
-        candles.append(Candle(c_datetime=r["c_datetime"],
-                              c_timeframe=r["c_timeframe"],
-                              c_open=r["c_open"],
-                              c_high=r["c_high"],
-                              c_low=r["c_low"],
-                              c_close=r["c_close"],
-                              c_volume=r["c_volume"],
-                              c_symbol=r["c_symbol"],
-                              c_epoch=r["c_epoch"],
-                              name=r.get("name", DEFAULT_OBJ_NAME)
-                              ))
+        candles.append(candle_class(
+            c_datetime=r["c_datetime"],
+            c_timeframe=r["c_timeframe"],
+            c_open=r["c_open"],
+            c_high=r["c_high"],
+            c_low=r["c_low"],
+            c_close=r["c_close"],
+            c_volume=r["c_volume"],
+            c_symbol=r["c_symbol"],
+            c_epoch=r["c_epoch"],
+            name=r.get("name", DEFAULT_OBJ_NAME)
+            ))
         update_progbar(pbar, i, total)
     finish_progbar(pbar)
     log.info("Finished building Candle objects, returning "
@@ -2926,6 +2954,38 @@ def get_candles(start_epoch: int,
     return candles
 
 
+def get_candle_frame(start_epoch: int,
+                     end_epoch: int,
+                     timeframe: str,
+                     symbol="ES",
+                     show_progress: bool = False,
+                     ):
+    """Return a CandleFrame of candles between epochs, inclusive.
+
+    Fetches only OHLCV fields straight into arrays, skipping Candle object
+    construction entirely.  Preferred over get_candles() for large ranges.
+    """
+    if isinstance(symbol, Symbol):
+        symbol = symbol.ticker
+    log.info(f"Retrieving candle arrays from storage for {symbol} "
+             f"{timeframe} between "
+             f"{dt_as_str(dt_from_epoch(start_epoch))} and "
+             f"{dt_as_str(dt_from_epoch(end_epoch))}")
+    arrays = dhm.get_candle_arrays(start_epoch=start_epoch,
+                                   end_epoch=end_epoch,
+                                   timeframe=timeframe,
+                                   symbol=symbol,
+                                   show_progress=show_progress,
+                                   )
+    frame = CandleFrame(c_timeframe=timeframe,
+                        c_symbol=get_symbol_by_ticker(ticker=symbol),
+                        **arrays,
+                        )
+    log.info(f"Finished retrieval, returning {len(frame)} candles")
+
+    return frame
+
+
 def review_candles(timeframe: str,
                    symbol="ES",
                    check_integrity: bool = False,
@@ -2998,13 +3058,13 @@ def review_candles(timeframe: str,
         log_say("Calculating expected candle datetimes for "
                 f"{symbol.ticker} {timeframe} between "
                 f"{dt_as_str(start_dt)} and {dt_as_str(end_dt)}")
-        dt_expected = expected_candle_datetimes(start_dt=start_dt,
-                                                end_dt=end_dt,
-                                                symbol=symbol,
-                                                timeframe=timeframe,
-                                                events=all_events,
-                                                show_progress=show_progress,
-                                                )
+        dt_expected = epochs_to_dt_strs(expected_candle_epochs(
+            start_dt=start_dt,
+            end_dt=end_dt,
+            symbol=symbol,
+            timeframe=timeframe,
+            events=all_events,
+        )).tolist()
 
         # Perform a per-era summary check on times vs expected
         log_say("Summarizing retrieved candles per market era")
@@ -3236,6 +3296,7 @@ def delete_candles(timeframe: str,
                    ):
     """Delete candles from central storage en masse or for a datetime range.
     """
+    CHART_REGISTRY.discard(symbol=symbol, timeframe=timeframe)
     if earliest_dt is None and latest_dt is None:
         return dhm.clear_collection(f"candles_{symbol}_{timeframe}")
     else:
@@ -3260,6 +3321,7 @@ def delete_candles_by_field(symbol: str,
         delete_candles_by_field(symbol="ES", timeframe="1m",
                                 field="name", value="DELETEME")
     """
+    CHART_REGISTRY.discard(symbol=symbol, timeframe=timeframe)
     return dhm.delete_candles_by_field(symbol=symbol,
                                        timeframe=timeframe,
                                        field=field,
@@ -3269,6 +3331,29 @@ def delete_candles_by_field(symbol: str,
 
 ##############################################################################
 # Events
+def refresh_events_cache(symbol=None):
+    """Drop cached events so the next get_events() reads storage again.
+
+    store_event(), delete_events_by_field(), and clear_events() call this
+    automatically.  Call it directly when events are changed outside of
+    those functions, such as by another process.  If symbol is None the
+    cache is refreshed for every ticker.  Charts held in CHART_REGISTRY
+    for those tickers are discarded too, as their candles were filtered
+    by Closed events when loaded.
+    """
+    if symbol is None:
+        tickers = set(EVENTS_VERSIONS) | {k[0] for k in EVENTS_CACHE}
+        CHART_REGISTRY.discard()
+    elif isinstance(symbol, str):
+        tickers = {symbol}
+    else:
+        tickers = {symbol.ticker}
+    for ticker in tickers:
+        EVENTS_VERSIONS[ticker] += 1
+        CHART_REGISTRY.discard(symbol=ticker)
+    log.debug(f"Refreshed events cache for {sorted(tickers)}")
+
+
 def store_event(event):
     """Write a single Event() to central storage."""
     if not isinstance(event, Event):
@@ -3285,21 +3370,91 @@ def store_event(event):
                              end_epoch=event.end_epoch,
                              name=event.name,
                              )
+    refresh_events_cache(symbol=event.symbol.ticker)
 
     return result
 
 
+def _build_events(records, symbol, show_progress: bool = False):
+    """Return Event objects built from stored event records."""
+    log.info("Building Event objects")
+    events = []
+    total = len(records)
+    pbar = start_progbar(show_progress, total,
+                         "Event objects built")
+    for i, r in enumerate(records, start=1):
+        events.append(Event(start_dt=r["start_dt"],
+                            end_dt=r["end_dt"],
+                            symbol=symbol,
+                            category=r["category"],
+                            tags=r["tags"],
+                            notes=r["notes"],
+                            name=r["name"],
+                            ))
+        update_progbar(pbar, i, total)
+    finish_progbar(pbar)
+
+    return events
+
+
+def _cached_events(symbol,
+                   categories: list = None,
+                   tags: list = None,
+                   show_progress: bool = False,
+                   ):
+    """Return the events cache entry for a query, fetching it if stale.
+
+    The entry holds every stored event matching categories and tags
+    along with their start epochs in ascending order, so callers can
+    bisect out any epoch range.
+    """
+    key = (symbol.ticker,
+           None if categories is None else tuple(sorted(set(categories))),
+           None if tags is None else tuple(sorted(set(tags))))
+    version = EVENTS_VERSIONS[symbol.ticker]
+    entry = EVENTS_CACHE.get(key)
+    if entry is not None and entry["version"] == version:
+        return entry
+
+    log.info(f"Retrieving all events for {symbol.ticker} with "
+             f"categories: {categories} and tags: {tags}")
+    result = dhm.get_events(start_epoch=_EVENTS_EPOCH_MIN,
+                            end_epoch=_EVENTS_EPOCH_MAX,
+                            symbol=symbol.ticker,
+                            categories=categories,
+                            tags=tags,
+                            )
+    log.info(f"Retrieved {len(result)} event records from storage")
+    events = _build_events(result, symbol, show_progress)
+    # Positions sorted by start epoch, keeping storage order for ties
+    order = sorted(range(len(result)), key=lambda i: result[i]["start_epoch"])
+    entry = {"version": version,
+             "events": events,
+             "order": order,
+             "start_epochs": [result[i]["start_epoch"] for i in order],
+             }
+    EVENTS_CACHE[key] = entry
+
+    return entry
+
+
 def get_events(symbol="ES",
                start_epoch: int = None,
                end_epoch: int = None,
                categories: list = None,
                tags: list = None,
                show_progress: bool = False,
+               use_cache: bool = True,
                ):
     """Return events starting within the given start and end epochs, inclusive.
 
     Note: events that end after end_epoch are included so long as they
     start before or on it.
+
+    All events matching categories and tags are read from storage once
+    and cached, with each call slicing its range out of memory.  Event
+    objects are shared between calls so should not be modified.  Set
+    use_cache=False to read only the requested range from storage.
     """
     if isinstance(symbol, str):
         symbol = get_symbol_by_ticker(ticker=symbol)
@@ -3308,6 +3463,20 @@ def get_events(symbol="ES",
     if end_epoch is None:
         end_epoch = dt_to_epoch(dt.now())
 
+    if use_cache:
+        entry = _cached_events(symbol=symbol,
+                               categories=categories,
+                               tags=tags,
+                               show_progress=show_progress,
+                               )
+        lo = bisect_left(entry["start_epochs"], start_epoch)
+        hi = bisect_right(entry["start_epochs"], end_epoch)
+        # Return in storage order, as an uncached read would
+        events = [entry["events"][i] for i in sorted(entry["order"][lo:hi])]
+        log.info(f"Returning {len(events)} cached events")
+
+        return events
+
     # Retrieve events from storage
     msg = (f"Retrieving events for {symbol.ticker} between "
            f"{dt_as_str(dt_from_epoch(start_epoch))} and "
@@ -3324,24 +3493,7 @@ def get_events(symbol="ES",
                             tags=tags,
                             )
     log.info(f"Retrieved {len(result)} event records from storage")
-
-    # Build Event objects
-    log.info("Building Event objects")
-    events = []
-    total = len(result)
-    pbar = start_progbar(show_progress, total,
-                         "Event objects built")
-    for i, r in enumerate(result, start=1):
-        events.append(Event(start_dt=r["start_dt"],
-                            end_dt=r["end_dt"],
-                            symbol=symbol,
-                            category=r["category"],
-                            tags=r["tags"],
-                            notes=r["notes"],
-                            name=r["name"],
-                            ))
-        update_progbar(pbar, i, total)
-    finish_progbar(pbar)
+    events = _build_events(result, symbol, show_progress)
     log.info(f"Returning {len(events)} events")
 
     return events
@@ -3353,7 +3505,9 @@ def clear_events(symbol: str,
                  ):
     """Deletes events from central storage."""
     if earliest_dt is None and latest_dt is None:
-        return dhm.clear_collection(f"events_{symbol}")
+        result = dhm.clear_collection(f"events_{symbol}")
+        refresh_events_cache(symbol=symbol)
+        return result
     else:
         return "Sorry, Dusty hasn't written code for select timeframes yet"
 
@@ -3369,7 +3523,10 @@ def delete_events_by_field(symbol: str,
     Example to delete all events with name=="DELETEME":
     delete_events_by_field(symbol="ES", field="name", value="DELETEME")
     """
-    return dhm.delete_events_by_field(symbol=symbol,
-                                      field=field,
-                                      value=value,
-                                      )
+    result = dhm.delete_events_by_field(symbol=symbol,
+                                        field=field,
+                                        value=value,
+                                        )
+    refresh_events_cache(symbol=symbol)
+
+    return result
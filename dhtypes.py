@@ -6,8 +6,12 @@ representing:
 - Symbol: Market symbols (e.g., ES) with market hours and schedules
 - Candle: OHLCV bars at various timeframes
   (1m, 5m, 15m, r1h, e1h, 1d, 1w)
+- LazyCandle: Slotted Candle variant with lazily computed derived fields
+- CandleFrame: Columnar NumPy-backed alternative to a list of Candles
 - Day: Daily calendar wrapper around Candles
+- DayBuilder: Builds Days for many dates from one 1m Chart in one pass
 - Chart: Collection of candles with technical analysis capabilities
+- ChartRegistry: Shares loaded Charts between Indicators and Backtests
 - Event: Market events (closures, announcements, etc.) that affect
   candle validity or reflect unusual market conditions
 - Indicator: Base class for technical indicators (SMA, EMA, etc.)
@@ -17,7 +21,8 @@ representing:
 - Backtest: Backtest results and performance metrics
 
 ARCHITECTURE NOTE: This module imports only utility functions from dhcommon
-(which has no external dependencies) and avoids importing from dhstore or
+(which has no external dependencies) and array calculation kernels from
+dhkernels (which depends only on numpy), and avoids importing from dhstore or
 dhutil. Storage operations are delegated to dhstore.py while this module
 focuses on data structure definitions.
 
@@ -26,24 +31,56 @@ different historical time periods.
 """
 import datetime as dt
 from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import heapq
+from itertools import compress
 from datetime import timedelta, date
 import sys
 import json
 from pathlib import Path
-from statistics import fmean
 from copy import copy, deepcopy
 import logging
-from math import ceil, floor
+from math import ceil, floor, isfinite
 import numpy as np
 from .dhcommon import (
     dt_as_dt, dt_as_str, dt_as_time, dt_to_epoch, dt_from_epoch,
     timeframe_delta,
     valid_timeframe, valid_trading_hours, log_say, this_candle_start,
     check_tf_th_compatibility, start_of_week_date, dict_of_weeks, bot,
+    next_candle_start,
     ProgBar, DEFAULT_OBJ_NAME, MARKET_ERAS,
     normalize_list_of_strings, new_uuid)
+from .dhkernels import (
+    ema, ema_sweep, round_values, rsi, rsi_averages, rsi_from_averages,
+    rsi_sweep_averages, sma, sma_sweep)
 CANDLE_TIMEFRAMES = ['1m', '5m', '15m', 'r1h', 'e1h', '1d', '1w']
 BEGINNING_OF_TIME = "2008-01-01 00:00:00"
+# Fixed session boundaries of a Day; rth close varies by market era
+DAY_ETH_START = dt.time(0, 0)
+DAY_RTH_START = dt.time(9, 30)
+DAY_ETH_END = dt.time(23, 59)
+# Most trading calendars each Symbol keeps before evicting the least
+# recently used one
+CALENDAR_CACHE_SIZE = 16
+# Most candles a ChartRegistry holds before evicting the least recently
+# used Charts
+CHART_REGISTRY_MAX_CANDLES = 20_000_000
+# Naive wall-clock datetime at epoch 0, used to turn local seconds back
+# into naive datetimes without any timezone conversion
+_EPOCH_ZERO = dt.datetime(1970, 1, 1)
+# Start date of each MARKET_ERAS entry, in order, for bisecting eras
+_ERA_START_DATES = [era["start_date"] for era in MARKET_ERAS]
+# Epoch of local midnight starting each era, for bisecting eras of epochs
+_ERA_START_EPOCHS = np.asarray(
+    [dt_to_epoch(dt.datetime.combine(d, dt.time())) for d in _ERA_START_DATES],
+    dtype=np.int64)
+# Largest distance, in ticks, a price may sit from its tick and still be
+# treated as on the tick grid
+_TICK_TOLERANCE = 1e-6
+# Tick arrays are int32, half the size of float64 prices
+_TICK_DTYPE = np.int32
 
 
 def _merge_epoch_ranges(ranges):
@@ -119,6 +156,146 @@ def _epoch_in_ranges(
     return target_epoch <= merged_ranges[idx][1]
 
 
+def _epochs_in_ranges(epochs, merged_ranges) -> np.ndarray:
+    """Return a boolean mask of which epochs fall in merged closed ranges.
+
+    Vectorized form of _epoch_in_ranges(): one np.searchsorted over the
+    range starts replaces a bisect per epoch.
+
+    Args:
+        epochs: Array-like of Unix timestamps (seconds) to check.
+        merged_ranges: List of (start_epoch, end_epoch) tuples, sorted and
+                      non-overlapping (output from _merge_epoch_ranges).
+
+    Returns:
+        Boolean numpy array, True where the epoch is inside a closed range.
+    """
+    epochs = np.asarray(epochs, dtype=np.int64)
+    if not merged_ranges:
+        return np.zeros(len(epochs), dtype=bool)
+    bounds = np.asarray(merged_ranges, dtype=np.int64)
+    # Index of the rightmost range starting at or before each epoch
+    idx = np.searchsorted(bounds[:, 0], epochs, side="right") - 1
+    inside = idx >= 0
+    inside[inside] = epochs[inside] <= bounds[idx[inside], 1]
+
+    return inside
+
+
+def _open_minute_bitmap(base_epoch: int,
+                        minute_count: int,
+                        merged_ranges,
+                        ) -> np.ndarray:
+    """Return a packed bitmap of which minutes from base_epoch are open.
+
+    Bit i covers the minute starting at base_epoch + (60 * i) and is set
+    when that epoch falls outside every merged closed range.
+
+    Args:
+        base_epoch: Minute aligned epoch of the first bit.
+        minute_count: Number of minutes covered.
+        merged_ranges: List of (start_epoch, end_epoch) tuples, sorted and
+                      non-overlapping (output from _merge_epoch_ranges).
+
+    Returns:
+        uint8 numpy array from np.packbits (big-endian bit order).
+    """
+    # Mark +1 where each closed range starts and -1 after it ends so a
+    # cumulative sum is nonzero only on closed minutes
+    closed = np.zeros(minute_count + 1, dtype=np.int32)
+    if merged_ranges:
+        bounds = np.asarray(merged_ranges, dtype=np.int64)
+        first = np.clip(-((base_epoch - bounds[:, 0]) // 60), 0,
+                        minute_count)
+        last = np.clip((bounds[:, 1] - base_epoch) // 60, -1,
+                       minute_count - 1)
+        keep = first <= last
+        np.add.at(closed, first[keep], 1)
+        np.add.at(closed, last[keep] + 1, -1)
+
+    return np.packbits(np.cumsum(closed[:-1]) == 0)
+
+
+def _calendar_open_mask(calendar: dict, epochs) -> np.ndarray:
+    """Return a boolean open mask for epochs using a trading calendar.
+
+    Minute aligned epochs inside the calendar's coverage are answered from
+    its open-minute bitmap.  Anything else (seconds past the minute or
+    outside coverage) falls back to the calendar's merged closed ranges.
+    """
+    epochs = np.asarray(epochs, dtype=np.int64)
+    idx = (epochs - calendar["minute_base_epoch"]) // 60
+    lookup = ((epochs % 60 == 0)
+              & (idx >= 0)
+              & (idx < calendar["minute_count"]))
+    result = np.empty(len(epochs), dtype=bool)
+    i = idx[lookup]
+    bits = calendar["open_minutes"][i >> 3] >> (7 - (i & 7))
+    result[lookup] = (bits & 1).astype(bool)
+    rest = ~lookup
+    if rest.any():
+        result[rest] = ~_epochs_in_ranges(epochs[rest],
+                                          calendar["closed_ranges"])
+
+    return result
+
+
+def _calendar_covers(calendar: dict, start_epoch: int, end_epoch: int):
+    """Return True if a trading calendar's bitmap spans both epochs."""
+    base = calendar["minute_base_epoch"]
+    return (base <= start_epoch
+            and end_epoch < base + (60 * calendar["minute_count"]))
+
+
+def _save_trading_calendar(path, calendar: dict, fingerprint: str):
+    """Write a trading calendar to an .npz file tagged with fingerprint."""
+    np.savez_compressed(
+        path,
+        fingerprint=np.array(fingerprint),
+        trading_hours=np.array(calendar["trading_hours"]),
+        start_epoch=np.array(calendar["start_epoch"]),
+        end_epoch=np.array(calendar["end_epoch"]),
+        closed_ranges=np.asarray(calendar["closed_ranges"],
+                                 dtype=np.int64).reshape(-1, 2),
+        source_event_count=np.array(calendar["source_event_count"]),
+        source_schedule_range_days=np.array(
+            calendar["source_schedule_range_days"]),
+        minute_base_epoch=np.array(calendar["minute_base_epoch"]),
+        minute_count=np.array(calendar["minute_count"]),
+        open_minutes=calendar["open_minutes"],
+        open_epochs=calendar["open_epochs"],
+        close_epochs=calendar["close_epochs"],
+    )
+
+
+def _load_trading_calendar(path, fingerprint: str):
+    """Read a trading calendar saved by _save_trading_calendar.
+
+    Returns None if the file was built for a different symbol, trading
+    hours, event set, or MARKET_ERAS definition.
+    """
+    with np.load(path, allow_pickle=False) as f:
+        if str(f["fingerprint"]) != fingerprint:
+            log.info(f"Ignoring stale trading calendar file {path}")
+            return None
+        closed_ranges = [tuple(r) for r in f["closed_ranges"].tolist()]
+        return {
+            "trading_hours": str(f["trading_hours"]),
+            "start_epoch": int(f["start_epoch"]),
+            "end_epoch": int(f["end_epoch"]),
+            "closed_ranges": closed_ranges,
+            "closed_range_starts": [r[0] for r in closed_ranges],
+            "source_event_count": int(f["source_event_count"]),
+            "source_schedule_range_days": int(
+                f["source_schedule_range_days"]),
+            "minute_base_epoch": int(f["minute_base_epoch"]),
+            "minute_count": int(f["minute_count"]),
+            "open_minutes": f["open_minutes"],
+            "open_epochs": f["open_epochs"],
+            "close_epochs": f["close_epochs"],
+        }
+
+
 def _iter_dates(start_date: dt.date,
                 end_date: dt.date,
                 ):
@@ -141,6 +318,346 @@ def _iter_dates(start_date: dt.date,
         this_date = this_date + timedelta(days=1)
 
 
+def _local_offsets(epochs):
+    """Return the local UTC offset in seconds for each epoch in an array.
+
+    Candle alignment follows local wall-clock time (e.g. e1d starts at
+    18:00 local), so vectorized alignment works on epoch + offset.  US
+    DST changes happen on the hour and at most once a day, so offsets are
+    looked up once per distinct day and only resolved hour by hour on
+    days where the offset changes.
+
+    Args:
+        epochs: 1-D integer array of epochs.
+
+    Returns:
+        Integer array of offsets, same shape as epochs.
+    """
+    def offset_at(e):
+        delta = (dt.datetime.fromtimestamp(e)
+                 - (_EPOCH_ZERO + timedelta(seconds=e)))
+        return int(delta.total_seconds())
+
+    hours, inverse = np.unique(epochs // 3600, return_inverse=True)
+    days, day_inverse = np.unique(hours // 24, return_inverse=True)
+    day_starts = [offset_at(d * 86400) for d in days.tolist()]
+    day_ends = [offset_at((d + 1) * 86400) for d in days.tolist()]
+    offsets = np.asarray(day_starts, dtype=np.int64)[day_inverse]
+    changing = np.flatnonzero(np.asarray(day_starts) != np.asarray(day_ends))
+    for i in np.flatnonzero(np.isin(day_inverse, changing)).tolist():
+        offsets[i] = offset_at(int(hours[i]) * 3600)
+
+    return offsets[inverse]
+
+
+def _local_to_epochs(local) -> np.ndarray:
+    """Return true epochs for an array of local wall-clock seconds.
+
+    Matches naive datetime.timestamp() semantics: a repeated DST hour
+    resolves to its first occurrence and a skipped DST hour is read with
+    the offset in effect before the change.
+    """
+    local = np.asarray(local, dtype=np.int64)
+    # DST changes are months apart so at most one falls within a day of
+    # any value, leaving only the offsets a day before and after in play
+    before = _local_offsets(local - 86400)
+    after = _local_offsets(local + 86400)
+    first = local - before
+    second = local - after
+    first_ok = _local_offsets(first) == before
+    second_ok = _local_offsets(second) == after
+    result = np.where(first_ok, first, second)
+    both = first_ok & second_ok
+    result[both] = np.minimum(first[both], second[both])
+    neither = ~(first_ok | second_ok)
+    result[neither] = first[neither]
+
+    return result
+
+
+def epochs_to_dt_strs(epochs) -> np.ndarray:
+    """Return canonical local datetime strings for an array of epochs.
+
+    Vectorized equivalent of dt_as_str(dt_from_epoch(e)) for each epoch.
+
+    Returns:
+        numpy array of "YYYY-mm-dd HH:MM:SS" strings.
+    """
+    epochs = np.asarray(epochs, dtype=np.int64)
+    local = epochs + _local_offsets(epochs)
+    strs = local.astype("datetime64[s]").astype("<U19")
+    # numpy renders a "T" between date and time, swap it for a space in
+    # place through the UCS4 code point view
+    strs.view(np.uint32).reshape(-1, 19)[:, 10] = ord(" ")
+
+    return strs
+
+
+# Code points required at each position of a canonical datetime string,
+# with 0 marking positions that must hold an ASCII digit
+_DT_STR_LAYOUT = np.array([0, 0, 0, 0, ord("-"), 0, 0, ord("-"), 0, 0,
+                           ord(" "), 0, 0, ord(":"), 0, 0, ord(":"), 0, 0],
+                          dtype=np.uint32)
+
+
+def dt_strs_to_epochs(strs) -> np.ndarray:
+    """Return local-time epochs for an array of datetime strings.
+
+    Vectorized equivalent of dt_to_epoch(s) for each string.  Canonical
+    "YYYY-mm-dd HH:MM:SS" strings are parsed in bulk; anything else goes
+    through dt_to_epoch() individually so errors and shorthand formats
+    behave exactly as they do there.
+
+    Returns:
+        int64 numpy array of epochs.
+    """
+    values = np.asarray(strs, dtype=str)
+    result = np.empty(len(values), dtype=np.int64)
+    canonical = np.char.str_len(values) == 19
+    if canonical.any():
+        candidates = values[canonical].astype("<U19")
+        codes = candidates.view(np.uint32).reshape(-1, 19)
+        digits = _DT_STR_LAYOUT == 0
+        layout_ok = (
+            ((codes[:, digits] >= ord("0"))
+             & (codes[:, digits] <= ord("9"))).all(axis=1)
+            & (codes[:, ~digits] == _DT_STR_LAYOUT[~digits]).all(axis=1))
+        idx = np.flatnonzero(canonical)
+        canonical[idx[~layout_ok]] = False
+        candidates = candidates[layout_ok]
+        candidates.view(np.uint32).reshape(-1, 19)[:, 10] = ord("T")
+        try:
+            parsed = candidates.astype("datetime64[s]").astype(np.int64)
+        except ValueError:
+            # Out of range values, leave them all to dt_to_epoch
+            canonical[:] = False
+        else:
+            result[idx[layout_ok]] = _local_to_epochs(parsed)
+    for i in np.flatnonzero(~canonical).tolist():
+        result[i] = dt_to_epoch(str(values[i]))
+
+    return result
+
+
+def _candle_start_epochs(epochs, timeframe: str):
+    """Return the parent candle start epoch for each epoch in an array.
+
+    Vectorized equivalent of dhcommon.this_candle_start() including the
+    r1h :30 anchor, the e1d 18:00 anchor, and the e1w Sunday 18:00 anchor.
+    Alignment happens in local wall-clock seconds which are then converted
+    back to true epochs.
+
+    Args:
+        epochs: 1-D integer array of epochs.
+        timeframe: Any timeframe supported by this_candle_start().
+
+    Returns:
+        Integer array of candle start epochs, same shape as epochs.
+    """
+    epochs = np.asarray(epochs, dtype=np.int64)
+    if len(epochs) == 0:
+        return epochs.copy()
+    offsets = _local_offsets(epochs)
+    local = epochs + offsets
+    # Drop seconds to get to the whole minute, as this_candle_start does
+    local = local - (local % 60)
+    day = 86400
+    eighteen = 18 * 3600
+    if timeframe == "1m":
+        starts = local
+    elif timeframe in ["5m", "15m", "e1h"]:
+        period = {"5m": 300, "15m": 900, "e1h": 3600}[timeframe]
+        starts = local - (local % period)
+    elif timeframe == "r1h":
+        # r1h candles start on the half hour
+        shifted = local - 1800
+        starts = shifted - (shifted % 3600) + 1800
+    elif timeframe == "e1d":
+        # Shift so 18:00 becomes midnight, floor to the day, shift back
+        shifted = local - eighteen
+        starts = shifted - (shifted % day) + eighteen
+    elif timeframe == "e1w":
+        # Day 0 of the epoch was a Thursday so (days + 4) % 7 counts days
+        # since the most recent Sunday
+        days = (local - eighteen) // day
+        starts = (days - ((days + 4) % 7)) * day + eighteen
+    else:
+        raise ValueError(f"timeframe: {timeframe} not supported")
+    # Convert back to true epochs assuming the start shares the source
+    # epoch's UTC offset, which keeps the right side of a repeated DST
+    # hour.  Where a DST change falls between the two, use the start's
+    # own offset instead.
+    result = starts - offsets
+    result_offsets = _local_offsets(result)
+    changed = result_offsets != offsets
+    result[changed] = starts[changed] - result_offsets[changed]
+
+    return result
+
+
+# Seconds per candle for timeframes that align within the hour
+_MINUTE_TIMEFRAME_SECONDS = {
+    "1m": 60, "5m": 300, "15m": 900, "r1h": 3600, "e1h": 3600,
+}
+
+
+def _as_epoch_array(dts) -> np.ndarray:
+    """Return an int64 epoch array from epochs or datetime-like values."""
+    if isinstance(dts, np.ndarray) and dts.dtype.kind in "iu":
+        return dts.astype(np.int64, copy=False)
+    values = list(dts)
+    if all(isinstance(v, (int, np.integer)) for v in values):
+        return np.asarray(values, dtype=np.int64)
+
+    return np.asarray([dt_to_epoch(v) for v in values], dtype=np.int64)
+
+
+def this_candle_start_epochs(dts, timeframe: str) -> np.ndarray:
+    """Return the parent candle start epoch for each of many datetimes.
+
+    Batch variant of this_candle_start().  dts may be an array of epochs
+    or any iterable of datetimes or datetime strings.
+
+    Returns:
+        int64 numpy array of candle start epochs, same order as dts.
+    """
+    return _candle_start_epochs(_as_epoch_array(dts), timeframe)
+
+
+def next_candle_start_epochs(dts,
+                             trading_hours: str,
+                             symbol,
+                             timeframe: str = "1m",
+                             events: list = None,
+                             ) -> np.ndarray:
+    """Return the next open candle start epoch for each of many datetimes.
+
+    Batch variant of next_candle_start().  For intraday timeframes the
+    next aligned start of every input is computed at once and checked
+    against the symbol's cached trading calendar; only inputs whose next
+    aligned start falls in a closed period go through next_candle_start()
+    individually.  dts may be an array of epochs or any iterable of
+    datetimes or datetime strings.
+
+    Returns:
+        int64 numpy array of candle start epochs, same order as dts.
+    """
+    valid_trading_hours(trading_hours)
+    check_tf_th_compatibility(tf=timeframe, th=trading_hours)
+    epochs = _as_epoch_array(dts)
+    result = np.empty(len(epochs), dtype=np.int64)
+    if len(epochs) == 0:
+        return result
+    if timeframe in _MINUTE_TIMEFRAME_SECONDS:
+        # The first aligned start after the input's whole minute is the
+        # start of the candle one period later
+        period = _MINUTE_TIMEFRAME_SECONDS[timeframe]
+        candidates = _candle_start_epochs(epochs - (epochs % 60) + period,
+                                          timeframe)
+        is_open = symbol.filter_open_epochs(epochs=candidates,
+                                            trading_hours=trading_hours,
+                                            events=events,
+                                            )
+        result[is_open] = candidates[is_open]
+        todo = np.flatnonzero(~is_open)
+    else:
+        todo = np.arange(len(epochs))
+    for i in todo.tolist():
+        result[i] = dt_to_epoch(next_candle_start(
+            dt=dt_from_epoch(int(epochs[i])),
+            trading_hours=trading_hours,
+            symbol=symbol,
+            timeframe=timeframe,
+            events=events,
+        ))
+
+    return result
+
+
+# Most bucket minutes checked at once by expected_candle_epochs(), which
+# bounds its memory use on multi-year ranges
+_EXPECTED_CHUNK_MINUTES = 1 << 20
+
+
+def expected_candle_epochs(start_dt,
+                           end_dt,
+                           timeframe: str,
+                           symbol,
+                           events: list = None,
+                           ) -> np.ndarray:
+    """Return expected candle start epochs for a symbol in a datetime range.
+
+    Array equivalent of expected_candle_datetimes().  Every minute of
+    every candle bucket in the range is laid out on one grid and checked
+    against the symbol's cached trading calendar at once; a bucket is
+    expected if any of its minutes is open.
+
+    Returns:
+        int64 numpy array of candle start epochs in ascending order.
+    """
+    if isinstance(symbol, str):
+        raise TypeError("symbol must be a Symbol object, not str")
+    if symbol.ticker == "ES":
+        trading_hours = "rth" if timeframe == "r1h" else "eth"
+    else:
+        raise ValueError("Only ES is currently supported as symbol for now")
+    adder = timeframe_delta(timeframe)
+    if events is None:
+        events = []
+    closed_events = [e for e in events if e.category == "Closed"]
+
+    # Same first bucket as expected_candle_datetimes()
+    this = this_candle_start(dt=start_dt, timeframe=timeframe)
+    if this != dt_as_dt(start_dt):
+        this = next_candle_start(dt=start_dt,
+                                 timeframe=timeframe,
+                                 trading_hours=trading_hours,
+                                 symbol=symbol,
+                                 events=closed_events,
+                                 )
+    ender = dt_as_dt(end_dt)
+    if this > ender:
+        return np.zeros(0, dtype=np.int64)
+    context = symbol.get_trading_calendar(trading_hours=trading_hours,
+                                          events=closed_events,
+                                          start_dt=this,
+                                          end_dt=ender,
+                                          )
+
+    # Buckets step in local wall-clock time like the datetime loop, so
+    # the grid is built in local seconds and converted to true epochs
+    bucket_minutes = adder // timedelta(minutes=1)
+    bucket_count = (ender - this) // adder + 1
+    first_local = (this - _EPOCH_ZERO) // timedelta(seconds=1)
+    # DST changes happen on the hour, so each local hour of the grid
+    # shares one shift back to true epochs
+    first_hour = first_local // 3600
+    hour_count = ((first_local + bucket_count * bucket_minutes * 60)
+                  // 3600) - first_hour + 1
+    hour_local = (first_hour + np.arange(hour_count, dtype=np.int64)) * 3600
+    hour_shift = _local_to_epochs(hour_local) - hour_local
+    step = max(1, _EXPECTED_CHUNK_MINUTES // bucket_minutes)
+    minute_offsets = np.arange(bucket_minutes, dtype=np.int64) * 60
+    results = []
+    for chunk_start in range(0, bucket_count, step):
+        chunk_count = min(step, bucket_count - chunk_start)
+        bucket_local = (first_local
+                        + (np.arange(chunk_start, chunk_start + chunk_count,
+                                     dtype=np.int64)
+                           * bucket_minutes * 60))
+        minute_local = (bucket_local[:, None] + minute_offsets).ravel()
+        minute_epochs = (minute_local
+                         + hour_shift[minute_local // 3600 - first_hour])
+        is_open = symbol.filter_open_epochs(epochs=minute_epochs,
+                                            trading_hours=trading_hours,
+                                            context=context,
+                                            )
+        has_open = is_open.reshape(chunk_count, bucket_minutes).any(axis=1)
+        results.append(minute_epochs[::bucket_minutes][has_open])
+
+    return np.concatenate(results)
+
+
 log = logging.getLogger("dhtypes")
 log.addHandler(logging.NullHandler())
 
@@ -186,6 +703,11 @@ def get_candles(*args, **kwargs):
     return _dhstore('get_candles', *args, **kwargs)
 
 
+def get_candle_frame(*args, **kwargs):
+    """Delegate to dhstore.get_candle_frame."""
+    return _dhstore('get_candle_frame', *args, **kwargs)
+
+
 def get_events(*args, **kwargs):
     """Delegate to dhstore.get_events."""
     return _dhstore('get_events', *args, **kwargs)
@@ -266,6 +788,8 @@ class Symbol():
     })
     _EQ_EXCLUDE: frozenset = frozenset({
         "_closed_hours_cache",  # runtime cache, not identity
+        "_calendar_cache",  # runtime cache, not identity
+        "_calendar_cache_stats",  # runtime cache counters
         # Timing data derived from ticker via set_times()
         "eth_open_time", "eth_close_time",
         "rth_open_time", "rth_close_time",
@@ -284,6 +808,8 @@ class Symbol():
         self.leverage_ratio = float(leverage_ratio)
         self.tick_size = float(tick_size)
         self._closed_hours_cache = {}
+        self._calendar_cache = OrderedDict()
+        self._calendar_cache_stats = {"hits": 0, "misses": 0}
         self.set_times()
 
     def __eq__(self, other):
@@ -308,7 +834,10 @@ class Symbol():
         Converts datetime and other non-serializable types to
         strings for portability.
         """
-        w = deepcopy(self.__dict__)
+        w = copy(self.__dict__)
+        w.pop("_calendar_cache", None)
+        w.pop("_calendar_cache_stats", None)
+        w = deepcopy(w)
         w["eth_open_time"] = str(w["eth_open_time"])
         w["eth_close_time"] = str(w["eth_close_time"])
         w["rth_open_time"] = str(w["rth_open_time"])
@@ -332,6 +861,8 @@ class Symbol():
         """Return string representation of this Symbol."""
         working = copy(self.__dict__)
         working.pop("_closed_hours_cache", None)
+        working.pop("_calendar_cache", None)
+        working.pop("_calendar_cache_stats", None)
         return str(working)
 
     def __repr__(self):
@@ -384,6 +915,78 @@ class Symbol():
         """Returns the next tick available at or below the provided value."""
         return round(floor(f / self.tick_size) * self.tick_size, 2)
 
+    def _ticks_per_point(self):
+        """Return whole ticks per 1.0 of price, or None if not whole."""
+        per_point = 1 / self.tick_size
+        n = round(per_point)
+        if n > 0 and abs(per_point - n) < _TICK_TOLERANCE:
+            return n
+        return None
+
+    def price_to_ticks(self, prices):
+        """Return prices as whole numbers of ticks.
+
+        Tick counts are exact integers, so sums and comparisons made in
+        ticks carry none of the drift float prices can pick up.  Scalars
+        return an int and array-likes an int32 numpy array.  Also works
+        on price differences such as entry to target distances.
+
+        Raises:
+            ValueError: If any price is not on this Symbol's tick grid.
+        """
+        if np.ndim(prices) == 0:
+            ticks = self.price_to_ticks_or_none(prices)
+            if ticks is None:
+                msg = (f"Price {prices} is not a multiple of {self.ticker} "
+                       f"tick_size {self.tick_size}")
+                log.critical(msg)
+                raise ValueError(msg)
+            return ticks
+        n = self._ticks_per_point()
+        prices = np.asarray(prices, dtype=np.float64)
+        ticks = prices * n if n else prices / self.tick_size
+        whole = np.rint(ticks)
+        limit = np.iinfo(_TICK_DTYPE).max
+        off = ~(np.abs(ticks - whole) <= _TICK_TOLERANCE)
+        off |= np.abs(whole) > limit
+        if off.any():
+            msg = (f"Price {prices[off][0]} is not a multiple of "
+                   f"{self.ticker} tick_size {self.tick_size} or is too "
+                   "large to hold in ticks")
+            log.critical(msg)
+            raise ValueError(msg)
+        return whole.astype(_TICK_DTYPE)
+
+    def price_to_ticks_or_none(self, price: float):
+        """Return a single price as a whole number of ticks, or None.
+
+        Same as price_to_ticks() for a scalar, but returns None rather
+        than raising when price is not on this Symbol's tick grid or is
+        not finite.
+        """
+        n = self._ticks_per_point()
+        ticks = price * n if n else price / self.tick_size
+        if not isfinite(ticks):
+            return None
+        whole = round(ticks)
+        if abs(ticks - whole) > _TICK_TOLERANCE:
+            return None
+
+        return int(whole)
+
+    def ticks_to_price(self, ticks):
+        """Return float prices for whole numbers of ticks.
+
+        Inverse of price_to_ticks().  Scalars return a float and
+        array-likes a float64 numpy array.  Dividing by ticks per point
+        where possible gives the float nearest the exact price.
+        """
+        n = self._ticks_per_point()
+        if np.ndim(ticks) == 0:
+            return ticks / n if n else float(ticks * self.tick_size)
+        ticks = np.asarray(ticks, dtype=np.float64)
+        return ticks / n if n else ticks * self.tick_size
+
     def get_era(self, target_dt):
         """Determine which market era the target_dt falls into.
 
@@ -397,22 +1000,50 @@ class Symbol():
             dict: The era definition dict containing name, start_date, times,
                   and closed_hours
         """
-        d = dt_as_dt(target_dt).date()
+        if isinstance(target_dt, dt.datetime):
+            d = target_dt.date()
+        elif isinstance(target_dt, dt.date):
+            d = target_dt
+        else:
+            d = dt_as_dt(target_dt).date()
         # Find the latest era whose start_date is <= target date
         # MARKET_ERAS must be sorted chronologically
-        matching_era = None
-        for era in MARKET_ERAS:
-            if d >= era["start_date"]:
-                matching_era = era
-            else:
-                break
-        if matching_era is None:
+        i = bisect_right(_ERA_START_DATES, d) - 1
+        if i < 0:
             raise ValueError(
                 f"No market era defined for date {d}. "
                 f"Earliest era starts at {MARKET_ERAS[0]['start_date']}"
             )
 
-        return matching_era
+        return MARKET_ERAS[i]
+
+    def get_era_ids(self, epochs) -> np.ndarray:
+        """Return the MARKET_ERAS position of the era for each epoch.
+
+        Vectorized get_era() for arrays: MARKET_ERAS[i] is the era of an
+        epoch with id i.  Eras start at local midnight of their
+        start_date, so one binary search over their precomputed epochs
+        resolves every input at once.
+
+        Args:
+            epochs: Array-like of Unix timestamps (seconds).
+
+        Returns:
+            int64 numpy array of indexes into MARKET_ERAS.
+
+        Raises:
+            ValueError: If any epoch falls before the earliest era.
+        """
+        epochs = np.asarray(epochs, dtype=np.int64)
+        ids = np.searchsorted(_ERA_START_EPOCHS, epochs, side="right") - 1
+        if len(ids) > 0 and ids.min() < 0:
+            first = dt_from_epoch(int(epochs[ids < 0][0]))
+            raise ValueError(
+                f"No market era defined for date {first.date()}. "
+                f"Earliest era starts at {MARKET_ERAS[0]['start_date']}"
+            )
+
+        return ids
 
     def get_times_for_era(self, era):
         """Get the market times (open/close) for a specific era.
@@ -502,11 +1133,14 @@ class Symbol():
         if check_closed_events:
             if events is None:
                 events = []
-            for e in events:
-                if e.contains_datetime(d):
-                    # Datetime falls inside a closure event
+            if isinstance(events, EventIndex):
+                if events.contains(d):
                     return False
-                pass
+            else:
+                for e in events:
+                    if e.contains_datetime(d):
+                        # Datetime falls inside a closure event
+                        return False
 
         # If we got this far it must be inside market hours, right?
         return True
@@ -625,6 +1259,220 @@ class Symbol():
             "source_schedule_range_days": schedule_days,
         }
 
+    def build_trading_calendar(self,
+                               trading_hours: str,
+                               events: list = None,
+                               start_dt=None,
+                               end_dt=None,
+                               ) -> dict:
+        """Compile a minute-resolution open calendar for a date range.
+
+        Extends build_market_hours_context() with a packed bitmap holding
+        one open/closed bit per minute for every whole day in the range,
+        with era schedules and closure events already applied.  The
+        result can be passed anywhere a context is accepted, and whole
+        minute lookups become a single array index.
+
+        Args:
+            trading_hours: "eth" or "rth".
+            events: Optional list of closure Event objects to overlay.
+            start_dt: Start of range, defaulted as in
+                     build_market_hours_context().
+            end_dt: End of range, defaulted as in
+                   build_market_hours_context().
+
+        Returns:
+            Context dict with additional keys:
+              - minute_base_epoch: Epoch of local midnight on the first
+                                  day, the minute of bit 0.
+              - minute_count: Number of minutes in the bitmap.
+              - open_minutes: np.packbits array of open minute flags.
+              - open_epochs, close_epochs: Sorted arrays of standard
+                                          session open and close epochs
+                                          on each day, excluding those
+                                          inside closure events.
+        """
+        calendar = self.build_market_hours_context(
+            trading_hours=trading_hours,
+            events=events,
+            start_dt=start_dt,
+            end_dt=end_dt,
+        )
+        first_day = dt_from_epoch(calendar["start_epoch"]).date()
+        last_day = dt_from_epoch(calendar["end_epoch"]).date()
+        base_epoch = dt_to_epoch(dt.datetime.combine(first_day, dt.time()))
+        end_epoch = dt_to_epoch(dt.datetime.combine(
+            last_day + timedelta(days=1), dt.time()))
+        minute_count = (end_epoch - base_epoch) // 60
+        calendar["minute_base_epoch"] = base_epoch
+        calendar["minute_count"] = minute_count
+        calendar["open_minutes"] = _open_minute_bitmap(
+            base_epoch=base_epoch,
+            minute_count=minute_count,
+            merged_ranges=calendar["closed_ranges"],
+        )
+        opens, closes = self._session_boundary_epochs(
+            trading_hours=trading_hours,
+            first_day=first_day,
+            last_day=last_day,
+            events=events,
+        )
+        calendar["open_epochs"] = opens
+        calendar["close_epochs"] = closes
+
+        return calendar
+
+    def _session_boundary_epochs(self,
+                                 trading_hours: str,
+                                 first_day: dt.date,
+                                 last_day: dt.date,
+                                 events: list = None,
+                                 ):
+        """Return sorted open and close epoch arrays for a span of days.
+
+        Follows the weekday rules of get_market_boundary() using the era
+        in effect on each day.  Boundaries inside any event are dropped,
+        matching how get_market_boundary() skips past them.
+        """
+        if events is None:
+            events = []
+        if trading_hours == "eth":
+            # ETH sessions open Sunday through Thursday evenings
+            open_days = {6, 0, 1, 2, 3}
+        else:
+            open_days = {0, 1, 2, 3, 4}
+        close_days = {0, 1, 2, 3, 4}
+        opens = []
+        closes = []
+        for this_date in _iter_dates(first_day, last_day):
+            times = self.get_era(this_date)["times"]
+            weekday = this_date.weekday()
+            if weekday in open_days:
+                opens.append(dt_to_epoch(dt.datetime.combine(
+                    this_date, times[f"{trading_hours}_open"])))
+            if weekday in close_days:
+                closes.append(dt_to_epoch(dt.datetime.combine(
+                    this_date, times[f"{trading_hours}_close"])))
+        event_ranges = _merge_epoch_ranges([
+            tuple(sorted((dt_to_epoch(e.start_dt), dt_to_epoch(e.end_dt))))
+            for e in events])
+        opens = np.asarray(opens, dtype=np.int64)
+        closes = np.asarray(closes, dtype=np.int64)
+
+        return (opens[~_epochs_in_ranges(opens, event_ranges)],
+                closes[~_epochs_in_ranges(closes, event_ranges)])
+
+    def get_trading_calendar(self,
+                             trading_hours: str,
+                             events: list = None,
+                             start_dt=None,
+                             end_dt=None,
+                             cache_file=None,
+                             ) -> dict:
+        """Return a cached trading calendar covering start_dt to end_dt.
+
+        Calendars are kept in a least recently used cache keyed by
+        trading_hours, set of closure events, and covered span.  Any
+        request inside a cached span is served from it, and up to
+        CALENDAR_CACHE_SIZE calendars are kept.  Requests inside
+        BEGINNING_OF_TIME through the end of next year compile that whole
+        span so one calendar serves every backtest; requests outside it
+        compile only the requested span.  See calendar_cache_info() for
+        hit and miss counts.
+
+        Args:
+            trading_hours: "eth" or "rth".
+            events: Optional list of closure Event objects to overlay.
+            start_dt: Optional start of the range that must be covered.
+            end_dt: Optional end of the range that must be covered.
+            cache_file: Optional path of an .npz file.  A matching
+                       calendar is loaded from it instead of compiled,
+                       and newly compiled calendars are saved to it.
+
+        Returns:
+            Calendar dict from build_trading_calendar().
+        """
+        if not valid_trading_hours(trading_hours):
+            raise ValueError("trading_hours must be either 'eth' or 'rth'")
+        if events is None:
+            events = []
+        if isinstance(events, EventIndex):
+            events_key = events.key
+        else:
+            events_key = tuple(sorted(
+                (dt_to_epoch(e.start_dt), dt_to_epoch(e.end_dt))
+                for e in events))
+        default_start = dt_as_dt(BEGINNING_OF_TIME)
+        default_end = dt.datetime(dt.datetime.now().year + 1, 12, 31,
+                                  23, 59, 59)
+        if start_dt is None and end_dt is None:
+            start_dt = default_start
+            end_dt = default_end
+        elif start_dt is None:
+            start_dt = end_dt
+        elif end_dt is None:
+            end_dt = start_dt
+        start_epoch = dt_to_epoch(start_dt)
+        end_epoch = dt_to_epoch(end_dt)
+        if start_epoch > end_epoch:
+            start_epoch, end_epoch = end_epoch, start_epoch
+
+        for cache_key, calendar in self._calendar_cache.items():
+            if (cache_key[:2] == (trading_hours, events_key)
+                    and _calendar_covers(calendar, start_epoch, end_epoch)):
+                self._calendar_cache.move_to_end(cache_key)
+                self._calendar_cache_stats["hits"] += 1
+                return calendar
+        self._calendar_cache_stats["misses"] += 1
+
+        if (dt_to_epoch(default_start) <= start_epoch
+                and end_epoch <= dt_to_epoch(default_end)):
+            span = (default_start, default_end)
+        else:
+            span = (dt_from_epoch(start_epoch), dt_from_epoch(end_epoch))
+        fingerprint = hashlib.sha1(
+            repr((self.ticker, trading_hours, events_key,
+                  MARKET_ERAS)).encode()).hexdigest()
+        calendar = None
+        if cache_file is not None and Path(cache_file).exists():
+            calendar = _load_trading_calendar(cache_file, fingerprint)
+            if (calendar is not None
+                    and not _calendar_covers(calendar, start_epoch,
+                                             end_epoch)):
+                calendar = None
+        if calendar is None:
+            log.info(f"Compiling {self.ticker} {trading_hours} trading "
+                     f"calendar from {span[0]} to {span[1]}")
+            calendar = self.build_trading_calendar(
+                trading_hours=trading_hours,
+                events=events,
+                start_dt=span[0],
+                end_dt=span[1],
+            )
+            if cache_file is not None:
+                _save_trading_calendar(cache_file, calendar, fingerprint)
+        cache_key = (trading_hours, events_key,
+                     calendar["minute_base_epoch"], calendar["minute_count"])
+        self._calendar_cache[cache_key] = calendar
+        while len(self._calendar_cache) > CALENDAR_CACHE_SIZE:
+            self._calendar_cache.popitem(last=False)
+
+        return calendar
+
+    def calendar_cache_info(self) -> dict:
+        """Return trading calendar cache hits, misses, and size."""
+        return {
+            "hits": self._calendar_cache_stats["hits"],
+            "misses": self._calendar_cache_stats["misses"],
+            "maxsize": CALENDAR_CACHE_SIZE,
+            "currsize": len(self._calendar_cache),
+        }
+
+    def clear_calendar_cache(self):
+        """Drop all cached trading calendars and reset the counters."""
+        self._calendar_cache.clear()
+        self._calendar_cache_stats = {"hits": 0, "misses": 0}
+
     def is_open_epoch(self,
                       target_epoch: int,
                       context: dict,
@@ -642,20 +1490,55 @@ class Symbol():
         Args:
             target_epoch: Unix timestamp (seconds since epoch, as int)
                          to check.
-            context: Dict returned from build_market_hours_context().
-                    Must contain "closed_ranges" and
-                    "closed_range_starts".
+            context: Dict returned from build_market_hours_context()
+                    or get_trading_calendar().  Must contain
+                    "closed_ranges" and "closed_range_starts".
 
         Returns:
             True if target_epoch is during open market hours (not in
             any closed range), False otherwise.
         """
+        if "open_minutes" in context:
+            # Trading calendars answer covered whole minutes from the bitmap
+            target_epoch = int(target_epoch)
+            i = (target_epoch - context["minute_base_epoch"]) // 60
+            if target_epoch % 60 == 0 and 0 <= i < context["minute_count"]:
+                return bool((context["open_minutes"][i >> 3]
+                             >> (7 - (i & 7))) & 1)
         return not _epoch_in_ranges(
             target_epoch=target_epoch,
             merged_ranges=context["closed_ranges"],
             range_starts=context.get("closed_range_starts"),
         )
 
+    def next_open_epoch(self,
+                        target_epoch: int,
+                        context: dict,
+                        ) -> int:
+        """Return target_epoch if open, else the first open epoch after it.
+
+        Merged closed ranges never touch, so the second after the end of
+        the range containing target_epoch is always open.  Epochs beyond
+        the context's range are treated as open, as in is_open_epoch().
+
+        Args:
+            target_epoch: Unix timestamp (seconds) to start from.
+            context: Dict returned from build_market_hours_context()
+                    or get_trading_calendar().
+
+        Returns:
+            Epoch of the first open second at or after target_epoch.
+        """
+        ranges = context["closed_ranges"]
+        range_starts = context.get("closed_range_starts")
+        if range_starts is None:
+            range_starts = [r[0] for r in ranges]
+        idx = bisect_right(range_starts, target_epoch) - 1
+        if idx >= 0 and target_epoch <= ranges[idx][1]:
+            return ranges[idx][1] + 1
+
+        return target_epoch
+
     def is_open_dt(self,
                    target_dt,
                    context: dict,
@@ -670,8 +1553,9 @@ class Symbol():
         Args:
             target_dt: Datetime as string, date, or datetime object.
                       Converted to epoch internally.
-            context: Dict returned from build_market_hours_context(),
-                    matching the trading_hours to check.
+            context: Dict returned from build_market_hours_context()
+                    or get_trading_calendar(), matching the
+                    trading_hours to check.
 
         Returns:
             True if target_dt is during open market hours, False
@@ -692,8 +1576,8 @@ class Symbol():
         """Return only datetimes that are open, using one shared context.
 
         Filters a list of datetimes to include only those during open
-        market hours. Builds one context for the input date range and
-        reuses it across all checks.
+        market hours, checking all of them against one cached trading
+        calendar covering the input date range.
 
         Args:
             target_dts: List of datetime strings, dates, or datetime
@@ -719,8 +1603,8 @@ class Symbol():
         if end_dt is None:
             end_dt = max(dt_as_dt(d) for d in target_dts)
 
-        # Build context once, reuse for all checks
-        context = self.build_market_hours_context(
+        # Use one cached trading calendar for all checks
+        context = self.get_trading_calendar(
             trading_hours=trading_hours,
             events=events,
             start_dt=start_dt,
@@ -728,12 +1612,63 @@ class Symbol():
         )
 
         # Filter using shared context
-        filtered = []
-        for target_dt in target_dts:
-            if self.is_open_dt(target_dt=target_dt, context=context):
-                filtered.append(target_dt)
+        mask = self.filter_open_epochs(
+            epochs=[dt_to_epoch(d) for d in target_dts],
+            trading_hours=trading_hours,
+            context=context,
+        )
 
-        return filtered
+        return list(compress(target_dts, mask.tolist()))
+
+    def filter_open_epochs(self,
+                           epochs,
+                           trading_hours: str,
+                           events: list = None,
+                           start_dt=None,
+                           end_dt=None,
+                           context: dict = None,
+                           ) -> np.ndarray:
+        """Return a boolean mask of which epochs are in open market hours.
+
+        Checks every epoch against one shared context with a single
+        vectorized search rather than calling is_open_epoch() per value.
+
+        Args:
+            epochs: Array-like of Unix timestamps (seconds).
+            trading_hours: "eth" or "rth".
+            events: Optional list of closure Event objects.
+            start_dt: Optional start of range for context. If None,
+                     auto-derived from min(epochs).
+            end_dt: Optional end of range for context. If None,
+                   auto-derived from max(epochs).
+            context: Optional prebuilt context from
+                    build_market_hours_context() or
+                    get_trading_calendar().  If None, the cached trading
+                    calendar covering start_dt to end_dt is used.
+
+        Returns:
+            Boolean numpy array the same length as epochs, True where
+            the epoch falls within open market hours.
+        """
+        epochs = np.asarray(epochs, dtype=np.int64)
+        if len(epochs) == 0:
+            return np.zeros(0, dtype=bool)
+        if context is None:
+            # Auto-derive bounds from input if not provided
+            if start_dt is None:
+                start_dt = dt_from_epoch(int(epochs.min()))
+            if end_dt is None:
+                end_dt = dt_from_epoch(int(epochs.max()))
+            context = self.get_trading_calendar(
+                trading_hours=trading_hours,
+                events=events,
+                start_dt=start_dt,
+                end_dt=end_dt,
+            )
+        if "open_minutes" in context:
+            return _calendar_open_mask(context, epochs)
+
+        return ~_epochs_in_ranges(epochs, context["closed_ranges"])
 
     def filter_open_candles(self,
                             candles: list,
@@ -749,9 +1684,9 @@ class Symbol():
         """Return only open-market candles using one shared context.
 
         Filters a list of Candle objects to include only those during
-        open market hours. Builds one context for the input date range
-        and reuses it across all checks. Uses Candle.c_epoch directly
-        for fast lookups (no per-candle datetime parsing).
+        open market hours, checking every Candle.c_epoch against one
+        cached trading calendar covering the input date range in a
+        single vectorized pass via filter_open_epochs().
 
         Args:
             candles: List of Candle objects (must have c_datetime and
@@ -763,15 +1698,25 @@ class Symbol():
                      candles).
             end_dt: Optional end of range for context. If None,
                    auto-derived from max(c.c_datetime for c in candles).
-            show_progress: If True, displays a progress bar during
-                          filtering.
+            show_progress: If True, displays a progress bar that
+                          completes once the vectorized filter is done.
             progress_desc: Label for progress bar (if
                           show_progress=True).
 
         Returns:
             Filtered list of Candle objects, containing only those that
-            fall within open market hours (same order as input).
+            fall within open market hours (same order as input).  If
+            candles is a CandleFrame, a filtered CandleFrame is returned
+            instead and no Candle objects are built.
         """
+        if isinstance(candles, CandleFrame):
+            return self._filter_open_frame(
+                frame=candles,
+                trading_hours=trading_hours,
+                events=events,
+                start_dt=start_dt,
+                end_dt=end_dt,
+            )
         if candles is None or len(candles) == 0:
             return []
 
@@ -781,8 +1726,8 @@ class Symbol():
         if end_dt is None:
             end_dt = max(c.c_datetime for c in candles)
 
-        # Build context once, reuse for all checks
-        context = self.build_market_hours_context(
+        # Use one cached trading calendar for all checks
+        context = self.get_trading_calendar(
             trading_hours=trading_hours,
             events=events,
             start_dt=start_dt,
@@ -795,23 +1740,42 @@ class Symbol():
         else:
             pbar = None
 
-        # Filter using shared context, leveraging c_epoch for fast lookup
-        filtered = []
-        for candle in candles:
-            # Use c_epoch directly (already computed, no string parsing needed)
-            if self.is_open_epoch(
-                target_epoch=candle.c_epoch,
-                context=context,
-            ):
-                filtered.append(candle)
-            if pbar is not None:
-                pbar.increment()
+        # One vectorized check of every c_epoch against the shared context
+        epochs = np.fromiter((c.c_epoch for c in candles),
+                             dtype=np.int64,
+                             count=len(candles),
+                             )
+        mask = self.filter_open_epochs(epochs=epochs,
+                                       trading_hours=trading_hours,
+                                       context=context,
+                                       )
+        filtered = list(compress(candles, mask.tolist()))
 
         if pbar is not None:
+            pbar.update(len(candles))
             pbar.finish()
 
         return filtered
 
+    def _filter_open_frame(self,
+                           frame,
+                           trading_hours: str,
+                           events: list = None,
+                           start_dt=None,
+                           end_dt=None,
+                           ):
+        """Return a CandleFrame of only the open-market rows of frame."""
+        if len(frame) == 0:
+            return frame
+        mask = self.filter_open_epochs(epochs=frame.c_epoch,
+                                       trading_hours=trading_hours,
+                                       events=events,
+                                       start_dt=start_dt,
+                                       end_dt=end_dt,
+                                       )
+
+        return frame[mask]
+
     def get_market_boundary(self,
                             target_dt,
                             trading_hours: str,
@@ -911,21 +1875,25 @@ class Symbol():
 
             # Adjust for any closure events this might fall into by recursing
             # based on the end of any including event
-            if adjust_for_events:
-                for e in events:
-                    if e.contains_datetime(r):
-                        if order == "next":
-                            new_target = e.end_dt
-                        if order == "previous":
-                            new_target = e.start_dt
-                        r = self.get_market_boundary(
-                                target_dt=new_target,
-                                trading_hours=trading_hours,
-                                boundary=boundary,
-                                order=order,
-                                adjust_for_events=adjust_for_events,
-                                events=events,
-                                )
+            if adjust_for_events and events:
+                # Index once so each recursion is a binary search
+                if not isinstance(events, EventIndex):
+                    events = EventIndex(events)
+                hits = events.containing(r)
+                if hits:
+                    e = hits[0]
+                    if order == "next":
+                        new_target = e.end_dt
+                    if order == "previous":
+                        new_target = e.start_dt
+                    r = self.get_market_boundary(
+                            target_dt=new_target,
+                            trading_hours=trading_hours,
+                            boundary=boundary,
+                            order=order,
+                            adjust_for_events=adjust_for_events,
+                            events=events,
+                            )
         else:
             raise ValueError(f"Ticker {self.ticker} times have not yet been "
                              "defined, unable to calculate the open or close "
@@ -934,20 +1902,109 @@ class Symbol():
 
         return r
 
+    def get_session_boundaries(self,
+                               trading_hours: str,
+                               boundary: str,
+                               events: list = None,
+                               start_dt=None,
+                               end_dt=None,
+                               ) -> np.ndarray:
+        """Return sorted session open or close epochs from the calendar.
+
+        Arrays come from the cached trading calendar covering start_dt to
+        end_dt (see get_trading_calendar()), with boundaries inside any
+        of the events removed.
+
+        Args:
+            trading_hours: "eth" or "rth".
+            boundary: "open" or "close".
+            events: Optional list of closure Event objects.
+            start_dt: Optional start of range that must be covered.
+            end_dt: Optional end of range that must be covered.
+
+        Returns:
+            Sorted int64 numpy array of epochs.
+        """
+        allowed_boundary = ["open", "close"]
+        if boundary not in allowed_boundary:
+            raise ValueError(f"boundary must be in {allowed_boundary}, got "
+                             f"{boundary}")
+        calendar = self.get_trading_calendar(trading_hours=trading_hours,
+                                             events=events,
+                                             start_dt=start_dt,
+                                             end_dt=end_dt,
+                                             )
+
+        return calendar[f"{boundary}_epochs"]
+
+    def lookup_market_boundary(self,
+                               target_dt,
+                               trading_hours: str,
+                               boundary: str,
+                               order: str,
+                               adjust_for_events: bool = True,
+                               events: list = None,
+                               ):
+        """Return previous or next market open/close via binary search.
+
+        Same arguments and results as get_market_boundary(), but answered
+        by bisecting the precomputed session boundary arrays of the
+        cached trading calendar, so repeated lookups (e.g. checking every
+        Trade in a TradeSeries) cost microseconds.  Falls back to
+        get_market_boundary() if the answer lies outside the calendar, or
+        in a different era than target_dt.  The calendar times each
+        boundary by the era of its own date while get_market_boundary()
+        uses the era of target_dt, so across an era change they differ.
+        """
+        allowed_order = ["previous", "next"]
+        if order not in allowed_order:
+            raise ValueError(f"order must be in {allowed_order}, got "
+                             f"{order}")
+        if not adjust_for_events:
+            events = None
+        target = dt_as_dt(target_dt)
+        era = self.get_era(target)
+        # The calendar can not reach back before the first era
+        first_day = dt.datetime.combine(_ERA_START_DATES[0], dt.time())
+        epochs = self.get_session_boundaries(
+            trading_hours=trading_hours,
+            boundary=boundary,
+            events=events,
+            start_dt=max(target - timedelta(days=7), first_day),
+            end_dt=target + timedelta(days=7),
+        )
+        target_epoch = target.timestamp()
+        if order == "next":
+            i = int(np.searchsorted(epochs, target_epoch, side="right"))
+        else:
+            i = int(np.searchsorted(epochs, target_epoch, side="left")) - 1
+        if 0 <= i < len(epochs):
+            result = dt_from_epoch(int(epochs[i]))
+            if self.get_era(result) is era:
+                return result
+
+        return self.get_market_boundary(target_dt=target_dt,
+                                        trading_hours=trading_hours,
+                                        boundary=boundary,
+                                        order=order,
+                                        adjust_for_events=adjust_for_events,
+                                        events=events,
+                                        )
+
     def get_next_open(self,
                       target_dt,
                       trading_hours,
                       adjust_for_events: bool = True,
                       events: list = None,
                       ):
-        """Simple wrapper for get_market_boundary()"""
-        return self.get_market_boundary(target_dt=target_dt,
-                                        trading_hours=trading_hours,
-                                        boundary="open",
-                                        order="next",
-                                        adjust_for_events=adjust_for_events,
-                                        events=events,
-                                        )
+        """Bisect wrapper for lookup_market_boundary()"""
+        return self.lookup_market_boundary(target_dt=target_dt,
+                                           trading_hours=trading_hours,
+                                           boundary="open",
+                                           order="next",
+                                           adjust_for_events=adjust_for_events,
+                                           events=events,
+                                           )
 
     def get_previous_open(self,
                           target_dt,
@@ -955,14 +2012,14 @@ class Symbol():
                           adjust_for_events: bool = True,
                           events: list = None,
                           ):
-        """Simple wrapper for get_market_boundary()"""
-        return self.get_market_boundary(target_dt=target_dt,
-                                        trading_hours=trading_hours,
-                                        boundary="open",
-                                        order="previous",
-                                        adjust_for_events=adjust_for_events,
-                                        events=events,
-                                        )
+        """Bisect wrapper for lookup_market_boundary()"""
+        return self.lookup_market_boundary(target_dt=target_dt,
+                                           trading_hours=trading_hours,
+                                           boundary="open",
+                                           order="previous",
+                                           adjust_for_events=adjust_for_events,
+                                           events=events,
+                                           )
 
     def get_next_close(self,
                        target_dt,
@@ -970,14 +2027,14 @@ class Symbol():
                        adjust_for_events: bool = True,
                        events: list = None,
                        ):
-        """Simple wrapper for get_market_boundary()"""
-        return self.get_market_boundary(target_dt=target_dt,
-                                        trading_hours=trading_hours,
-                                        boundary="close",
-                                        order="next",
-                                        adjust_for_events=adjust_for_events,
-                                        events=events,
-                                        )
+        """Bisect wrapper for lookup_market_boundary()"""
+        return self.lookup_market_boundary(target_dt=target_dt,
+                                           trading_hours=trading_hours,
+                                           boundary="close",
+                                           order="next",
+                                           adjust_for_events=adjust_for_events,
+                                           events=events,
+                                           )
 
     def get_previous_close(self,
                            target_dt,
@@ -985,14 +2042,14 @@ class Symbol():
                            adjust_for_events: bool = True,
                            events: list = None,
                            ):
-        """Simple wrapper for get_market_boundary()"""
-        return self.get_market_boundary(target_dt=target_dt,
-                                        trading_hours=trading_hours,
-                                        boundary="close",
-                                        order="previous",
-                                        adjust_for_events=adjust_for_events,
-                                        events=events,
-                                        )
+        """Bisect wrapper for lookup_market_boundary()"""
+        return self.lookup_market_boundary(target_dt=target_dt,
+                                           trading_hours=trading_hours,
+                                           boundary="close",
+                                           order="previous",
+                                           adjust_for_events=adjust_for_events,
+                                           events=events,
+                                           )
 
 
 class Candle():
@@ -1134,7 +2191,7 @@ class Candle():
         # Guard: if other is not the same type (e.g. it is None or a list),
         # return NotImplemented so Python can try the comparison the other
         # way around.  If both sides give up, Python returns False safely.
-        if not isinstance(other, Candle):
+        if not isinstance(other, (Candle, LazyCandle)):
             return NotImplemented
         return all(
             getattr(self, f) == getattr(other, f)
@@ -1156,10 +2213,613 @@ class Candle():
         return self.c_low <= p <= self.c_high
 
 
+class LazyCandle():
+    """Memory-lean Candle variant using __slots__ and lazy derived fields.
+
+    Accepts the same arguments as Candle and exposes the same attributes,
+    but stores them in __slots__ rather than a per-instance __dict__.
+    Derived fields (c_epoch, c_date, c_time, c_end_datetime, sizes, wick
+    percentages, and c_direction) are only computed on first access and
+    then cached in their slot, so bulk loads skip the per-bar strftime
+    and arithmetic for fields that are never read.
+
+    Compares equal to a Candle with the same _EQ_FIELDS values and
+    produces identical to_json() output.
+    """
+
+    # Slot order matches Candle.__dict__ so serialized output is identical
+    __slots__ = (
+        "c_datetime", "c_timeframe", "c_open", "c_high", "c_low",
+        "c_close", "c_volume", "c_symbol", "c_tags", "c_epoch",
+        "c_date", "c_time", "name", "c_end_datetime", "c_size",
+        "c_body_size", "c_upper_wick_size", "c_lower_wick_size",
+        "c_body_perc", "c_upper_wick_perc", "c_lower_wick_perc",
+        "c_direction",
+    )
+    _EQ_FIELDS: frozenset = Candle._EQ_FIELDS
+    _EQ_EXCLUDE: frozenset = Candle._EQ_EXCLUDE
+    # Slots filled by _derive_ohlc() the first time any of them is read
+    _OHLC_DERIVED: frozenset = frozenset({
+        "c_size", "c_body_size", "c_upper_wick_size", "c_lower_wick_size",
+        "c_body_perc", "c_upper_wick_perc", "c_lower_wick_perc",
+        "c_direction",
+    })
+
+    def __init__(self,
+                 c_datetime,
+                 c_timeframe: str,
+                 c_open: float,
+                 c_high: float,
+                 c_low: float,
+                 c_close: float,
+                 c_volume: int,
+                 c_symbol,
+                 c_tags: list = None,
+                 c_epoch: int = None,
+                 c_date: str = None,
+                 c_time: str = None,
+                 name: str = DEFAULT_OBJ_NAME,
+                 ):
+        # Passable attributes
+        self.c_datetime = dt_as_str(c_datetime)
+        self.c_timeframe = c_timeframe
+        valid_timeframe(self.c_timeframe)
+        self.c_open = float(c_open)
+        self.c_high = float(c_high)
+        self.c_low = float(c_low)
+        self.c_close = float(c_close)
+        self.c_volume = int(c_volume)
+        if isinstance(c_symbol, Symbol):
+            self.c_symbol = c_symbol
+        else:
+            self.c_symbol = get_symbol_by_ticker(ticker=c_symbol)
+        self.c_tags = normalize_list_of_strings(c_tags, "Candle.c_tags")
+        self.name = name
+        # Optional passable attributes are left unset until first read
+        # unless provided
+        if c_epoch is not None:
+            self.c_epoch = c_epoch
+        if c_date is not None:
+            self.c_date = c_date
+        if c_time is not None:
+            self.c_time = c_time
+
+    def __getattr__(self, attr):
+        """Compute and cache a derived field the first time it is read.
+
+        Only called when normal lookup fails, i.e. the slot is still unset.
+        """
+        if attr == "c_epoch":
+            value = dt_to_epoch(self.c_datetime)
+        elif attr == "c_date":
+            value = self.c_datetime[:10]
+        elif attr == "c_time":
+            value = self.c_datetime[11:19]
+        elif attr == "c_end_datetime":
+            delta = timeframe_delta(self.c_timeframe)
+            value = dt_as_str(dt_as_dt(self.c_datetime) + delta)
+        elif attr in self._OHLC_DERIVED:
+            self._derive_ohlc()
+            return object.__getattribute__(self, attr)
+        else:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{attr}'")
+        setattr(self, attr, value)
+
+        return value
+
+    def _derive_ohlc(self):
+        """Calculate and cache all fields derived from OHLC values."""
+        self.c_size = abs(self.c_high - self.c_low)
+        self.c_body_size = abs(self.c_open - self.c_close)
+        self.c_upper_wick_size = self.c_high - max(self.c_open, self.c_close)
+        self.c_lower_wick_size = min(self.c_open, self.c_close) - self.c_low
+        if self.c_size == 0:
+            self.c_body_perc = None
+            self.c_upper_wick_perc = None
+            self.c_lower_wick_perc = None
+        else:
+            self.c_body_perc = self.c_body_size/self.c_size
+            self.c_upper_wick_perc = self.c_upper_wick_size/self.c_size
+            self.c_lower_wick_perc = self.c_lower_wick_size/self.c_size
+
+        if self.c_close > self.c_open:
+            self.c_direction = 'bullish'
+        elif self.c_close < self.c_open:
+            self.c_direction = 'bearish'
+        else:
+            self.c_direction = 'unchanged'
+
+    def _as_dict(self):
+        """Return all fields as a dict in Candle.__dict__ order."""
+        return {f: getattr(self, f) for f in self.__slots__}
+
+    def to_candle(self):
+        """Return an equivalent regular Candle."""
+        return Candle(c_datetime=self.c_datetime,
+                      c_timeframe=self.c_timeframe,
+                      c_open=self.c_open,
+                      c_high=self.c_high,
+                      c_low=self.c_low,
+                      c_close=self.c_close,
+                      c_volume=self.c_volume,
+                      c_symbol=self.c_symbol,
+                      c_tags=self.c_tags,
+                      c_epoch=self.c_epoch,
+                      c_date=self.c_date,
+                      c_time=self.c_time,
+                      name=self.name,
+                      )
+
+    def to_json(self):
+        """Return a JSON representation with custom types normalized.
+
+        Converts datetime and other non-serializable types to
+        strings for portability.
+        """
+        working = deepcopy(self._as_dict())
+        working["c_symbol"] = working["c_symbol"].ticker
+
+        return json.dumps(working)
+
+    def to_clean_dict(self):
+        """Converts to JSON string then back to a python dict.
+
+        This helps to normalize types (I'm looking at YOU datetime) while
+        ensuring a portable python data structure
+        """
+        return json.loads(self.to_json())
+
+    def __str__(self):
+        """Return string representation of this LazyCandle."""
+        return str(self._as_dict())
+
+    def __repr__(self):
+        """Return string representation of this LazyCandle."""
+        return str(self._as_dict())
+
+    def pretty(self):
+        """Return a formatted, indented string representation of this object.
+        """
+        return json.dumps(self.to_clean_dict(),
+                          indent=4,
+                          )
+
+    def brief(self):
+        """Return a single line summary string of this LazyCandle's vitals."""
+        return Candle.brief(self)
+
+    def __eq__(self, other):
+        """Return True if this candle equals the other candle.
+
+        Regular Candles are compared field by field as well.
+        """
+        # Guard: if other is not the same type (e.g. it is None or a list),
+        # return NotImplemented so Python can try the comparison the other
+        # way around.  If both sides give up, Python returns False safely.
+        if not isinstance(other, (Candle, LazyCandle)):
+            return NotImplemented
+        return all(
+            getattr(self, f) == getattr(other, f)
+            for f in self._EQ_FIELDS
+        )
+
+    def __ne__(self, other):
+        """Return True if this candle does not equal the other candle."""
+        return not self.__eq__(other)
+
+    def contains_datetime(self, d):
+        """Return True if the datetime provided occurs in this candle."""
+        return Candle.contains_datetime(self, d)
+
+    def contains_price(self, p):
+        """Return True if price falls within this candle's high/low range.
+        """
+        return self.c_low <= p <= self.c_high
+
+
+class CandleFrame():
+    """Columnar, NumPy-backed collection of Candles of one timeframe.
+
+    Holds epoch, OHLC, and volume as contiguous arrays rather than a list
+    of Candle objects, so multi-year 1m charts fit in a fraction of the
+    memory.  Candle objects are only built on demand when indexing or
+    iterating, and derived size and direction fields are available as
+    whole-array properties.  Candle c_tags and name are not retained;
+    candles built from a frame carry the Candle defaults.
+
+    A CandleFrame can be used anywhere Chart.c_candles is expected.
+    """
+
+    _EQ_FIELDS: frozenset = frozenset({
+        "c_timeframe", "c_symbol", "c_epoch", "c_open",
+        "c_high", "c_low", "c_close", "c_volume",
+    })
+    _EQ_EXCLUDE: frozenset = frozenset({})
+    _ARRAY_FIELDS: tuple = (
+        "c_epoch", "c_open", "c_high", "c_low", "c_close", "c_volume",
+    )
+    _PRICE_FIELDS: tuple = ("c_open", "c_high", "c_low", "c_close")
+
+    def __init__(self,
+                 c_timeframe: str,
+                 c_symbol,
+                 c_epoch=None,
+                 c_open=None,
+                 c_high=None,
+                 c_low=None,
+                 c_close=None,
+                 c_volume=None,
+                 ):
+        valid_timeframe(c_timeframe)
+        self.c_timeframe = c_timeframe
+        if isinstance(c_symbol, Symbol):
+            self.c_symbol = c_symbol
+        else:
+            self.c_symbol = get_symbol_by_ticker(ticker=c_symbol)
+        self.c_epoch = self._as_array(c_epoch, np.int64)
+        self.c_open = self._as_array(c_open, np.float64)
+        self.c_high = self._as_array(c_high, np.float64)
+        self.c_low = self._as_array(c_low, np.float64)
+        self.c_close = self._as_array(c_close, np.float64)
+        self.c_volume = self._as_array(c_volume, np.int64)
+        lengths = {len(getattr(self, f)) for f in self._ARRAY_FIELDS}
+        if len(lengths) > 1:
+            msg = ("CandleFrame arrays must all be the same length, got "
+                   f"lengths {sorted(lengths)}")
+            log.critical(msg)
+            raise ValueError(msg)
+
+    @staticmethod
+    def _as_array(values, dtype):
+        """Return values as a contiguous 1-D array of dtype."""
+        if values is None:
+            return np.empty(0, dtype=dtype)
+        return np.ascontiguousarray(values, dtype=dtype).reshape(-1)
+
+    @classmethod
+    def from_candles(cls,
+                     candles: list,
+                     c_timeframe: str = None,
+                     c_symbol=None,
+                     ):
+        """Build a CandleFrame from a list of Candle objects.
+
+        c_timeframe and c_symbol default to those of the first candle and
+        must be provided if candles is empty.
+        """
+        if len(candles) > 0:
+            if c_timeframe is None:
+                c_timeframe = candles[0].c_timeframe
+            if c_symbol is None:
+                c_symbol = candles[0].c_symbol
+        for c in candles:
+            if c.c_timeframe != c_timeframe:
+                msg = (f"Candle c_timeframe {c.c_timeframe} does not match "
+                       f"CandleFrame c_timeframe {c_timeframe}")
+                log.critical(msg)
+                raise ValueError(msg)
+
+        return cls(c_timeframe=c_timeframe,
+                   c_symbol=c_symbol,
+                   c_epoch=[c.c_epoch for c in candles],
+                   c_open=[c.c_open for c in candles],
+                   c_high=[c.c_high for c in candles],
+                   c_low=[c.c_low for c in candles],
+                   c_close=[c.c_close for c in candles],
+                   c_volume=[c.c_volume for c in candles],
+                   )
+
+    @classmethod
+    def from_ticks(cls,
+                   c_timeframe: str,
+                   c_symbol,
+                   c_epoch=None,
+                   c_open=None,
+                   c_high=None,
+                   c_low=None,
+                   c_close=None,
+                   c_volume=None,
+                   ):
+        """Build a CandleFrame from prices given as whole ticks.
+
+        Inverse of to_ticks(); prices are converted with
+        Symbol.ticks_to_price().
+        """
+        if not isinstance(c_symbol, Symbol):
+            c_symbol = get_symbol_by_ticker(ticker=c_symbol)
+        prices = {"c_open": c_open, "c_high": c_high,
+                  "c_low": c_low, "c_close": c_close}
+
+        return cls(c_timeframe=c_timeframe,
+                   c_symbol=c_symbol,
+                   c_epoch=c_epoch,
+                   c_volume=c_volume,
+                   **{f: None if v is None else c_symbol.ticks_to_price(v)
+                      for f, v in prices.items()},
+                   )
+
+    @classmethod
+    def concat(cls,
+               frames: list,
+               c_timeframe: str = None,
+               c_symbol=None,
+               ):
+        """Join CandleFrames end to end into one new CandleFrame.
+
+        c_timeframe and c_symbol default to those of the first frame and
+        must be provided if frames is empty.
+        """
+        if len(frames) > 0:
+            if c_timeframe is None:
+                c_timeframe = frames[0].c_timeframe
+            if c_symbol is None:
+                c_symbol = frames[0].c_symbol
+        for f in frames:
+            if f.c_timeframe != c_timeframe:
+                msg = (f"CandleFrame c_timeframe {f.c_timeframe} does not "
+                       f"match c_timeframe {c_timeframe}")
+                log.critical(msg)
+                raise ValueError(msg)
+
+        return cls(c_timeframe=c_timeframe,
+                   c_symbol=c_symbol,
+                   **{field: np.concatenate(
+                       [getattr(f, field) for f in frames]
+                       or [np.empty(0)])
+                      for field in cls._ARRAY_FIELDS},
+                   )
+
+    def to_ticks(self):
+        """Return the OHLC arrays as int32 whole ticks, keyed by field.
+
+        Half the memory of the float64 arrays, and exact for comparing or
+        differencing prices.  Raises ValueError if any price is off the
+        tick grid.
+        """
+        return {f: self.c_symbol.price_to_ticks(getattr(self, f))
+                for f in self._PRICE_FIELDS}
+
+    def _subset(self, selector):
+        """Return a new CandleFrame of rows chosen by index/slice/mask."""
+        return CandleFrame(
+            c_timeframe=self.c_timeframe,
+            c_symbol=self.c_symbol,
+            **{f: getattr(self, f)[selector] for f in self._ARRAY_FIELDS},
+        )
+
+    def __len__(self):
+        """Return the number of candles in this frame."""
+        return len(self.c_epoch)
+
+    def __getitem__(self, key):
+        """Return a Candle for an int, or a CandleFrame for a slice/mask."""
+        if isinstance(key, (int, np.integer)):
+            return self.candle(key)
+
+        return self._subset(key)
+
+    def __iter__(self):
+        """Yield a Candle for each row, in current order."""
+        for i in range(len(self)):
+            yield self.candle(i)
+
+    def candle(self, i: int):
+        """Build and return the Candle at row i."""
+        epoch = int(self.c_epoch[i])
+        return Candle(c_datetime=dt_from_epoch(epoch),
+                      c_timeframe=self.c_timeframe,
+                      c_open=self.c_open[i],
+                      c_high=self.c_high[i],
+                      c_low=self.c_low[i],
+                      c_close=self.c_close[i],
+                      c_volume=self.c_volume[i],
+                      c_symbol=self.c_symbol,
+                      c_epoch=epoch,
+                      )
+
+    def to_candles(self):
+        """Return a list of Candle objects for every row in this frame."""
+        return list(self)
+
+    def append(self, new_candle):
+        """Append a single Candle to the end of this frame."""
+        if new_candle.c_timeframe != self.c_timeframe:
+            msg = (f"new_candle c_timeframe of {new_candle.c_timeframe} "
+                   f"does not match CandleFrame c_timeframe of "
+                   f"{self.c_timeframe}")
+            log.critical(msg)
+            raise ValueError(msg)
+        for f in self._ARRAY_FIELDS:
+            setattr(self, f, np.append(getattr(self, f),
+                                       getattr(new_candle, f)))
+
+    def is_sorted(self):
+        """Return True if rows are in ascending epoch order."""
+        return bool(np.all(self.c_epoch[1:] >= self.c_epoch[:-1]))
+
+    def sort(self):
+        """Sort rows in place in ascending epoch order."""
+        if self.is_sorted():
+            return
+        order = np.argsort(self.c_epoch, kind="stable")
+        for f in self._ARRAY_FIELDS:
+            setattr(self, f, getattr(self, f)[order])
+
+    def between(self, start_epoch: int, end_epoch: int):
+        """Return a CandleFrame of rows with start <= epoch <= end."""
+        mask = (self.c_epoch >= start_epoch) & (self.c_epoch <= end_epoch)
+        return self._subset(mask)
+
+    def datetime_at(self, i: int):
+        """Return the c_datetime string of row i without a Candle."""
+        return dt_as_str(dt_from_epoch(int(self.c_epoch[i])))
+
+    def resample(self,
+                 timeframe: str,
+                 trading_hours: str = None,
+                 events: list = None,
+                 ):
+        """Return a new CandleFrame aggregating this 1m frame to timeframe.
+
+        Buckets follow this_candle_start() alignment (r1h on the half hour,
+        e1d at 18:00, e1w at Sunday 18:00) and are built in one vectorized
+        pass: first open, max high, min low, last close, summed volume.
+
+        If trading_hours is given, minutes closed for those hours
+        (per MARKET_ERAS and any Closed events passed) are dropped before
+        aggregating, e.g. to build r1h candles from an eth 1m frame.
+        """
+        if self.c_timeframe != "1m":
+            msg = (f"Only 1m CandleFrames can be resampled, this one is "
+                   f"{self.c_timeframe}")
+            log.critical(msg)
+            raise ValueError(msg)
+        if trading_hours is not None:
+            check_tf_th_compatibility(tf=timeframe, th=trading_hours)
+        source = self
+        if not source.is_sorted():
+            source = self[np.argsort(self.c_epoch, kind="stable")]
+        if trading_hours is not None:
+            source = self.c_symbol.filter_open_candles(
+                candles=source,
+                trading_hours=trading_hours,
+                events=events,
+            )
+        if len(source) == 0:
+            return CandleFrame(c_timeframe=timeframe, c_symbol=self.c_symbol)
+        keys = _candle_start_epochs(source.c_epoch, timeframe)
+        # Sorted input means each bucket is one contiguous run of rows
+        firsts = np.flatnonzero(np.diff(keys)) + 1
+        firsts = np.concatenate(([0], firsts))
+        lasts = np.append(firsts[1:], len(keys)) - 1
+
+        return CandleFrame(
+            c_timeframe=timeframe,
+            c_symbol=self.c_symbol,
+            c_epoch=keys[firsts],
+            c_open=source.c_open[firsts],
+            c_high=np.maximum.reduceat(source.c_high, firsts),
+            c_low=np.minimum.reduceat(source.c_low, firsts),
+            c_close=source.c_close[lasts],
+            c_volume=np.add.reduceat(source.c_volume, firsts),
+        )
+
+    @property
+    def c_size(self):
+        """Array of high to low ranges."""
+        return np.abs(self.c_high - self.c_low)
+
+    @property
+    def c_body_size(self):
+        """Array of open to close ranges."""
+        return np.abs(self.c_open - self.c_close)
+
+    @property
+    def c_upper_wick_size(self):
+        """Array of high to top of body ranges."""
+        return self.c_high - np.maximum(self.c_open, self.c_close)
+
+    @property
+    def c_lower_wick_size(self):
+        """Array of bottom of body to low ranges."""
+        return np.minimum(self.c_open, self.c_close) - self.c_low
+
+    @property
+    def c_direction(self):
+        """Array of 1 (bullish), -1 (bearish), or 0 (unchanged)."""
+        return np.sign(self.c_close - self.c_open).astype(np.int8)
+
+    def __eq__(self, other):
+        """Return True if this CandleFrame equals the other.
+
+        A plain list of Candles compares equal if it holds the same
+        candles in the same order, so a frame backed Chart can still be
+        compared against a list backed one.
+        """
+        if isinstance(other, list):
+            return (len(other) == len(self)
+                    and all(a == b for a, b in zip(self, other)))
+        # Guard: if other is not the same type (e.g. it is None or a list),
+        # return NotImplemented so Python can try the comparison the other
+        # way around.  If both sides give up, Python returns False safely.
+        if not isinstance(other, CandleFrame):
+            return NotImplemented
+        for f in self._EQ_FIELDS:
+            mine = getattr(self, f)
+            theirs = getattr(other, f)
+            if isinstance(mine, np.ndarray):
+                # Arrays compare elementwise so check them as a whole
+                if not (isinstance(theirs, np.ndarray)
+                        and np.array_equal(mine, theirs)):
+                    return False
+            elif not mine == theirs:
+                return False
+
+        return True
+
+    def __ne__(self, other):
+        """Return True if this CandleFrame does not equal the other."""
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    def to_json(self,
+                suppress_candles: bool = True,
+                ):
+        """Return a JSON representation with custom types normalized.
+
+        Arrays are converted to lists, or replaced with a count when
+        suppress_candles is True.
+        """
+        num = len(self)
+        working = {"c_timeframe": self.c_timeframe,
+                   "c_symbol": self.c_symbol.ticker,
+                   }
+        for f in self._ARRAY_FIELDS:
+            if suppress_candles:
+                working[f] = [f"{num} values suppressed for output sanity"]
+            else:
+                working[f] = getattr(self, f).tolist()
+
+        return json.dumps(working)
+
+    def to_clean_dict(self,
+                      suppress_candles: bool = True,
+                      ):
+        """Converts to JSON string then back to a python dict.
+
+        This helps to normalize types (I'm looking at YOU datetime) while
+        ensuring a portable python data structure
+        """
+        return json.loads(self.to_json(suppress_candles=suppress_candles))
+
+    def __str__(self):
+        """Return string representation of this CandleFrame."""
+        return str(self.to_clean_dict())
+
+    def __repr__(self):
+        """Return string representation of this CandleFrame."""
+        return str(self)
+
+    def pretty(self,
+               suppress_candles: bool = True,
+               ):
+        """Return a formatted, indented string representation of this object.
+        """
+        return json.dumps(self.to_clean_dict(
+            suppress_candles=suppress_candles),
+            indent=4,
+            )
+
+
 class Chart():
     """Collection of Candles for a given symbol, timeframe, and date range.
 
-    Supports both regular and extended trading hours.
+    Supports both regular and extended trading hours.  c_candles may be
+    a list of Candle objects or a CandleFrame, in which case Candles are
+    only built when indexed.
     """
 
     _EQ_FIELDS: frozenset = frozenset({
@@ -1169,6 +2829,7 @@ class Chart():
     _EQ_EXCLUDE: frozenset = frozenset({
         # Config flags, not chart data identity
         "autoload", "show_progress",
+        "_epoch_index",  # runtime cache, not identity
     })
 
     def __init__(self,
@@ -1197,6 +2858,8 @@ class Chart():
             self.c_candles = c_candles
         self.autoload = autoload
         self.show_progress = show_progress
+        # Sorted c_epoch array for list backed charts, see epoch_index()
+        self._epoch_index = None
         if self.autoload:
             self.load_candles(show_progress=self.show_progress)
         else:
@@ -1226,7 +2889,9 @@ class Chart():
         Converts datetime and other non-serializable types to
         strings for portability.
         """
-        working = deepcopy(self.__dict__)
+        working = copy(self.__dict__)
+        working.pop("_epoch_index", None)
+        working = deepcopy(working)
         if suppress_candles:
             num = len(self.c_candles)
             clean_cans = [f"{num} Candles suppressed for output sanity"]
@@ -1269,58 +2934,329 @@ class Chart():
 
     def sort_candles(self):
         """Sort c_candles in ascending order by candle datetime."""
-        self.c_candles.sort(key=lambda c: c.c_datetime)
+        self._epoch_index = None
+        if isinstance(self.c_candles, CandleFrame):
+            self.c_candles.sort()
+        else:
+            self.c_candles.sort(key=lambda c: c.c_datetime)
+
+    def epoch_index(self):
+        """Return a sorted array of candle start epochs, one per candle.
+
+        Positions line up with c_candles so it can be bisected to find
+        candles in O(log n).  CandleFrames use their own c_epoch array;
+        list backed Charts build the array once and reuse it until
+        c_candles is replaced, resized, sorted or reviewed.  Candles are
+        sorted first if needed.
+        """
+        if isinstance(self.c_candles, CandleFrame):
+            if not self.c_candles.is_sorted():
+                self.sort_candles()
+            return self.c_candles.c_epoch
+        cache = self._epoch_index
+        if (cache is not None and cache[0] is self.c_candles
+                and len(cache[1]) == len(self.c_candles)):
+            return cache[1]
+        epochs = np.fromiter((c.c_epoch for c in self.c_candles),
+                             dtype=np.int64,
+                             count=len(self.c_candles),
+                             )
+        if np.any(epochs[1:] < epochs[:-1]):
+            self.sort_candles()
+            epochs = np.sort(epochs)
+        self._epoch_index = (self.c_candles, epochs)
+
+        return epochs
+
+    @staticmethod
+    def _as_epoch(d):
+        """Return d as an epoch, accepting epochs, datetimes or strings."""
+        if isinstance(d, (int, np.integer)):
+            return int(d)
+        return dt_to_epoch(d)
+
+    def slice(self, start_dt, end_dt):
+        """Return candles starting between start_dt and end_dt, inclusive.
+
+        CandleFrame backed Charts return a CandleFrame view sharing the
+        underlying arrays; list backed Charts return a list of the same
+        Candle objects.  Nothing is copied or rebuilt either way.
+        """
+        epochs = self.epoch_index()
+        first = np.searchsorted(epochs, self._as_epoch(start_dt), "left")
+        last = np.searchsorted(epochs, self._as_epoch(end_dt), "right")
+
+        return self.c_candles[int(first):int(last)]
+
+    def candles_during(self, candle):
+        """Return candles starting within another candle's time span.
+
+        Typically used to get the 1m candles inside a higher timeframe
+        candle, e.g. chart_1m.candles_during(tf_candle).
+        """
+        end = candle.c_epoch + int(
+            timeframe_delta(candle.c_timeframe).total_seconds()) - 1
+
+        return self.slice(candle.c_epoch, end)
+
+    def candle_at(self, d):
+        """Return the candle whose time span contains d, or None."""
+        epochs = self.epoch_index()
+        target = self._as_epoch(d)
+        i = int(np.searchsorted(epochs, target, "right")) - 1
+        if i < 0:
+            return None
+        length = int(timeframe_delta(self.c_timeframe).total_seconds())
+        if target >= epochs[i] + length:
+            return None
+
+        return self.c_candles[i]
+
+    def previous_candle(self, d):
+        """Return the last candle starting before d, or None."""
+        candles = self.previous_candles(d, count=1)
+        if len(candles) == 0:
+            return None
+
+        return candles[0]
+
+    def previous_candles(self, d, count: int):
+        """Return up to count candles starting before d, oldest first."""
+        epochs = self.epoch_index()
+        last = int(np.searchsorted(epochs, self._as_epoch(d), "left"))
+
+        return self.c_candles[max(last - count, 0):last]
+
+    def next_candle(self, d):
+        """Return the first candle starting after d, or None."""
+        epochs = self.epoch_index()
+        i = int(np.searchsorted(epochs, self._as_epoch(d), "right"))
+        if i >= len(epochs):
+            return None
+
+        return self.c_candles[i]
+
+    def nearest_candle(self, d):
+        """Return the candle starting closest to d, earlier on ties."""
+        epochs = self.epoch_index()
+        if len(epochs) == 0:
+            return None
+        target = self._as_epoch(d)
+        i = int(np.searchsorted(epochs, target, "left"))
+        if i >= len(epochs):
+            return self.c_candles[-1]
+        if i > 0 and target - epochs[i - 1] <= epochs[i] - target:
+            return self.c_candles[i - 1]
+
+        return self.c_candles[i]
 
     def add_candle(self, new_candle, sort=False):
         """Add a Candle to this Chart, optionally sorting after insertion."""
-        if not isinstance(new_candle, Candle):
+        if not isinstance(new_candle, (Candle, LazyCandle)):
             raise TypeError(f"new_candle {type(new_candle)} must be a "
-                            "<class dhtypes.Candle> object")
-        if new_candle.c_timeframe != self.c_timeframe:
-            raise ValueError(f"new_candle c_timeframe of "
-                             f"{new_candle.c_timeframe} does not match "
-                             f"chart c_timeframe of {self.c_timeframe}")
-        self.c_candles.append(new_candle)
-        if sort:
-            self.sort_candles()
-        # Update chart start or end if candle falls outside current range
+                            "<class dhtypes.Candle> or "
+                            "<class dhtypes.LazyCandle> object")
+        self.add_candles([new_candle], sort=sort)
+
+    def add_candles(self, new_candles, sort: bool = True):
+        """Add a batch of Candles (list or CandleFrame) to this Chart.
+
+        A batch that is already in order and starts at or after the last
+        existing candle is simply appended.  Otherwise, with sort=True,
+        the batch is sorted once and merged with the existing candles in
+        a single pass; with sort=False it is appended as given.  Summary
+        fields and c_start/c_end are updated once for the whole batch.
+        """
+        if isinstance(new_candles, CandleFrame):
+            timeframes = {new_candles.c_timeframe}
+        else:
+            for c in new_candles:
+                if not isinstance(c, (Candle, LazyCandle)):
+                    raise TypeError(f"new_candles item {type(c)} must be a "
+                                    "<class dhtypes.Candle> or "
+                                    "<class dhtypes.LazyCandle> object")
+            timeframes = {c.c_timeframe for c in new_candles}
+        for tf in timeframes:
+            if tf != self.c_timeframe:
+                raise ValueError(f"new_candle c_timeframe of {tf} does not "
+                                 f"match chart c_timeframe of "
+                                 f"{self.c_timeframe}")
+        if len(new_candles) == 0:
+            return
+        # Match the batch to how this Chart stores its candles
+        if isinstance(self.c_candles, CandleFrame):
+            if not isinstance(new_candles, CandleFrame):
+                new_candles = CandleFrame.from_candles(
+                    new_candles,
+                    c_timeframe=self.c_timeframe,
+                    c_symbol=self.c_symbol,
+                    )
+            new_epochs = new_candles.c_epoch
+        else:
+            if isinstance(new_candles, CandleFrame):
+                new_candles = new_candles.to_candles()
+            new_epochs = np.fromiter((c.c_epoch for c in new_candles),
+                                     dtype=np.int64,
+                                     count=len(new_candles),
+                                     )
+        batch_in_order = bool(np.all(new_epochs[1:] >= new_epochs[:-1]))
+        appends = (len(self.c_candles) == 0
+                   or new_epochs[0] >= self.c_candles[-1].c_epoch)
+        if (batch_in_order and appends) or not sort:
+            self._append_candles(new_candles, new_epochs)
+        else:
+            self._merge_candles(new_candles, new_epochs)
+        # Update chart start or end if candles fall outside current range
+        batch_start = dt_as_str(dt_from_epoch(int(new_epochs.min())))
+        batch_end = dt_as_str(dt_from_epoch(int(new_epochs.max())))
         if self.c_start is not None:
-            self.c_start = min(self.c_start, new_candle.c_datetime)
+            self.c_start = min(self.c_start, batch_start)
         else:
-            self.c_start = new_candle.c_datetime
+            self.c_start = batch_start
         if self.c_end is not None:
-            self.c_end = max(self.c_end, new_candle.c_datetime)
+            self.c_end = max(self.c_end, batch_end)
         else:
-            self.c_end = new_candle.c_datetime
-        self.review_candles()
+            self.c_end = batch_end
+        self._summarize_candles()
+
+    def _append_candles(self, new_candles, new_epochs):
+        """Append a batch to the end, extending a still valid epoch index."""
+        cache = self._epoch_index
+        index_valid = (cache is not None and cache[0] is self.c_candles
+                       and len(cache[1]) == len(self.c_candles)
+                       and (len(cache[1]) == 0
+                            or new_epochs[0] >= cache[1][-1])
+                       and bool(np.all(new_epochs[1:] >= new_epochs[:-1])))
+        if isinstance(self.c_candles, CandleFrame):
+            frame = self.c_candles
+            for f in CandleFrame._ARRAY_FIELDS:
+                setattr(frame, f, np.concatenate((getattr(frame, f),
+                                                  getattr(new_candles, f))))
+        else:
+            self.c_candles.extend(new_candles)
+        if index_valid:
+            self._epoch_index = (self.c_candles,
+                                 np.concatenate((cache[1], new_epochs)))
+        else:
+            self._epoch_index = None
+
+    def _merge_candles(self, new_candles, new_epochs):
+        """Merge an unordered batch into the sorted candles in one pass."""
+        existing_epochs = self.epoch_index()
+        if isinstance(self.c_candles, CandleFrame):
+            frame = self.c_candles
+            combined = np.concatenate((existing_epochs, new_epochs))
+            # Stable sort keeps existing candles ahead of new ones on ties
+            order = np.argsort(combined, kind="stable")
+            for f in CandleFrame._ARRAY_FIELDS:
+                setattr(frame, f, np.concatenate((getattr(frame, f),
+                                                  getattr(new_candles, f)))
+                        [order])
+        else:
+            batch = sorted(new_candles, key=lambda c: c.c_epoch)
+            self.c_candles = list(heapq.merge(self.c_candles, batch,
+                                              key=lambda c: c.c_epoch))
+        self._epoch_index = None
+
+    def fetch_candles(self,
+                      as_frame: bool = False,
+                      lazy: bool = False,
+                      start_dt=None,
+                      end_dt=None,
+                      ):
+        """Return candles read from central storage without filtering.
 
-    def load_candles(self, show_progress: bool = False):
-        """Load candles from central storage based on current attributes."""
+        Covers c_start to c_end unless start_dt/end_dt narrow it.  Nothing
+        on the Chart is changed, so this can run in a worker thread while
+        other work continues; pass the result to load_candles(candles=...)
+        to filter and attach it.
+        """
+        start_epoch = dt_to_epoch(self.c_start if start_dt is None
+                                  else start_dt)
+        end_epoch = dt_to_epoch(self.c_end if end_dt is None else end_dt)
+        if as_frame:
+            return get_candle_frame(start_epoch=start_epoch,
+                                    end_epoch=end_epoch,
+                                    timeframe=self.c_timeframe,
+                                    symbol=self.c_symbol.ticker,
+                                    )
+
+        return get_candles(start_epoch=start_epoch,
+                           end_epoch=end_epoch,
+                           timeframe=self.c_timeframe,
+                           symbol=self.c_symbol.ticker,
+                           lazy=lazy,
+                           )
+
+    def load_candles(self,
+                     show_progress: bool = False,
+                     as_frame: bool = False,
+                     lazy: bool = False,
+                     chunk_days: int = None,
+                     candles=None,
+                     ):
+        """Load candles from central storage based on current attributes.
+
+        With as_frame=True candles are fetched straight into a CandleFrame
+        and no Candle objects are built during loading.  With lazy=True
+        c_candles is a list of LazyCandle objects instead of Candles.
+
+        With chunk_days the range is read in chunks of that many days,
+        and each next chunk is fetched in a worker thread while the
+        current one is filtered for market hours.  candles may be given
+        from an earlier fetch_candles() call to filter those instead of
+        reading storage.
+        """
         log.info(f"Loading candles for {self.c_symbol.ticker} "
                  f"{self.c_timeframe} ")
-        cans = get_candles(
-               start_epoch=dt_to_epoch(self.c_start),
-               end_epoch=dt_to_epoch(self.c_end),
-               timeframe=self.c_timeframe,
-               symbol=self.c_symbol.ticker,
-               )
-        self.c_candles = []
+        if candles is not None or chunk_days is None:
+            chunks = [(self.c_start, self.c_end)]
+        else:
+            start = dt_to_epoch(self.c_start)
+            end = dt_to_epoch(self.c_end)
+            step = int(chunk_days * 86400)
+            chunks = [(dt_from_epoch(e), dt_from_epoch(min(e + step - 1, end)))
+                      for e in range(start, end + 1, step)]
         log.info("Getting events for market hours filtering...")
         events = get_events(symbol=self.c_symbol.ticker,
                             categories=["Closed"],
                             )
         log.info("Filtering candles for market hours and events...")
-        # Use shared context helper to filter candles by market hours,
-        # building one context that is reused for all candles
-        self.c_candles = self.c_symbol.filter_open_candles(
-            candles=cans,
-            trading_hours=self.c_trading_hours,
-            events=events,
-            start_dt=self.c_start,
-            end_dt=self.c_end,
-            show_progress=show_progress,
-            progress_desc="Candles filtered for market hours",
-        )
+        parts = []
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pending = None
+            for i, (chunk_start, chunk_end) in enumerate(chunks):
+                if candles is not None:
+                    cans = candles
+                elif pending is None:
+                    cans = self.fetch_candles(as_frame, lazy,
+                                              chunk_start, chunk_end)
+                else:
+                    cans = pending.result()
+                if i + 1 < len(chunks):
+                    pending = pool.submit(self.fetch_candles, as_frame,
+                                          lazy, *chunks[i + 1])
+                # Use shared context helper to filter candles by market
+                # hours, building one context that is reused for all
+                # candles
+                parts.append(self.c_symbol.filter_open_candles(
+                    candles=cans,
+                    trading_hours=self.c_trading_hours,
+                    events=events,
+                    start_dt=chunk_start,
+                    end_dt=chunk_end,
+                    show_progress=show_progress,
+                    progress_desc="Candles filtered for market hours",
+                ))
+        if len(parts) == 1:
+            self.c_candles = parts[0]
+        elif as_frame:
+            self.c_candles = CandleFrame.concat(parts,
+                                                c_timeframe=self.c_timeframe,
+                                                c_symbol=self.c_symbol,
+                                                )
+        else:
+            self.c_candles = [c for part in parts for c in part]
 
         log.info("Sorting candles")
         self.sort_candles()
@@ -1328,9 +3264,72 @@ class Chart():
         self.review_candles()
         log.info("Finished loading candles into Chart")
 
+    def resample(self,
+                 timeframe: str,
+                 trading_hours: str = None,
+                 events: list = None,
+                 ):
+        """Return a new Chart of timeframe candles built from this 1m Chart.
+
+        trading_hours defaults to this Chart's.  When it differs (e.g. r1h
+        rth candles from an eth 1m Chart) closed minutes are dropped first,
+        using events if given or Closed events from storage otherwise.
+        Buckets starting before c_start are dropped as they would only be
+        partially filled.  The new Chart holds a CandleFrame.
+        """
+        if trading_hours is None:
+            trading_hours = self.c_trading_hours
+        check_tf_th_compatibility(tf=timeframe, th=trading_hours)
+        if trading_hours == "eth" and self.c_trading_hours == "rth":
+            msg = "Cannot resample eth candles from an rth Chart"
+            log.critical(msg)
+            raise ValueError(msg)
+        if isinstance(self.c_candles, CandleFrame):
+            frame = self.c_candles
+        else:
+            frame = CandleFrame.from_candles(self.c_candles,
+                                             c_timeframe=self.c_timeframe,
+                                             c_symbol=self.c_symbol,
+                                             )
+        if trading_hours == self.c_trading_hours:
+            # Candles were already filtered for these hours when loaded
+            filter_hours = None
+        else:
+            filter_hours = trading_hours
+            if events is None:
+                events = get_events(symbol=self.c_symbol.ticker,
+                                    categories=["Closed"],
+                                    )
+        resampled = frame.resample(timeframe=timeframe,
+                                   trading_hours=filter_hours,
+                                   events=events,
+                                   )
+        if self.c_start is not None:
+            resampled = resampled.between(dt_to_epoch(self.c_start),
+                                          resampled.c_epoch.max(initial=0))
+
+        return Chart(c_timeframe=timeframe,
+                     c_trading_hours=trading_hours,
+                     c_symbol=self.c_symbol,
+                     c_start=self.c_start,
+                     c_end=self.c_end,
+                     c_candles=resampled,
+                     )
+
     def review_candles(self):
         """Update candle summary attributes and return a summary dict."""
-        if len(self.c_candles) > 0:
+        self._epoch_index = None
+
+        return self._summarize_candles()
+
+    def _summarize_candles(self):
+        """Set summary attributes from the candle ends and return them."""
+        if isinstance(self.c_candles, CandleFrame) and self.c_candles:
+            # Read the ends straight from the epoch array, no Candles built
+            self.candles_count = len(self.c_candles)
+            self.earliest_candle = self.c_candles.datetime_at(0)
+            self.latest_candle = self.c_candles.datetime_at(-1)
+        elif len(self.c_candles) > 0:
             self.candles_count = len(self.c_candles)
             self.earliest_candle = dt_as_str(self.c_candles[0].c_datetime)
             self.latest_candle = dt_as_str(self.c_candles[-1].c_datetime)
@@ -1364,14 +3363,149 @@ class Chart():
         # Update Chart dates
         self.c_start = new_start_dt
         self.c_end = new_end_dt
-        # Remove any candles outside of the new range by rebuilding the list
-        # with only candles that fall in the new range using epoch comparison
-        self.c_candles = [c for c in self.c_candles
-                          if ns_epoch <= c.c_epoch <= ne_epoch
-                          ]
+        # Remove any candles outside of the new range by bisecting the
+        # sorted epoch index and keeping the slice in between
+        self.c_candles = self.slice(ns_epoch, ne_epoch)
         self.review_candles()
 
 
+class ChartRegistry():
+    """Process-level store of loaded Charts shared between their users.
+
+    Indicators and Backtests given a chart_registry get their Charts from
+    it, so several of them over the same symbol, timeframe, and trading
+    hours read storage once.  Any range inside a held Chart is served as
+    a new Chart over a slice of its candles.  CandleFrame slices are
+    read-only views of the held arrays; list slices share the held
+    Candle objects, which must not be modified.
+
+    Once more than max_candles are held, the least recently used Charts
+    are evicted.  CHART_REGISTRY is the shared instance; dhstore discards
+    its Charts for a symbol when that symbol's candles or events change.
+    """
+
+    def __init__(self,
+                 max_candles: int = CHART_REGISTRY_MAX_CANDLES,
+                 ):
+        self.max_candles = max_candles
+        # (ticker, timeframe, trading_hours, as_frame, start, end) -> Chart
+        self._charts = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def __len__(self):
+        """Return the number of Charts held."""
+        return len(self._charts)
+
+    def __str__(self):
+        """Return a string summary of this registry."""
+        return (f"ChartRegistry({len(self)} charts, "
+                f"{self.candles_count} candles, stats={self.stats})")
+
+    def __repr__(self):
+        """Return a string summary of this registry."""
+        return str(self)
+
+    @property
+    def candles_count(self):
+        """Return the total number of candles held across all Charts."""
+        return sum(c.candles_count for c in self._charts.values())
+
+    def get_chart(self,
+                  c_timeframe: str,
+                  c_trading_hours: str,
+                  c_symbol,
+                  c_start,
+                  c_end,
+                  as_frame: bool = False,
+                  ):
+        """Return a Chart of stored candles between c_start and c_end.
+
+        Served from a held Chart covering the range when there is one,
+        otherwise loaded from storage with Chart.load_candles() and held
+        for later requests.  The returned Chart is always a new object so
+        its dates may be changed freely.
+        """
+        if isinstance(c_symbol, str):
+            c_symbol = get_symbol_by_ticker(ticker=c_symbol)
+        start = dt_to_epoch(c_start)
+        end = dt_to_epoch(c_end)
+        prefix = (c_symbol.ticker, c_timeframe, c_trading_hours, as_frame)
+        held = None
+        for key, chart in self._charts.items():
+            if key[:4] == prefix and key[4] <= start and end <= key[5]:
+                held = chart
+                self._charts.move_to_end(key)
+                break
+        if held is None:
+            self.stats["misses"] += 1
+            held = Chart(c_timeframe=c_timeframe,
+                         c_trading_hours=c_trading_hours,
+                         c_symbol=c_symbol,
+                         c_start=c_start,
+                         c_end=c_end,
+                         )
+            held.load_candles(as_frame=as_frame)
+            # Held Charts inside the new range are no longer needed
+            for key in [k for k in self._charts
+                        if k[:4] == prefix and start <= k[4]
+                        and k[5] <= end]:
+                del self._charts[key]
+            self._charts[prefix + (start, end)] = held
+            self._evict()
+        else:
+            self.stats["hits"] += 1
+        candles = held.slice(start, end)
+        if as_frame:
+            for f in CandleFrame._ARRAY_FIELDS:
+                getattr(candles, f).flags.writeable = False
+
+        return Chart(c_timeframe=c_timeframe,
+                     c_trading_hours=c_trading_hours,
+                     c_symbol=c_symbol,
+                     c_start=c_start,
+                     c_end=c_end,
+                     c_candles=candles,
+                     )
+
+    def _evict(self):
+        """Drop least recently used Charts until within max_candles.
+
+        The most recently used Chart is always kept, even if it alone is
+        larger than max_candles.
+        """
+        while len(self._charts) > 1 and self.candles_count > self.max_candles:
+            key, _ = self._charts.popitem(last=False)
+            self.stats["evictions"] += 1
+            log.info(f"ChartRegistry evicted {key}")
+
+    def discard(self,
+                symbol=None,
+                timeframe: str = None,
+                ):
+        """Drop held Charts, optionally only those of symbol and timeframe.
+
+        Returns the number of Charts dropped.
+        """
+        if isinstance(symbol, Symbol):
+            symbol = symbol.ticker
+        keys = [k for k in self._charts
+                if (symbol is None or k[0] == symbol)
+                and (timeframe is None or k[1] == timeframe)]
+        for key in keys:
+            del self._charts[key]
+
+        return len(keys)
+
+    def clear(self):
+        """Drop every held Chart and reset stats."""
+        self._charts.clear()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+# Shared ChartRegistry for the process
+CHART_REGISTRY = ChartRegistry()
+
+
 class Event():
     """Classify notable time periods for correlation or exclusion in analysis.
 
@@ -1451,6 +3585,99 @@ class Event():
             return False
 
 
+class EventIndex():
+    """Sorted interval index over a list of Events for fast lookups.
+
+    Holds start and end epoch arrays ordered by start plus a map of
+    events by start date, so containment, overlap, and same-day lookups
+    are binary searches rather than scans of every Event.  Iterating an
+    EventIndex yields the original Events in their original order, so it
+    can be passed anywhere a list of Events is accepted.
+
+    The index is a snapshot; build a new one if the Events change.
+    """
+
+    def __init__(self,
+                 events: list = None,
+                 ):
+        if events is None:
+            events = []
+        self.events = list(events)
+        starts = np.asarray([dt_to_epoch(e.start_dt) for e in self.events],
+                            dtype=np.int64)
+        ends = np.asarray([dt_to_epoch(e.end_dt) for e in self.events],
+                          dtype=np.int64)
+        order = np.argsort(starts, kind="stable")
+        self._order = order
+        self.start_epochs = starts[order]
+        self.end_epochs = ends[order]
+        # Latest end among all events starting at or before each position,
+        # which answers "does anything started by then reach t" in one step
+        self._max_end = np.maximum.accumulate(self.end_epochs)
+        self._by_date = {}
+        for e in self.events:
+            self._by_date.setdefault(dt_as_dt(e.start_dt).date(),
+                                     []).append(e)
+        self.key = tuple(sorted(zip(starts.tolist(), ends.tolist())))
+
+    def __len__(self):
+        """Return the number of indexed Events."""
+        return len(self.events)
+
+    def __iter__(self):
+        """Iterate indexed Events in their original order."""
+        return iter(self.events)
+
+    def __str__(self):
+        """Return string representation of this EventIndex."""
+        return f"EventIndex({len(self.events)} events)"
+
+    def __repr__(self):
+        """Return string representation of this EventIndex."""
+        return str(self)
+
+    def _started_by(self, epoch: int) -> int:
+        """Return how many events start at or before epoch."""
+        return int(np.searchsorted(self.start_epochs, epoch, side="right"))
+
+    def contains(self, dt) -> bool:
+        """Return True if any Event contains dt, inclusive of both ends."""
+        k = self._started_by(dt_to_epoch(dt))
+
+        return k > 0 and bool(self._max_end[k - 1] >= dt_to_epoch(dt))
+
+    def containing(self, dt) -> list:
+        """Return Events containing dt in their original list order."""
+        epoch = dt_to_epoch(dt)
+        k = self._started_by(epoch)
+        if k == 0 or self._max_end[k - 1] < epoch:
+            return []
+        hits = np.sort(self._order[:k][self.end_epochs[:k] >= epoch])
+
+        return [self.events[i] for i in hits.tolist()]
+
+    def overlaps(self, start_dt, end_dt) -> bool:
+        """Return True if any Event overlaps start_dt through end_dt."""
+        k = self._started_by(dt_to_epoch(end_dt))
+
+        return k > 0 and bool(self._max_end[k - 1] >= dt_to_epoch(start_dt))
+
+    def starting_on(self, d) -> list:
+        """Return Events starting on date d in their original list order.
+
+        d may be a date, a datetime, a "YYYY-mm-dd" date string, or a
+        datetime string.
+        """
+        if isinstance(d, dt.datetime):
+            d = d.date()
+        elif isinstance(d, str) and len(d) == 10:
+            d = dt.date.fromisoformat(d)
+        elif not isinstance(d, dt.date):
+            d = dt_as_dt(d).date()
+
+        return list(self._by_date.get(d, []))
+
+
 class Day():
     """Represent a single trading day with ETH and RTH OHLCV data and charts.
 
@@ -1475,12 +3702,6 @@ class Day():
                  d_tags: list = None,
                  d_pattern_rth=None,  # brooks style day pattern for future use
                  ):
-        eth_start_time = dt.datetime.strptime('2000-01-01 00:00:00',
-                                              '%Y-%m-%d %H:%M:%S').time()
-        rth_start_time = dt.datetime.strptime('2000-01-01 09:30:00',
-                                              '%Y-%m-%d %H:%M:%S').time()
-        eth_end_time = dt.datetime.strptime('2000-01-01 23:59:00',
-                                            '%Y-%m-%d %H:%M:%S').time()
         # Get rth_close_time dynamically from symbol for the era of d_date
         target_dt = dt.datetime.combine(d_date, dt.time(16, 0, 0))
         era_times = d_symbol.get_times_for_era(d_symbol.get_era(target_dt))
@@ -1499,8 +3720,8 @@ class Day():
             self.d_charts = []
         else:
             self.d_charts = d_charts
-        for c in d_charts:
-            if not isinstance(self.d_symbol, Symbol):
+        for c in self.d_charts:
+            if not isinstance(c, Chart):
                 raise TypeError(f"c {type(c)} must be a "
                                 "<class dhtypes.Chart> object")
         self.d_open_eth = d_open_eth
@@ -1520,13 +3741,15 @@ class Day():
         self.d_pattern_rth = d_pattern_rth
 
         # Combine self.d_date and time boundaries for date-specific boundaries
-        self.eth_start = dt.datetime.combine(self.d_date, eth_start_time)
-        self.rth_start = dt.datetime.combine(self.d_date, rth_start_time)
-        self.eth_end = dt.datetime.combine(self.d_date, eth_end_time)
+        self.eth_start = dt.datetime.combine(self.d_date, DAY_ETH_START)
+        self.rth_start = dt.datetime.combine(self.d_date, DAY_RTH_START)
+        self.eth_end = dt.datetime.combine(self.d_date, DAY_ETH_END)
         self.rth_end = dt.datetime.combine(self.d_date, rth_end_time)
 
-        # Run through the 1m chart to further develop attributes
-        self.recalc_from_1m()
+        # Run through the 1m chart to further develop attributes.  Days
+        # built by DayBuilder arrive with OHLCV already set and no chart.
+        if self.get_chart('1m') is not None:
+            self.recalc_from_1m()
 
     def to_json(self):
         """Return a JSON representation with custom types normalized.
@@ -1566,21 +3789,23 @@ class Day():
         if base_chart is None:
             sys.exit('No 1m chart found, cannot recalc Day object')
         else:
+            # Compare epochs rather than c_datetime strings to datetimes
+            eth_start = dt_to_epoch(self.eth_start)
+            rth_start = dt_to_epoch(self.rth_start)
+            eth_end = dt_to_epoch(self.eth_end)
+            rth_end = dt_to_epoch(self.rth_end)
             for candle in base_chart.c_candles:
-                if (candle.c_datetime >= self.rth_start
-                        and candle.c_datetime <= self.rth_end):
-                    in_rth = True
-                else:
-                    in_rth = False
+                epoch = candle.c_epoch
+                in_rth = rth_start <= epoch <= rth_end
                 # Daily open
-                if candle.c_datetime == self.eth_start:
+                if epoch == eth_start:
                     self.d_open_eth = candle.c_open
-                if candle.c_datetime == self.rth_start:
+                if epoch == rth_start:
                     self.d_open_rth = candle.c_open
                 # Daily close
-                if candle.c_datetime == self.eth_end:
+                if epoch == eth_end:
                     self.d_close_eth = candle.c_close
-                if candle.c_datetime == self.rth_end:
+                if epoch == rth_end:
                     self.d_close_rth = candle.c_close
                 # Daily high
                 if self.d_high_eth is None:
@@ -1645,12 +3870,179 @@ class Day():
         if new_chart.c_timeframe == '1m':
             self.recalc_from_1m()
 
-    def get_chart(self, timeframe: str):
-        """Return the Chart matching the given timeframe, or None."""
-        for c in self.d_charts:
-            if c.c_timeframe == timeframe:
-                return c
-        return None
+    def get_chart(self, timeframe: str):
+        """Return the Chart matching the given timeframe, or None."""
+        for c in self.d_charts:
+            if c.c_timeframe == timeframe:
+                return c
+        return None
+
+
+class DayBuilder():
+    """Build Days for every date of a multi-day 1m Chart or CandleFrame.
+
+    Groups 1m candles by local calendar date and aggregates ETH and RTH
+    OHLCV for all dates in one vectorized pass, following the same rules
+    as Day.recalc_from_1m(): ETH covers the whole date, RTH runs from
+    09:30 through the rth_close of the date's market era inclusive, and
+    opens and closes come only from candles exactly at those boundaries.
+    """
+
+    _PRICE_FIELDS: tuple = (
+        "d_open_eth", "d_open_rth", "d_high_eth", "d_high_rth",
+        "d_low_eth", "d_low_rth", "d_close_eth", "d_close_rth",
+    )
+
+    def __init__(self,
+                 candles,
+                 symbol=None,
+                 ):
+        if isinstance(candles, Chart):
+            if symbol is None:
+                symbol = candles.c_symbol
+            candles = candles.c_candles
+        if isinstance(symbol, str):
+            symbol = get_symbol_by_ticker(ticker=symbol)
+        if not isinstance(candles, CandleFrame):
+            candles = CandleFrame.from_candles(candles,
+                                               c_timeframe="1m",
+                                               c_symbol=symbol,
+                                               )
+        if candles.c_timeframe != "1m":
+            msg = ("DayBuilder requires 1m candles, got "
+                   f"{candles.c_timeframe}")
+            log.critical(msg)
+            raise ValueError(msg)
+        if not candles.is_sorted():
+            candles = candles[np.argsort(candles.c_epoch, kind="stable")]
+        self.frame = candles
+        if symbol is None:
+            symbol = candles.c_symbol
+        self.symbol = symbol
+
+    def _groups(self):
+        """Return first and last row of each date plus seconds into day."""
+        epochs = self.frame.c_epoch
+        local = epochs + _local_offsets(epochs)
+        day_numbers = local // 86400
+        seconds = local - (day_numbers * 86400)
+        # Sorted input means each date is one contiguous run of rows
+        firsts = np.flatnonzero(np.diff(day_numbers)) + 1
+        firsts = np.concatenate(([0], firsts))
+        lasts = np.append(firsts[1:], len(epochs)) - 1
+
+        return day_numbers[firsts], firsts, lasts, seconds
+
+    def _rth_close_seconds(self, epochs):
+        """Return the era rth_close of each epoch as seconds into the day.
+        """
+        era_ids = self.symbol.get_era_ids(epochs)
+        closes = []
+        for era in MARKET_ERAS:
+            t = self.symbol.get_times_for_era(era)["rth_close"]
+            closes.append((t.hour * 3600) + (t.minute * 60) + t.second)
+
+        return np.asarray(closes, dtype=np.int64)[era_ids]
+
+    def table(self) -> dict:
+        """Return a columnar table of daily ETH and RTH OHLCV.
+
+        Keys are d_date (datetime64[D]) plus the Day OHLCV attribute
+        names, each an array with one row per date that has candles.
+        Prices are NaN and d_volume_rth is 0 where a session has no
+        candle to take them from.
+        """
+        frame = self.frame
+        n_rows = len(frame)
+        if n_rows == 0:
+            table = {"d_date": np.empty(0, dtype="datetime64[D]")}
+            for f in self._PRICE_FIELDS:
+                table[f] = np.empty(0, dtype=np.float64)
+            table["d_volume_eth"] = np.empty(0, dtype=np.int64)
+            table["d_volume_rth"] = np.empty(0, dtype=np.int64)
+            return table
+        day_numbers, firsts, lasts, seconds = self._groups()
+        dates = day_numbers.astype("datetime64[D]")
+        n_days = len(dates)
+        group = np.repeat(np.arange(n_days), lasts - firsts + 1)
+        rth_close = self._rth_close_seconds(frame.c_epoch[firsts])
+        rth_open = (DAY_RTH_START.hour * 3600) + (DAY_RTH_START.minute * 60)
+        eth_end = (DAY_ETH_END.hour * 3600) + (DAY_ETH_END.minute * 60)
+        table = {"d_date": dates}
+        for f in self._PRICE_FIELDS:
+            table[f] = np.full(n_days, np.nan)
+
+        # ETH covers every candle of the date
+        table["d_open_eth"] = np.where(seconds[firsts] == 0,
+                                       frame.c_open[firsts], np.nan)
+        table["d_close_eth"] = np.where(seconds[lasts] == eth_end,
+                                        frame.c_close[lasts], np.nan)
+        table["d_high_eth"] = np.maximum.reduceat(frame.c_high, firsts)
+        table["d_low_eth"] = np.minimum.reduceat(frame.c_low, firsts)
+        table["d_volume_eth"] = np.add.reduceat(frame.c_volume, firsts)
+
+        # RTH rows are a subset, aggregated by their own contiguous runs
+        in_rth = (seconds >= rth_open) & (seconds <= rth_close[group])
+        rows = np.flatnonzero(in_rth)
+        table["d_volume_rth"] = np.zeros(n_days, dtype=np.int64)
+        if len(rows) > 0:
+            rth_group = group[rows]
+            rth_firsts = np.flatnonzero(np.diff(rth_group)) + 1
+            rth_firsts = np.concatenate(([0], rth_firsts))
+            rth_days = rth_group[rth_firsts]
+            table["d_high_rth"][rth_days] = np.maximum.reduceat(
+                frame.c_high[rows], rth_firsts)
+            table["d_low_rth"][rth_days] = np.minimum.reduceat(
+                frame.c_low[rows], rth_firsts)
+            table["d_volume_rth"][rth_days] = np.add.reduceat(
+                frame.c_volume[rows], rth_firsts)
+        opens = np.flatnonzero(seconds == rth_open)
+        table["d_open_rth"][group[opens]] = frame.c_open[opens]
+        closes = np.flatnonzero(seconds == rth_close[group])
+        table["d_close_rth"][group[closes]] = frame.c_close[closes]
+
+        return table
+
+    def days(self, include_charts: bool = False) -> list:
+        """Return a Day for every date in the table, in date order.
+
+        Session values missing from the table are None on the Day, as
+        they would be after Day.recalc_from_1m().  If include_charts is
+        True each Day also gets a 1m Chart of its date's candles.
+        """
+        table = self.table()
+        columns = {f: table[f].tolist()
+                   for f in self._PRICE_FIELDS + ("d_volume_eth",
+                                                  "d_volume_rth")}
+        if include_charts:
+            _, firsts, lasts, _ = self._groups()
+        days = []
+        for i, d_date in enumerate(table["d_date"].tolist()):
+            values = {f: (None if np.isnan(columns[f][i])
+                          else columns[f][i])
+                      for f in self._PRICE_FIELDS}
+            values["d_volume_eth"] = columns["d_volume_eth"][i]
+            if values["d_high_rth"] is None:
+                values["d_volume_rth"] = None
+            else:
+                values["d_volume_rth"] = columns["d_volume_rth"][i]
+            day = Day(d_symbol=self.symbol,
+                      d_date=d_date,
+                      **values,
+                      )
+            if include_charts:
+                candles = self.frame[firsts[i]:lasts[i] + 1]
+                day.d_charts.append(Chart(
+                    c_timeframe="1m",
+                    c_trading_hours="eth",
+                    c_symbol=self.symbol,
+                    c_start=dt_from_epoch(int(candles.c_epoch[0])),
+                    c_end=dt_from_epoch(int(candles.c_epoch[-1])),
+                    c_candles=candles,
+                ))
+            days.append(day)
+
+        return days
 
 
 class IndicatorDataPoint():
@@ -1733,6 +4125,351 @@ class IndicatorDataPoint():
         return not self.__eq__(other)
 
 
+class IndicatorDataPoints():
+    """Columnar, NumPy-backed collection of one Indicator's datapoints.
+
+    Holds epoch and value as arrays rather than a list of
+    IndicatorDataPoint objects, so multi-year 1m indicators fit in a
+    fraction of the memory.  IndicatorDataPoint objects are only built on
+    demand when indexing or iterating; they are copies, so changing one
+    does not change the collection.  Every datapoint shares the
+    collection's ind_id and name, which an empty collection without an
+    ind_id takes from the first datapoint added.  Values must be numbers;
+    None is rejected rather than stored as NaN.
+
+    Rows are kept in epoch order by sort() and by append() or extend()
+    of later datapoints, and while they are that order serves as the
+    epoch to index map: index_of() finds a datapoint by bisection rather
+    than scanning.  Arrays grow with spare room so appending one
+    datapoint at a time stays cheap.
+
+    Indicator.datapoints is always an IndicatorDataPoints.
+    """
+
+    _EQ_FIELDS: frozenset = frozenset({
+        "ind_id", "name", "_epochs", "_values", "_count",
+    })
+    _EQ_EXCLUDE: frozenset = frozenset({
+        "_in_order",  # derived from _epochs, for index_of()
+    })
+
+    def __init__(self,
+                 ind_id: str = None,
+                 name: str = None,
+                 epochs=None,
+                 values=None,
+                 ):
+        self.ind_id = ind_id
+        self.name = name
+        if values is not None and not isinstance(values, np.ndarray):
+            values = np.asarray(values)
+            # None makes an object array, which float64 would turn to NaN
+            if values.dtype == object:
+                for v in values:
+                    self._check_value(v)
+        self._epochs = CandleFrame._as_array(epochs, np.int64)
+        self._values = CandleFrame._as_array(values, np.float64)
+        if len(self._epochs) != len(self._values):
+            msg = ("IndicatorDataPoints epochs and values must be the same "
+                   f"length, got {len(self._epochs)} and {len(self._values)}")
+            log.critical(msg)
+            raise ValueError(msg)
+        # Rows in use; the arrays may hold spare room beyond them
+        self._count = len(self._epochs)
+        self._in_order = self._is_in_order(self._epochs)
+
+    @staticmethod
+    def _is_in_order(epochs: np.ndarray):
+        """Return True if epochs are in ascending order."""
+        return bool(np.all(epochs[1:] >= epochs[:-1]))
+
+    @classmethod
+    def from_datapoints(cls,
+                        datapoints,
+                        ind_id: str = None,
+                        name: str = None,
+                        ):
+        """Build an IndicatorDataPoints from IndicatorDataPoint objects.
+
+        ind_id and name default to those of the first datapoint, and every
+        datapoint must match them.
+        """
+        datapoints = list(datapoints)
+        if len(datapoints) > 0:
+            if ind_id is None:
+                ind_id = datapoints[0].ind_id
+            if name is None:
+                name = datapoints[0].name
+        result = cls(ind_id=ind_id, name=name)
+        for dp in datapoints:
+            result._check_identity(dp.ind_id, dp.name)
+            result._check_value(dp.value)
+        result._add_rows(
+            np.fromiter((dp.epoch for dp in datapoints), dtype=np.int64,
+                        count=len(datapoints)),
+            np.fromiter((dp.value for dp in datapoints), dtype=np.float64,
+                        count=len(datapoints)),
+        )
+
+        return result
+
+    @property
+    def epochs(self):
+        """Read-only int64 array of each datapoint's epoch."""
+        view = self._epochs[:self._count]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def values(self):
+        """Read-only float64 array of each datapoint's value."""
+        view = self._values[:self._count]
+        view.flags.writeable = False
+        return view
+
+    def __len__(self):
+        """Return the number of datapoints in this collection."""
+        return self._count
+
+    def __getitem__(self, key):
+        """Return a datapoint for an int, or a collection for a slice/mask."""
+        if isinstance(key, (int, np.integer)):
+            return self.datapoint(key)
+
+        return IndicatorDataPoints(ind_id=self.ind_id,
+                                   name=self.name,
+                                   epochs=self.epochs[key].copy(),
+                                   values=self.values[key].copy(),
+                                   )
+
+    def __iter__(self):
+        """Yield an IndicatorDataPoint for each row, in current order."""
+        epochs = self.epochs.tolist()
+        values = self.values.tolist()
+        for epoch, dt_str, value in zip(epochs,
+                                        epochs_to_dt_strs(epochs).tolist(),
+                                        values):
+            yield IndicatorDataPoint(dt=dt_str,
+                                     value=value,
+                                     ind_id=self.ind_id,
+                                     epoch=epoch,
+                                     name=self.name,
+                                     )
+
+    def datapoint(self, i: int):
+        """Build and return the IndicatorDataPoint at row i."""
+        # Normalizes negative indexes and raises IndexError like a list
+        i = range(self._count)[i]
+        epoch = int(self._epochs[i])
+        return IndicatorDataPoint(dt=dt_from_epoch(epoch),
+                                  value=float(self._values[i]),
+                                  ind_id=self.ind_id,
+                                  epoch=epoch,
+                                  name=self.name,
+                                  )
+
+    def to_datapoints(self):
+        """Return a list of IndicatorDataPoint objects for every row."""
+        return list(self)
+
+    def to_clean_dicts(self):
+        """Return each datapoint as the dict its to_clean_dict() gives."""
+        return [{"dt": dt_str,
+                 "value": value,
+                 "ind_id": self.ind_id,
+                 "epoch": epoch,
+                 "name": self.name,
+                 }
+                for dt_str, value, epoch in zip(
+                    epochs_to_dt_strs(self.epochs).tolist(),
+                    self.values.tolist(),
+                    self.epochs.tolist())]
+
+    def _check_identity(self, ind_id: str, name: str):
+        """Raise ValueError unless ind_id and name match this collection.
+
+        An empty collection without an ind_id takes on the ones given.
+        """
+        if self._count == 0 and self.ind_id is None:
+            self.ind_id = ind_id
+            self.name = name
+        if ind_id != self.ind_id or name != self.name:
+            msg = (f"Datapoint ind_id {ind_id} and name {name} do not match "
+                   f"IndicatorDataPoints ind_id {self.ind_id} and name "
+                   f"{self.name}")
+            log.critical(msg)
+            raise ValueError(msg)
+
+    def _make_room(self, added: int):
+        """Grow the arrays with spare room to hold added more rows."""
+        needed = self._count + added
+        if needed > len(self._epochs):
+            size = max(needed, 2 * len(self._epochs), 16)
+            for f in ["_epochs", "_values"]:
+                grown = np.empty(size, dtype=getattr(self, f).dtype)
+                grown[:self._count] = getattr(self, f)[:self._count]
+                setattr(self, f, grown)
+
+    @staticmethod
+    def _check_value(value):
+        """Raise ValueError if value is None."""
+        if value is None:
+            msg = "IndicatorDataPoints values can not be None"
+            log.critical(msg)
+            raise ValueError(msg)
+
+    def _add_rows(self, epochs: np.ndarray, values: np.ndarray):
+        """Add rows to the end, keeping track of whether still in order."""
+        added = len(epochs)
+        if added == 0:
+            return
+        self._make_room(added)
+        if self._in_order and self._count > 0:
+            self._in_order = bool(epochs[0] >= self._epochs[self._count - 1])
+        self._in_order = self._in_order and self._is_in_order(epochs)
+        needed = self._count + added
+        self._epochs[self._count:needed] = epochs
+        self._values[self._count:needed] = values
+        self._count = needed
+
+    def append(self, datapoint):
+        """Append a single IndicatorDataPoint to the end."""
+        self._check_identity(datapoint.ind_id, datapoint.name)
+        self._check_value(datapoint.value)
+        self._make_room(1)
+        if self._in_order and self._count > 0:
+            self._in_order = bool(
+                datapoint.epoch >= self._epochs[self._count - 1])
+        self._epochs[self._count] = datapoint.epoch
+        self._values[self._count] = datapoint.value
+        self._count += 1
+
+    def extend(self, datapoints):
+        """Append IndicatorDataPoints or IndicatorDataPoint objects."""
+        if not isinstance(datapoints, IndicatorDataPoints):
+            datapoints = IndicatorDataPoints.from_datapoints(datapoints)
+        if len(datapoints) == 0:
+            return
+        self._check_identity(datapoints.ind_id, datapoints.name)
+        self._add_rows(datapoints.epochs, datapoints.values)
+
+    def sort(self):
+        """Sort rows in place in ascending epoch order."""
+        if self._in_order:
+            return
+        order = np.argsort(self.epochs, kind="stable")
+        self._epochs = self.epochs[order]
+        self._values = self.values[order]
+        self._in_order = True
+
+    def index_of(self, epoch: int):
+        """Return the index of the first datapoint at epoch, or None."""
+        epochs = self.epochs
+        if self._in_order:
+            i = int(np.searchsorted(epochs, epoch))
+            if i < len(epochs) and epochs[i] == epoch:
+                return i
+            return None
+        found = np.flatnonzero(epochs == epoch)
+        if len(found) == 0:
+            return None
+
+        return int(found[0])
+
+    def _shares_identity(self, other) -> bool:
+        """Return True if other's datapoints match this ind_id and name.
+
+        other may be an IndicatorDataPoints or a list of IndicatorDataPoint
+        objects.  Empty collections share any identity.
+        """
+        if isinstance(other, IndicatorDataPoints):
+            pairs = {(other.ind_id, other.name)} if len(other) else set()
+        else:
+            pairs = {(dp.ind_id, dp.name) for dp in other}
+        if len(self):
+            pairs.add((self.ind_id, self.name))
+
+        return len(pairs) <= 1
+
+    def __add__(self, other):
+        """Return these then other's datapoints.
+
+        other may be an IndicatorDataPoints or a list of IndicatorDataPoint
+        objects.  The result is a new IndicatorDataPoints when every
+        datapoint shares one ind_id and name, otherwise a plain list of
+        IndicatorDataPoint objects as before datapoints were columnar.
+        """
+        if not isinstance(other, (IndicatorDataPoints, list)):
+            return NotImplemented
+        if not self._shares_identity(other):
+            return self.to_datapoints() + list(other)
+        result = IndicatorDataPoints()
+        result.extend(self)
+        result.extend(other)
+
+        return result
+
+    def __radd__(self, other):
+        """Return other's then these datapoints, as __add__ does."""
+        if not isinstance(other, list):
+            return NotImplemented
+        if not self._shares_identity(other):
+            return other + self.to_datapoints()
+        result = IndicatorDataPoints.from_datapoints(other)
+        result.extend(self)
+
+        return result
+
+    def __eq__(self, other):
+        """Return True if this collection equals the other.
+
+        A plain list of IndicatorDataPoints compares equal if it holds the
+        same datapoints in the same order.  Empty collections are equal
+        whatever their ind_id.
+        """
+        if isinstance(other, list):
+            return (len(other) == len(self)
+                    and all(a == b for a, b in zip(self, other)))
+        # Guard: if other is not the same type (e.g. it is None or a list),
+        # return NotImplemented so Python can try the comparison the other
+        # way around.  If both sides give up, Python returns False safely.
+        if not isinstance(other, IndicatorDataPoints):
+            return NotImplemented
+        # Spare room past _count is not compared, and a broken attribute
+        # makes the collections unequal rather than raising
+        try:
+            if len(self) == 0 and len(other) == 0:
+                return True
+            for f in self._EQ_FIELDS:
+                mine = getattr(self, f)
+                theirs = getattr(other, f)
+                if isinstance(mine, np.ndarray):
+                    if not np.array_equal(mine[:self._count],
+                                          theirs[:other._count]):
+                        return False
+                elif not mine == theirs:
+                    return False
+        except Exception:
+            return False
+
+        return True
+
+    def __ne__(self, other):
+        """Return True if this collection does not equal the other."""
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    def __str__(self):
+        """Return a string summary of this collection."""
+        return f"IndicatorDataPoints({self.ind_id}, {len(self)} datapoints)"
+
+    def __repr__(self):
+        """Return a string summary of this collection."""
+        return str(self)
+
+
 class Indicator():
     """Base class for technical indicators such as SMA and EMA.
 
@@ -1740,6 +4477,9 @@ class Indicator():
     storage, e.g. sma, hod, vwap.  This class is not intended to be used
     directly; use its subclasses which provide indicator type-specific
     logic.
+
+    datapoints is always an IndicatorDataPoints; a list assigned to it is
+    converted.
     """
 
     _EQ_FIELDS: frozenset = frozenset({
@@ -1753,7 +4493,17 @@ class Indicator():
     })
     _EQ_EXCLUDE: frozenset = frozenset({
         "autoload_chart",  # config flag
+        "state",  # where the last calculation stopped, for update()
     })
+    # Candle field the series is calculated over, see _calculate_series()
+    _SERIES_FIELD: str = "c_high"
+
+    def __setattr__(self, name, value):
+        """Keep datapoints an IndicatorDataPoints however it is assigned."""
+        if name == "datapoints" and not isinstance(value,
+                                                   IndicatorDataPoints):
+            value = IndicatorDataPoints.from_datapoints(value or [])
+        object.__setattr__(self, name, value)
 
     def __init__(self,
                  name: str,
@@ -1770,6 +4520,8 @@ class Indicator():
                  candle_chart=None,
                  datapoints: list = None,
                  parameters={},
+                 chart_registry=None,
+                 state: dict = None,
                  ):
         self.name = name
         self.description = description
@@ -1789,10 +4541,7 @@ class Indicator():
         self.end_dt = end_dt
         if self.end_dt is None:
             self.end_dt = dt_as_str(dt.datetime.now())
-        if datapoints is None:
-            self.datapoints = []
-        else:
-            self.datapoints = datapoints
+        self.datapoints = datapoints
         self.parameters = parameters
         if ind_id is None:
             self.ind_id = (f"{self.symbol.ticker}_{self.trading_hours}_"
@@ -1800,10 +4549,12 @@ class Indicator():
         else:
             self.ind_id = ind_id
         self.class_name = "Indicator"
+        # Where the last calculate() or update() stopped, see update()
+        self.state = state
         self.autoload_chart = autoload_chart
         self.candle_chart = candle_chart
         if self.candle_chart is None and self.autoload_chart:
-            self.load_underlying_chart()
+            self.load_underlying_chart(chart_registry=chart_registry)
         self.sort_datapoints()
 
     def __eq__(self, other):
@@ -1842,17 +4593,18 @@ class Indicator():
         Converts datetime and other non-serializable types to
         strings for portability.
         """
-        working = deepcopy(self.__dict__)
-        working["candle_chart"] = working["candle_chart"].to_clean_dict(
-                suppress_candles=suppress_chart_candles,
-                )
+        # Datapoints are serialized from their arrays rather than copied
+        working = deepcopy({k: v for k, v in self.__dict__.items()
+                            if k != "datapoints"})
+        if working["candle_chart"] is not None:
+            working["candle_chart"] = working["candle_chart"].to_clean_dict(
+                    suppress_candles=suppress_chart_candles,
+                    )
         if suppress_datapoints:
             num = len(self.datapoints)
             clean_dps = [f"{num} Datapoints suppressed for output sanity"]
         else:
-            clean_dps = []
-            for d in working["datapoints"]:
-                clean_dps.append(d.to_clean_dict())
+            clean_dps = self.datapoints.to_clean_dicts()
         working["datapoints"] = clean_dps
         working["symbol"] = working["symbol"].ticker
 
@@ -1921,20 +4673,39 @@ class Indicator():
         else:
             return output
 
-    def load_underlying_chart(self):
-        """Load the underlying candle chart from central storage."""
-        if self.start_dt is None or self.end_dt is None:
-            self.candle_chart = None
-        else:
-            self.candle_chart = Chart(c_timeframe=self.timeframe,
-                                      c_trading_hours=self.trading_hours,
-                                      c_symbol=self.symbol,
-                                      c_start=self.start_dt,
-                                      c_end=self.end_dt,
-                                      autoload=True,
-                                      )
+    def load_underlying_chart(self,
+                              chart_registry=None,
+                              ):
+        """Load the underlying candle chart from central storage.
+
+        With a ChartRegistry such as CHART_REGISTRY the chart is shared
+        with other Indicators and Backtests over the same candles.
+        """
+        self.candle_chart = self._load_chart(chart_registry=chart_registry,
+                                             start_dt=self.start_dt,
+                                             )
         return self.candle_chart
 
+    def _load_chart(self, chart_registry, start_dt):
+        """Return a Chart of stored candles from start_dt to end_dt."""
+        if start_dt is None or self.end_dt is None:
+            return None
+        if chart_registry is not None:
+            return chart_registry.get_chart(c_timeframe=self.timeframe,
+                                            c_trading_hours=self.trading_hours,
+                                            c_symbol=self.symbol,
+                                            c_start=start_dt,
+                                            c_end=self.end_dt,
+                                            )
+
+        return Chart(c_timeframe=self.timeframe,
+                     c_trading_hours=self.trading_hours,
+                     c_symbol=self.symbol,
+                     c_start=start_dt,
+                     c_end=self.end_dt,
+                     autoload=True,
+                     )
+
     def load_datapoints(self):
         """Load datapoints from storage by ind_id, start_dt, and end_dt.
         """
@@ -1947,21 +4718,188 @@ class Indicator():
         """Sort attached datapoints in chronological order."""
         if len(self.datapoints) == 0:
             return False
-        self.datapoints.sort(key=lambda dp: dp.epoch)
+        self.datapoints.sort()
+
+    def _chart_values(self, field: str, chart=None):
+        """Return candle_chart epochs and one field of its candles.
+
+        Epochs are an int64 array and the field a float64 array.
+        CandleFrame backed charts are read from their arrays without
+        building Candles.  Another chart may be read instead.
+        """
+        if chart is None:
+            chart = self.candle_chart
+        candles = chart.c_candles
+        if isinstance(candles, CandleFrame):
+            return (candles.c_epoch,
+                    getattr(candles, field).astype(np.float64))
+
+        return (np.fromiter((c.c_epoch for c in candles),
+                            dtype=np.int64,
+                            count=len(candles),
+                            ),
+                np.fromiter((getattr(c, field) for c in candles),
+                            dtype=np.float64,
+                            count=len(candles),
+                            ))
+
+    def _datapoints_from_values(self, epochs: np.ndarray, values):
+        """Return IndicatorDataPoints of each epoch and value."""
+        return IndicatorDataPoints(ind_id=self.ind_id,
+                                   name=self.name,
+                                   epochs=epochs,
+                                   values=values,
+                                   )
+
+    def _calculate_series(self,
+                          epochs: np.ndarray,
+                          values: np.ndarray,
+                          state: dict = None,
+                          ):
+        """Return this indicator's series, specific to each type.
+
+        Given candle epochs and values of the _SERIES_FIELD of each
+        candle, returns a float64 array of unrounded values, one per
+        candle, a boolean array marking those that become datapoints, and
+        the state update() needs to carry on after the last candle, or
+        None if it can not carry on yet.  Given the state left by an
+        earlier call, carries on from it rather than starting over.
+
+        Like calculate(), this parent class version is for testing and
+        demonstration only; it returns the high of the day so far at
+        each candle.  state holds the local day number and high of the
+        last candle.
+        """
+        hods = values.copy()
+        if len(epochs) == 0:
+            return hods, np.ones(0, dtype=bool), state
+        days = (epochs + _local_offsets(epochs)) // 86400
+        if state is not None and days[0] == state["day"]:
+            hods[0] = max(hods[0], state["hod"])
+        bounds = np.concatenate(([0],
+                                 np.flatnonzero(np.diff(days)) + 1,
+                                 [len(days)]))
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            np.maximum.accumulate(hods[start:end], out=hods[start:end])
+
+        return (hods,
+                np.ones(len(hods), dtype=bool),
+                {"day": int(days[-1]), "hod": float(hods[-1])})
+
+    def calculate_values(self):
+        """Return this indicator's series without building datapoints.
+
+        Returns a list of datetime strings and a float64 array of values
+        rounded to 2 places, one per candle that gets a datapoint.  Also
+        records in state where the calculation stopped, for update().
+        """
+        epochs, values = self._series_values()
+
+        return epochs_to_dt_strs(epochs).tolist(), values
+
+    def _series_values(self):
+        """Return epochs and rounded values of calculate_values().
+
+        calculate() builds datapoints from these, so datetime strings are
+        only made when calculate_values() returns them.
+        """
+        if self.candle_chart is None:
+            self.load_underlying_chart()
+        if not isinstance(self.candle_chart, Chart):
+            raise TypeError(f"candle_chart {type(self.candle_chart)} must be a"
+                            " <class dhtypes.Chart> object")
+        self.candle_chart.sort_candles()
+        epochs, field_values = self._chart_values(self._SERIES_FIELD)
+        values, kept, state = self._calculate_series(epochs, field_values)
+        self.state = self._state_at(epochs, state)
+
+        return epochs[kept], round_values(values[kept])
+
+    def _state_at(self, epochs: np.ndarray, state: dict):
+        """Return state marked with the last calculated datetime."""
+        if state is None or len(epochs) == 0:
+            return None
+
+        return dict(state, dt=dt_as_str(dt_from_epoch(int(epochs[-1]))))
+
+    def update(self, chart_registry=None):
+        """Calculate datapoints only for candles after the last calculated.
+
+        Rather than recalculating from start_dt, carries on from the state
+        left by the last calculate() or update(), which store_indicator()
+        keeps with the indicator.  Only candles after the state's dt up to
+        end_dt are loaded and calculated, and their datapoints appended to
+        datapoints, so storing the indicator afterwards writes just those.
+        Returns the new datapoints.
+
+        The new candles are loaded into a separate chart.  A candle_chart
+        that is already loaded has them added, so it still covers every
+        calculated candle for a later calculate().
+
+        Without a state to carry on from, such as before the first
+        calculation or while too few candles have been seen, falls back to
+        calculate() and returns all datapoints.
+        """
+        if not self.state:
+            log.info(f"{self.ind_id} has no state to carry on from, "
+                     "calculating from start_dt")
+            self.calculate()
+            return self.datapoints
+        chart = self._load_chart(chart_registry=chart_registry,
+                                 start_dt=self.state["dt"],
+                                 )
+        if not isinstance(chart, Chart):
+            raise TypeError(f"candle_chart {type(chart)} must be a"
+                            " <class dhtypes.Chart> object")
+        chart.sort_candles()
+        if self.candle_chart is not None:
+            self._extend_chart(chart)
+        epochs, field_values = self._chart_values(self._SERIES_FIELD,
+                                                  chart=chart)
+        # The chart starts at the last calculated candle, skip it
+        first = int(np.searchsorted(epochs, dt_to_epoch(self.state["dt"]),
+                                    side="right"))
+        epochs = epochs[first:]
+        if len(epochs) == 0:
+            return self._datapoints_from_values([], [])
+        values, kept, state = self._calculate_series(epochs,
+                                                     field_values[first:],
+                                                     self.state)
+        self.state = self._state_at(epochs, state)
+        new_dps = self._datapoints_from_values(
+            epochs[kept], round_values(values[kept]))
+        self.datapoints.extend(new_dps)
+        log.info(f"{self.ind_id} updated with {len(new_dps)} datapoints "
+                 f"through {self.state['dt']}")
+
+        return new_dps
+
+    def _extend_chart(self, chart):
+        """Add candles of chart after the end of candle_chart to it."""
+        existing = self.candle_chart.epoch_index()
+        candles = chart.c_candles
+        if len(existing) > 0:
+            if isinstance(candles, CandleFrame):
+                candles = candles[candles.c_epoch > existing[-1]]
+            else:
+                candles = [c for c in candles if c.c_epoch > existing[-1]]
+        self.candle_chart.add_candles(candles)
+        self.candle_chart.c_end = max(self.candle_chart.c_end,
+                                      dt_as_str(self.end_dt))
 
     def datapoint_indexes_by_epoch(self):
-        """Return a dict mapping each datapoint's epoch to its list index."""
-        result = {}
-        for i, dp in enumerate(self.datapoints):
-            result[dp.epoch] = i
-        return result
+        """Return a dict mapping each datapoint's epoch to its index.
+
+        For single lookups datapoints.index_of() avoids building a dict.
+        """
+        epochs = self.datapoints.epochs
+        return dict(zip(epochs.tolist(), range(len(epochs))))
 
     def datapoint_indexes_by_dt(self):
-        """Return a dict mapping each datapoint's dt to its list index."""
-        result = {}
-        for i, dp in enumerate(self.datapoints):
-            result[dp.dt] = i
-        return result
+        """Return a dict mapping each datapoint's dt to its index."""
+        epochs = self.datapoints.epochs
+        return dict(zip(epochs_to_dt_strs(epochs).tolist(),
+                        range(len(epochs))))
 
     def calculate(self):
         """This method will be specific to each type of indicator.
@@ -1984,24 +4922,10 @@ class Indicator():
         # subclass and rewrite this method based on the specific needs of
         # your target indicator.
         log_say("Parent class calculations are for testing purposes only")
-        # For demo purposes, let's calculate the high of the day
-        self.datapoints = []
-        hod = 0
-        prev_day = dt_as_dt("1900-01-01 00:00:00").date()
-        for c in self.candle_chart.c_candles:
-            today = dt_as_dt(c.c_datetime).date()
-            # Reset HOD for first candle of a new day
-            if today > prev_day:
-                prev_day = today
-                hod = c.c_high
-            else:
-                hod = max(hod, c.c_high)
-            self.datapoints.append(IndicatorDataPoint(dt=c.c_datetime,
-                                                      value=hod,
-                                                      ind_id=self.ind_id,
-                                                      name=self.name,
-                                                      ))
-        self.sort_datapoints()
+        # For demo purposes, let's calculate the high of the day, see
+        # _calculate_series()
+        self.datapoints = self._datapoints_from_values(
+            *self._series_values())
 
         return True
 
@@ -2018,8 +4942,7 @@ class Indicator():
         previous and next requests.
         """
         can_dt = this_candle_start(dt=dt, timeframe=self.timeframe)
-        index = next((i for i, dp in enumerate(self.datapoints)
-                      if dt_as_dt(dp.dt) == dt_as_dt(can_dt)), None)
+        index = self.datapoints.index_of(dt_to_epoch(can_dt))
         # If no datapoints was found, return None
         if index is None:
             return None
@@ -2051,6 +4974,8 @@ class IndicatorSMA(Indicator):
     (default: 'close') to specify which candle value to average.
     """
 
+    _SERIES_FIELD: str = "c_close"
+
     def __init__(self,
                  description,
                  timeframe,
@@ -2066,6 +4991,8 @@ class IndicatorSMA(Indicator):
                  name="SMA",
                  datapoints=None,
                  parameters={},
+                 chart_registry=None,
+                 state: dict = None,
                  ):
         super().__init__(name=name,
                          description=description,
@@ -2078,9 +5005,11 @@ class IndicatorSMA(Indicator):
                          end_dt=end_dt,
                          ind_id=ind_id,
                          autoload_chart=autoload_chart,
+                         chart_registry=chart_registry,
                          candle_chart=candle_chart,
                          datapoints=datapoints,
                          parameters=parameters,
+                         state=state,
                          )
         # Confirm that parameters includes the subclass specific arguments
         # needed for this type of indicator
@@ -2105,44 +5034,32 @@ class IndicatorSMA(Indicator):
             self.ind_id += ind_id_suffix
         self.class_name = "IndicatorSMA"
 
+    def _calculate_series(self,
+                          epochs: np.ndarray,
+                          closes: np.ndarray,
+                          state: dict = None,
+                          ):
+        """Return simple moving averages of closes.
+
+        The whole series is computed from one running sum rather than a
+        window per candle.  state holds the closes of the last length - 1
+        candles calculated, which start the windows of the next ones.
+        """
+        tail = [] if state is None else state["closes"]
+        values = np.concatenate((tail, closes))
+        means = sma(values, self.length)[len(tail):]
+        tail = values[max(0, len(values) - (self.length - 1)):]
+
+        return means, ~np.isnan(means), {"closes": tail.tolist()}
+
     def calculate(self):
         """Calculate a simple moving average over time.
 
-        Defaults to using the 'close' value of each candle.
+        Defaults to using the 'close' value of each candle.  Datapoints
+        are built from the series of calculate_values().
         """
-        if self.candle_chart is None:
-            self.load_underlying_chart()
-        if not isinstance(self.candle_chart, Chart):
-            raise TypeError(f"candle_chart {type(self.candle_chart)} must be a"
-                            " <class dhtypes.Chart> object")
-        self.candle_chart.sort_candles()
-
-        # Subclass specific functionality starts here
-        self.datapoints = []
-        counter = 0
-        # Build a working list of the same length as our SMA
-        values = []
-        while counter < self.length:
-            values.append(0)
-            counter += 1
-        counter = 0
-        # Work through candles, updating/calcing from the working list
-        for c in self.candle_chart.c_candles:
-            # Drop the oldest value and add the current to the end of the list
-            values = values[1:]
-            if self.method == "close":
-                values.append(c.c_close)
-            else:
-                raise ValueError(f"Unsupported method: {self.method}")
-            # Once enough candles are in the working list, calc the datapoint
-            if counter >= (self.length - 1):
-                dp = IndicatorDataPoint(dt=dt_as_str(c.c_datetime),
-                                        value=round(fmean(values), 2),
-                                        ind_id=self.ind_id,
-                                        name=self.name,
-                                        )
-                self.datapoints.append(dp)
-            counter += 1
+        self.datapoints = self._datapoints_from_values(
+            *self._series_values())
 
         return True
 
@@ -2160,6 +5077,8 @@ class IndicatorEMA(Indicator):
     in time.
     """
 
+    _SERIES_FIELD: str = "c_close"
+
     def __init__(self,
                  description,
                  timeframe,
@@ -2175,6 +5094,8 @@ class IndicatorEMA(Indicator):
                  name="EMA",
                  datapoints=None,
                  parameters={},
+                 chart_registry=None,
+                 state: dict = None,
                  ):
         super().__init__(name=name,
                          description=description,
@@ -2187,9 +5108,11 @@ class IndicatorEMA(Indicator):
                          end_dt=end_dt,
                          ind_id=ind_id,
                          autoload_chart=autoload_chart,
+                         chart_registry=chart_registry,
                          candle_chart=candle_chart,
                          datapoints=datapoints,
                          parameters=parameters,
+                         state=state,
                          )
         # Confirm that parameters includes the subclass specific arguments
         # needed for this type of indicator
@@ -2219,58 +5142,40 @@ class IndicatorEMA(Indicator):
             self.ind_id += ind_id_suffix
         self.class_name = "IndicatorEMA"
 
+    def _calculate_series(self,
+                          epochs: np.ndarray,
+                          closes: np.ndarray,
+                          state: dict = None,
+                          ):
+        """Return exponential moving averages of closes.
+
+        Only values from the first 4*length candles on are kept, see the
+        class docstring.  state holds the number of candles calculated
+        and the unrounded average at the last of them, once there is one.
+        """
+        count = 0
+        prior = None
+        if state is not None:
+            count = state["count"]
+            prior = state["prior"]
+        # ref: https://www.investopedia.com/terms/e/ema.asp
+        emas = ema(closes, self.length, self.smoothing, prior=prior)
+        kept = np.arange(count, count + len(closes)) >= self.length * 4
+        if len(emas) == 0 or np.isnan(emas[-1]):
+            return emas, kept, None
+
+        return emas, kept, {"count": count + len(closes),
+                            "prior": float(emas[-1])}
+
     def calculate(self):
         """Calculate an exponential simple moving average over time.
 
         Defaults to using the 'close' value of each candle and a smoothing
-        factor of 2.
+        factor of 2.  Datapoints are built from the series of
+        calculate_values().
         """
-        if self.candle_chart is None:
-            self.load_underlying_chart()
-        if not isinstance(self.candle_chart, Chart):
-            raise TypeError(f"candle_chart {type(self.candle_chart)} must be a"
-                            " <class dhtypes.Chart> object")
-        self.candle_chart.sort_candles()
-        # Subclass specific functionality starts here
-        self.datapoints = []
-        counter = 0
-        # Build an initial SMA to use on the first EMA datapoint
-        starting_values = []
-        counter = 0
-        min_cans = self.length * 4
-        # Work through candles, updating/calcing from the working list
-        for c in self.candle_chart.c_candles:
-            # Until we reach length only build list of the initial candles
-            # which will be averaged to fudge a "prior_ema" for the first calc
-            if counter < self.length:
-                if self.method == "close":
-                    starting_values.append(c.c_close)
-                counter += 1
-            else:
-                # Use the initial simple average for the first prior_ema
-                # After this we'll always have a prior_ema from the prev calc
-                if counter == self.length:
-                    prior_ema = round(fmean(starting_values), 2)
-                if self.method == "close":
-                    v = c.c_close
-                s = self.smoothing
-                ln = self.length + 1
-                p = prior_ema
-                # Calculate
-                # ref: https://www.investopedia.com/terms/e/ema.asp
-                this_ema = (v * (s / ln)) + (p * (1 - (s / ln)))
-                # Only keep/ store once we reach the minimum needed to ensure
-                # accurate values.  See docstring for details.
-                if counter >= min_cans:
-                    dp = IndicatorDataPoint(dt=dt_as_str(c.c_datetime),
-                                            value=round(this_ema, 2),
-                                            ind_id=self.ind_id,
-                                            name=self.name,
-                                            )
-                    self.datapoints.append(dp)
-                # Update vars for next candle
-                prior_ema = this_ema
-                counter += 1
+        self.datapoints = self._datapoints_from_values(
+            *self._series_values())
 
 
 class IndicatorRSI(Indicator):
@@ -2284,6 +5189,8 @@ class IndicatorRSI(Indicator):
                     wilder (default), simple, exponential.
     """
 
+    _SERIES_FIELD: str = "c_close"
+
     def __init__(self,
                  description,
                  timeframe,
@@ -2299,6 +5206,8 @@ class IndicatorRSI(Indicator):
                  name="RSI",
                  datapoints=None,
                  parameters={},
+                 chart_registry=None,
+                 state: dict = None,
                  ):
         super().__init__(name=name,
                          description=description,
@@ -2311,9 +5220,11 @@ class IndicatorRSI(Indicator):
                          end_dt=end_dt,
                          ind_id=ind_id,
                          autoload_chart=autoload_chart,
+                         chart_registry=chart_registry,
                          candle_chart=candle_chart,
                          datapoints=datapoints,
                          parameters=parameters,
+                         state=state,
                          )
         self.period = int(parameters.get("period", 14))
         if self.period <= 0:
@@ -2340,97 +5251,186 @@ class IndicatorRSI(Indicator):
             self.ind_id += ind_id_suffix
         self.class_name = "IndicatorRSI"
 
-    def _calc_rsi(self,
-                  avg_gain: float,
-                  avg_loss: float,
-                  ) -> float:
-        """Return RSI for the given average gain/loss pair."""
-        if avg_loss == 0 and avg_gain == 0:
-            return 50.0
-        if avg_loss == 0:
-            return 100.0
-        if avg_gain == 0:
-            return 0.0
-        rs = avg_gain / avg_loss
-        return 100.0 - (100.0 / (1.0 + rs))
+    def _calculate_series(self,
+                          epochs: np.ndarray,
+                          closes: np.ndarray,
+                          state: dict = None,
+                          ):
+        """Return relative strength index values of closes.
+
+        For wilder and exponential smoothing state holds the last close
+        and the unrounded average gain and loss at it, once there are
+        any.  For simple smoothing it holds the last period closes, which
+        start the windows of the next candles.
+        """
+        if self.smoothing == "simple":
+            tail = [] if state is None else state["closes"]
+            values = np.concatenate((tail, closes))
+            rsis = rsi(values, self.period, self.smoothing)[len(tail):]
+            tail = values[max(0, len(values) - self.period):]
+            return rsis, ~np.isnan(rsis), {"closes": tail.tolist()}
+        prior = None
+        if state is not None:
+            prior = (state["close"], state["avg_gain"], state["avg_loss"])
+        avg_gain, avg_loss = rsi_averages(closes,
+                                          self.period,
+                                          self.smoothing,
+                                          prior=prior,
+                                          )
+        rsis = rsi_from_averages(avg_gain, avg_loss)
+        if len(rsis) == 0 or np.isnan(rsis[-1]):
+            return rsis, ~np.isnan(rsis), None
+
+        return rsis, ~np.isnan(rsis), {"close": float(closes[-1]),
+                                       "avg_gain": float(avg_gain[-1]),
+                                       "avg_loss": float(avg_loss[-1]),
+                                       }
 
     def calculate(self):
         """Calculate relative strength index over time.
 
         Defaults to close values, period=14, and Wilder smoothing.
+        Datapoints are built from the series of calculate_values().
         """
-        if self.candle_chart is None:
-            self.load_underlying_chart()
-        if not isinstance(self.candle_chart, Chart):
-            raise TypeError(f"candle_chart {type(self.candle_chart)} must be "
-                            "a <class dhtypes.Chart> object")
-        self.candle_chart.sort_candles()
+        self.datapoints = self._datapoints_from_values(
+            *self._series_values())
 
-        self.datapoints = []
-        closes = []
-        for c in self.candle_chart.c_candles:
-            if self.method == "close":
-                closes.append(c.c_close)
+        return True
 
-        if len(closes) <= self.period:
-            return True
 
-        deltas = []
-        for i in range(1, len(closes)):
-            deltas.append(closes[i] - closes[i - 1])
+class IndicatorSweep():
+    """Calculates many parameter sets of one Indicator subclass together.
 
-        gains = [max(d, 0.0) for d in deltas]
-        losses = [max(-d, 0.0) for d in deltas]
+    Strategy research compares many lengths or periods of the same
+    indicator over the same candles.  Rather than building, loading, and
+    calculating a separate Indicator for each, a sweep builds one
+    Indicator per parameter set over a single shared candle_chart and
+    calculates them all in one pass, sharing the closes, running sums,
+    and gains and losses between them.  Each Indicator in indicators
+    gets the ind_id and datapoints it would have had on its own.
 
-        avg_gain = fmean(gains[:self.period])
-        avg_loss = fmean(losses[:self.period])
+    Supports IndicatorSMA, IndicatorEMA, and IndicatorRSI.
+    """
 
-        first_candle = self.candle_chart.c_candles[self.period]
-        first_rsi = self._calc_rsi(avg_gain, avg_loss)
-        self.datapoints.append(
-            IndicatorDataPoint(dt=dt_as_str(first_candle.c_datetime),
-                               value=round(first_rsi, 2),
-                               ind_id=self.ind_id,
-                               name=self.name,
-                               )
-        )
+    def __init__(self,
+                 indicator_class,
+                 candle_chart,
+                 parameter_sets: list,
+                 description: str,
+                 calc_version: str,
+                 calc_details: str,
+                 ):
+        supported_classes = [IndicatorSMA, IndicatorEMA, IndicatorRSI]
+        if indicator_class not in supported_classes:
+            raise TypeError(f"indicator_class {indicator_class} not "
+                            f"supported, must be one of: {supported_classes}")
+        if not isinstance(candle_chart, Chart):
+            raise TypeError(f"candle_chart {type(candle_chart)} must be a"
+                            " <class dhtypes.Chart> object")
+        if len(parameter_sets) == 0:
+            raise ValueError("Must provide at least one parameter set")
+        self.indicator_class = indicator_class
+        self.candle_chart = candle_chart
+        self.indicators = [
+            indicator_class(description=description,
+                            timeframe=candle_chart.c_timeframe,
+                            trading_hours=candle_chart.c_trading_hours,
+                            symbol=candle_chart.c_symbol,
+                            calc_version=calc_version,
+                            calc_details=calc_details,
+                            start_dt=candle_chart.c_start,
+                            end_dt=candle_chart.c_end,
+                            autoload_chart=False,
+                            candle_chart=candle_chart,
+                            parameters=dict(p),
+                            )
+            for p in parameter_sets]
 
-        if self.smoothing == "simple":
-            for idx in range(self.period + 1, len(closes)):
-                start = idx - self.period
-                end = idx
-                avg_gain = fmean(gains[start:end])
-                avg_loss = fmean(losses[start:end])
-                rsi = self._calc_rsi(avg_gain, avg_loss)
-                c = self.candle_chart.c_candles[idx]
-                self.datapoints.append(
-                    IndicatorDataPoint(dt=dt_as_str(c.c_datetime),
-                                       value=round(rsi, 2),
-                                       ind_id=self.ind_id,
-                                       name=self.name,
-                                       )
-                )
-            return True
+    def __len__(self):
+        """Return the number of parameter sets in this sweep."""
+        return len(self.indicators)
+
+    def __str__(self):
+        """Return a string summary of this sweep."""
+        return (f"IndicatorSweep({self.indicator_class.__name__}, "
+                f"{[i.ind_id for i in self.indicators]})")
+
+    def __repr__(self):
+        """Return a string summary of this sweep."""
+        return str(self)
+
+    def calculate_values(self):
+        """Return every parameter set's series without datapoints.
+
+        Returns a list of datetime strings, one per candle, and a float64
+        array with one row per parameter set and one column per candle.
+        Values are rounded to 2 places and are NaN wherever that
+        Indicator's own calculate() would keep no datapoint.
+        """
+        epochs, values = self._sweep_values()
+
+        return epochs_to_dt_strs(epochs).tolist(), values
 
-        if self.smoothing == "wilder":
-            alpha = 1 / self.period
+    def _sweep_values(self):
+        """Return candle epochs and the rounded rows of calculate_values().
+
+        Also records in each Indicator's state where its calculation
+        stopped, as its own calculate_values() would, so update() can
+        carry on from it.
+        """
+        self.candle_chart.sort_candles()
+        epochs, closes = self.indicators[0]._chart_values("c_close")
+        if self.indicator_class is IndicatorSMA:
+            values = sma_sweep(closes, [i.length for i in self.indicators])
+            states = [{"closes": closes[max(0, len(closes)
+                                            - (i.length - 1)):].tolist()}
+                      for i in self.indicators]
+        elif self.indicator_class is IndicatorEMA:
+            values = ema_sweep(closes,
+                               [i.length for i in self.indicators],
+                               [i.smoothing for i in self.indicators],
+                               )
+            states = [None if len(row) == 0 or np.isnan(row[-1])
+                      else {"count": len(closes), "prior": float(row[-1])}
+                      for row in values]
+            # See IndicatorEMA for why early values are not kept
+            for k, i in enumerate(self.indicators):
+                values[k, :i.length * 4] = np.nan
         else:
-            alpha = 2 / (self.period + 1)
-
-        for idx in range(self.period, len(deltas)):
-            gain = gains[idx]
-            loss = losses[idx]
-            avg_gain = (gain * alpha) + (avg_gain * (1 - alpha))
-            avg_loss = (loss * alpha) + (avg_loss * (1 - alpha))
-            rsi = self._calc_rsi(avg_gain, avg_loss)
-            c = self.candle_chart.c_candles[idx + 1]
-            self.datapoints.append(
-                IndicatorDataPoint(dt=dt_as_str(c.c_datetime),
-                                   value=round(rsi, 2),
-                                   ind_id=self.ind_id,
-                                   name=self.name,
-                                   )
-            )
+            avg_gain, avg_loss = rsi_sweep_averages(
+                closes,
+                [i.period for i in self.indicators],
+                [i.smoothing for i in self.indicators],
+                )
+            values = rsi_from_averages(avg_gain, avg_loss)
+            states = []
+            for k, i in enumerate(self.indicators):
+                if i.smoothing == "simple":
+                    states.append({"closes": closes[
+                        max(0, len(closes) - i.period):].tolist()})
+                elif len(closes) == 0 or np.isnan(values[k, -1]):
+                    states.append(None)
+                else:
+                    states.append({"close": float(closes[-1]),
+                                   "avg_gain": float(avg_gain[k, -1]),
+                                   "avg_loss": float(avg_loss[k, -1]),
+                                   })
+        for ind, state in zip(self.indicators, states):
+            ind.state = ind._state_at(epochs, state)
+
+        return epochs, round_values(values)
+
+    def calculate(self):
+        """Calculate datapoints for every Indicator in this sweep.
+
+        Datapoints are built from the rows of calculate_values() and match
+        those each Indicator's own calculate() would produce.
+        """
+        epochs, values = self._sweep_values()
+        for ind, row in zip(self.indicators, values):
+            kept = ~np.isnan(row)
+            ind.datapoints = ind._datapoints_from_values(epochs[kept],
+                                                         row[kept])
 
         return True
 
@@ -2689,21 +5689,23 @@ class Trade():
                                  "prof_target (or both).  Neither was passed")
             else:
                 # Need to calculate prof_ticks
-                self.prof_ticks = ((self.prof_target - self.entry_price)
-                                   * self.flipper
-                                   / self.symbol.tick_size)
+                self.prof_ticks = (self.symbol.price_to_ticks(
+                    self.prof_target - self.entry_price) * self.flipper)
         else:
             if self.prof_target is None:
                 # Need to calculate prof_target
-                self.prof_target = self.entry_price + ((self.prof_ticks
-                                                       * self.flipper)
-                                                       * self.symbol.tick_size)
+                self.prof_target = (self.entry_price
+                                    + self.symbol.ticks_to_price(
+                                        self.prof_ticks * self.flipper))
             else:
-                # Both provided, make sure they math out correctly
-                pt = self.entry_price + ((self.prof_ticks
-                                         * self.flipper)
-                                         * self.symbol.tick_size)
-                if not pt == self.prof_target:
+                # Both provided, make sure they math out correctly in
+                # whole ticks where float prices could disagree by drift
+                pt = (self.entry_price
+                      + self.symbol.ticks_to_price(self.prof_ticks
+                                                   * self.flipper))
+                target_ticks = (self.symbol.price_to_ticks(
+                    self.prof_target - self.entry_price) * self.flipper)
+                if not target_ticks == self.prof_ticks:
                     msg = (f"Provided prof_target does not match prof_ticks "
                            "calculation against entry_price.  These numbers "
                            "cannot be trusted for later calculations.  "
@@ -2721,21 +5723,23 @@ class Trade():
                                  "stop_target (or both).  Neither was passed")
             else:
                 # Need to calculate stop_ticks
-                self.stop_ticks = ((self.entry_price - self.stop_target)
-                                   * self.flipper
-                                   / self.symbol.tick_size)
+                self.stop_ticks = (self.symbol.price_to_ticks(
+                    self.entry_price - self.stop_target) * self.flipper)
         else:
             if self.stop_target is None:
                 # Need to calculate stop_target
-                self.stop_target = self.entry_price - ((self.stop_ticks
-                                                       * self.flipper)
-                                                       * self.symbol.tick_size)
+                self.stop_target = (self.entry_price
+                                    - self.symbol.ticks_to_price(
+                                        self.stop_ticks * self.flipper))
             else:
-                # Both provided, make sure they math out correctly
-                st = self.entry_price - ((self.stop_ticks
-                                         * self.flipper)
-                                         * self.symbol.tick_size)
-                if not st == self.stop_target:
+                # Both provided, make sure they math out correctly in
+                # whole ticks where float prices could disagree by drift
+                st = (self.entry_price
+                      - self.symbol.ticks_to_price(self.stop_ticks
+                                                   * self.flipper))
+                target_ticks = (self.symbol.price_to_ticks(
+                    self.entry_price - self.stop_target) * self.flipper)
+                if not target_ticks == self.stop_ticks:
                     msg = (f"Provided stop_target does not match stop_ticks "
                            "calculation against entry_price.  These numbers "
                            "cannot be trusted for later calculations.  "
@@ -2872,7 +5876,7 @@ class Trade():
         if not self.is_open:
             raise Exception("Cannot run update() on a closed Trade, this "
                             "would break reality.")
-        if not isinstance(candle, Candle):
+        if not isinstance(candle, (Candle, LazyCandle)):
             raise TypeError(
                 f"candle {candle} must be a dhtypes.Candle object, "
                 f"we got a {type(candle)} instead"
@@ -2949,6 +5953,30 @@ class Trade():
         else:
             return {"closed": False}
 
+    def _price_moves(self):
+        """Return max gain, max loss, and exit price moves of the trade.
+
+        Moves on the tick grid are measured in whole ticks and converted
+        back to price, so each is an exact multiple of tick_size in the
+        trade's favor.  Trade() and close() accept prices between ticks,
+        and moves from those are kept as plain float differences.
+        """
+        if self.direction == "long":
+            moves = [self.high_price - self.entry_price,
+                     self.entry_price - self.low_price]
+        else:
+            moves = [self.entry_price - self.low_price,
+                     self.high_price - self.entry_price]
+        moves.append((self.exit_price - self.entry_price) * self.flipper)
+        result = []
+        for move in moves:
+            ticks = self.symbol.price_to_ticks_or_none(move)
+            if ticks is not None:
+                move = self.symbol.ticks_to_price(ticks)
+            result.append(move)
+
+        return tuple(result)
+
     def drawdown_impact(self,
                         drawdown_open: float,
                         drawdown_limit: float,
@@ -2965,13 +5993,8 @@ class Trade():
         if self.is_open:
             return None
         fees = contracts * contract_fee
-        # Determine max gain and loss prices seen during trade
-        if self.direction == "long":
-            max_gain = self.high_price - self.entry_price
-            max_loss = self.entry_price - self.low_price
-        elif self.direction == "short":
-            max_gain = self.entry_price - self.low_price
-            max_loss = self.high_price - self.entry_price
+        # Determine max gain, max loss, and exit moves seen during trade
+        max_gain, max_loss, exit_move = self._price_moves()
         # Use these to calculate highest and lowest drawdown distances seen
         cmult = contracts * contract_value
         drawdown_high = drawdown_open + (max_gain * cmult)
@@ -2982,15 +6005,14 @@ class Trade():
             drawdown_trail_increase = 0
         # Calculate the closing drawdown level i.e. where it will be after
         # the trade is finished including any adjustment for trailing increase
-        drawdown_close = (((self.exit_price - self.entry_price)
-                          * self.flipper
-                          * cmult)
+        drawdown_close = ((exit_move * cmult)
                           + drawdown_open
                           - drawdown_trail_increase
                           - fees)
         # Closing drawdown cannot exceed drawdown limit on account
         drawdown_close = min(drawdown_close, drawdown_limit)
-        # Round results because float math anomalies create trailing decimals
+        # Price moves are exact but fees and running dollar values are not,
+        # round results because float math creates trailing decimals
         drawdown_open = round(drawdown_open, 2)
         drawdown_close = round(drawdown_close, 2)
         drawdown_high = round(drawdown_high, 2)
@@ -3019,25 +6041,18 @@ class Trade():
         if self.is_open:
             return None
         fees = contracts * contract_fee
-        # Determine max gain and loss prices seen during trade
-        if self.direction == "long":
-            max_gain = self.high_price - self.entry_price
-            max_loss = self.entry_price - self.low_price
-        elif self.direction == "short":
-            max_gain = self.entry_price - self.low_price
-            max_loss = self.high_price - self.entry_price
+        # Determine max gain, max loss, and exit moves seen during trade
+        max_gain, max_loss, exit_move = self._price_moves()
         # Use these to calculate highest and lowest balances seen
         cmult = contracts * contract_value
         balance_high = balance_open + (max_gain * cmult) - fees
         balance_low = balance_open - (max_loss * cmult) - fees
         # Calculate gain/loss of the trade
-        gain_loss = (((self.exit_price - self.entry_price)
-                     * contracts * contract_value * self.flipper)
-                     - fees)
+        gain_loss = (exit_move * contracts * contract_value) - fees
         # Closing balance is just the difference from opening balance
         balance_close = round((balance_open + gain_loss), 2)
-        # Round results because float math anomalies create trailing decimals
-        balance_close = round(balance_close, 2)
+        # Price moves are exact but fees and running dollar values are not,
+        # round results because float math creates trailing decimals
         balance_high = round(balance_high, 2)
         balance_low = round(balance_low, 2)
         gain_loss = round(gain_loss, 2)
@@ -3635,6 +6650,9 @@ class Backtest():
         autoload_charts (bool): Whether to automatically load chart_tf and
             chart_1m from central storage at creation
             at creation (default True)
+        chart_registry (ChartRegistry): If given, autoloaded charts are
+            taken from this registry, e.g. CHART_REGISTRY, and shared with
+            other Backtests and Indicators.  Not kept on the object.
         prefer_stored (bool): If a backtest with the same bt_id is in storage,
             configure this object with it's configuration rather than creating
             a new backtest (default True)
@@ -3670,6 +6688,7 @@ class Backtest():
                  autoload_charts: bool = False,
                  prefer_stored: bool = True,
                  tradeseries: list = None,
+                 chart_registry=None,
                  ):
         self.start_dt = dt_as_str(start_dt)
         self.end_dt = dt_as_str(end_dt)
@@ -3706,7 +6725,7 @@ class Backtest():
         # Only load charts if this copy wasn't configured from storage
         # as config_from_storage will load charts via rerunning __init__
         if self.autoload_charts and not from_store:
-            self.load_charts()
+            self.load_charts(chart_registry=chart_registry)
 
     def __eq__(self, other):
         """Return True if all Backtest attributes are equal."""
@@ -3824,30 +6843,107 @@ class Backtest():
             indent=4,
             )
 
-    def load_charts(self):
+    def load_charts(self,
+                    as_frame: bool = False,
+                    resample: bool = False,
+                    chart_registry=None,
+                    chunk_days: int = None,
+                    ):
         """Load the Chart for this Backtest based on its datetimes and symbol.
 
         This is the base data for calculating trades.  Also restricts the
         Backtest's start_dt/end_dt to match the earliest and latest 1m
         candles available from storage to prevent future calculation gaps.
+
+        With as_frame=True both charts hold CandleFrames loaded without
+        building Candle objects; Candles are then built only when indexed.
+
+        With resample=True only 1m candles are read from storage and
+        chart_tf is built from them locally via Chart.resample().  The 1m
+        read runs to the end of the last timeframe candle so that candle
+        is complete, then chart_1m is trimmed back to end_dt.
+
+        With a chart_registry such as CHART_REGISTRY, charts are taken from
+        the registry instead of read from storage for this Backtest alone.
+
+        Otherwise chart_tf candles are read in a worker thread while
+        chart_1m is read and filtered, and chunk_days is passed on to
+        chart_1m's load_candles() to prefetch its next chunk while the
+        current one is filtered.
         """
-        # Build candle charts, retrieving candles from storage
-        self.chart_tf = Chart(c_timeframe=self.timeframe,
-                              c_trading_hours=self.trading_hours,
-                              c_symbol=self.symbol,
-                              c_start=self.start_dt,
-                              c_end=self.end_dt,
-                              autoload=True,
-                              )
-        self.chart_1m = Chart(c_timeframe="1m",
-                              c_trading_hours=self.trading_hours,
-                              c_symbol=self.symbol,
-                              c_start=self.start_dt,
-                              c_end=self.end_dt,
-                              autoload=True)
+        if resample:
+            tf_end = (this_candle_start(self.end_dt, self.timeframe)
+                      + timeframe_delta(self.timeframe)
+                      - timedelta(minutes=1))
+            if chart_registry is None:
+                self.chart_1m = Chart(c_timeframe="1m",
+                                      c_trading_hours=self.trading_hours,
+                                      c_symbol=self.symbol,
+                                      c_start=self.start_dt,
+                                      c_end=tf_end,
+                                      )
+                self.chart_1m.load_candles(as_frame=as_frame,
+                                           chunk_days=chunk_days,
+                                           )
+            else:
+                self.chart_1m = chart_registry.get_chart(
+                    c_timeframe="1m",
+                    c_trading_hours=self.trading_hours,
+                    c_symbol=self.symbol,
+                    c_start=self.start_dt,
+                    c_end=tf_end,
+                    as_frame=as_frame,
+                    )
+            self.chart_tf = self.chart_1m.resample(timeframe=self.timeframe)
+            if not as_frame:
+                self.chart_tf.c_candles = self.chart_tf.c_candles.to_candles()
+            self.chart_tf.restrict_dates(self.start_dt, self.end_dt)
+            self.chart_1m.restrict_dates(self.start_dt, self.end_dt)
+        elif chart_registry is not None:
+            self.chart_tf = chart_registry.get_chart(
+                c_timeframe=self.timeframe,
+                c_trading_hours=self.trading_hours,
+                c_symbol=self.symbol,
+                c_start=self.start_dt,
+                c_end=self.end_dt,
+                as_frame=as_frame,
+                )
+            self.chart_1m = chart_registry.get_chart(
+                c_timeframe="1m",
+                c_trading_hours=self.trading_hours,
+                c_symbol=self.symbol,
+                c_start=self.start_dt,
+                c_end=self.end_dt,
+                as_frame=as_frame,
+                )
+        else:
+            # Build candle charts, retrieving candles from storage.  The
+            # tf read overlaps the larger 1m read and filter.
+            self.chart_tf = Chart(c_timeframe=self.timeframe,
+                                  c_trading_hours=self.trading_hours,
+                                  c_symbol=self.symbol,
+                                  c_start=self.start_dt,
+                                  c_end=self.end_dt,
+                                  )
+            self.chart_1m = Chart(c_timeframe="1m",
+                                  c_trading_hours=self.trading_hours,
+                                  c_symbol=self.symbol,
+                                  c_start=self.start_dt,
+                                  c_end=self.end_dt,
+                                  )
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                tf_candles = pool.submit(self.chart_tf.fetch_candles,
+                                         as_frame=as_frame,
+                                         )
+                self.chart_1m.load_candles(as_frame=as_frame,
+                                           chunk_days=chunk_days,
+                                           )
+                self.chart_tf.load_candles(as_frame=as_frame,
+                                           candles=tf_candles.result(),
+                                           )
         # Limit the timeframe of the Backtest based on existing candles
-        self.start_dt = self.chart_1m.c_candles[0].c_datetime
-        self.end_dt = self.chart_1m.c_candles[-1].c_datetime
+        self.start_dt = self.chart_1m.earliest_candle
+        self.end_dt = self.chart_1m.latest_candle
         # And adjust the chart timeframes to match the Backtest
         self.chart_tf.c_start = self.start_dt
         self.chart_tf.c_end = self.end_dt
@@ -4008,7 +7104,8 @@ class Backtest():
 
         Args:
             candle_date (datetime.date): Date to check (must be datetime.date)
-            closed_events (list): List of Event objects with Closed category
+            closed_events (list): List of Event objects with Closed category,
+                                  or an EventIndex built from them
             default_autoclose: Default autoclose time, can be datetime.time or
                                str in "HH:MM:SS" format
 
@@ -4029,6 +7126,8 @@ class Backtest():
                             f"{type(candle_date).__name__}")
 
         # Find events that start on this date with Closed category
+        if isinstance(closed_events, EventIndex):
+            closed_events = closed_events.starting_on(candle_date)
         for event in closed_events:
             event_start_date = dt_as_dt(event.start_dt).date()
             # Check if event starts on this date and is a Closed event
@@ -4499,6 +7598,11 @@ __all__ = [
     "BEGINNING_OF_TIME",
     "MARKET_ERAS",
     "bot",
+    "this_candle_start_epochs",
+    "next_candle_start_epochs",
+    "expected_candle_epochs",
+    "epochs_to_dt_strs",
+    "dt_strs_to_epochs",
     "get_symbol_by_ticker",
     "get_candles",
     "get_events",
@@ -4515,14 +7619,22 @@ __all__ = [
     "delete_backtests",
     "Symbol",
     "Candle",
+    "LazyCandle",
+    "CandleFrame",
     "Chart",
+    "ChartRegistry",
+    "CHART_REGISTRY",
     "Event",
+    "EventIndex",
     "Day",
+    "DayBuilder",
     "IndicatorDataPoint",
+    "IndicatorDataPoints",
     "Indicator",
     "IndicatorSMA",
     "IndicatorEMA",
     "IndicatorRSI",
+    "IndicatorSweep",
     "Trade",
     "TradePlan",
     "TradeSeries",
@@ -9,11 +9,12 @@ from datetime import timedelta, datetime as dt
 import csv
 import sys
 from tabulate import tabulate
-from .dhtypes import Candle
+from .dhtypes import Candle, Chart
 from .dhstore import (
     get_symbol_by_ticker, get_candles, review_candles, store_candle)
 from .dhcommon import (
-    dt_as_dt, dt_as_str, dt_to_epoch, timeframe_delta, DEFAULT_OBJ_NAME)
+    dt_as_dt, dt_as_str, dt_to_epoch, timeframe_delta, this_candle_start,
+    DEFAULT_OBJ_NAME)
 
 
 def generate_zero_volume_candle(c_datetime,
@@ -135,13 +136,13 @@ def remediate_candle_gaps(timeframe: str = "1m",
         unclear_fix = []
         day_start = dt_as_dt(f"{d} 00:00:00") - delta
         day_end = dt_as_dt(f"{d} 23:59:59") + delta
-        # Build contexts per day for efficient reuse
-        eth_context = symbol.build_market_hours_context(
+        # Cached trading calendars are compiled once and shared by all days
+        eth_context = symbol.get_trading_calendar(
             trading_hours="eth",
             start_dt=day_start,
             end_dt=day_end,
         )
-        rth_context = symbol.build_market_hours_context(
+        rth_context = symbol.get_trading_calendar(
             trading_hours="rth",
             start_dt=day_start,
             end_dt=day_end,
@@ -428,6 +429,44 @@ def store_candles_from_csv(filepath: str,
     print(f"{len(new_candles)} candles retrieved successfully")
 
 
+def rebuild_candles_from_1m(timeframe: str,
+                            start_dt,
+                            end_dt,
+                            symbol: str = "ES",
+                            dry_run: bool = False,
+                            ):
+    """Recalculate and store higher timeframe candles from stored 1m candles.
+
+    Useful after remediating 1m gaps to refresh the affected higher
+    timeframe candles without a full reload.  Every timeframe candle
+    touching start_dt through end_dt is rebuilt in full, reading 1m
+    candles across the whole span of those candles.
+
+    dry_run: Calculate and return the candles without storing them.
+    """
+    trading_hours = "rth" if timeframe == "r1h" else "eth"
+    first = this_candle_start(start_dt, timeframe)
+    last = (this_candle_start(end_dt, timeframe) + timeframe_delta(timeframe)
+            - timedelta(minutes=1))
+    chart = Chart(c_timeframe="1m",
+                  c_trading_hours=trading_hours,
+                  c_symbol=symbol,
+                  c_start=first,
+                  c_end=last,
+                  )
+    chart.load_candles(as_frame=True)
+    candles = chart.resample(timeframe=timeframe).c_candles.to_candles()
+    print(f"{len(candles)} {symbol} {timeframe} candles rebuilt from "
+          f"{chart.candles_count} 1m candles between {dt_as_str(first)} "
+          f"and {dt_as_str(last)}")
+    if not dry_run:
+        for c in candles:
+            store_candle(c)
+        print(f"Stored {len(candles)} {timeframe} candles")
+
+    return candles
+
+
 def compare_candles_vs_csv(filepath,
                            timeframe: str = "1m",
                            symbol: str = "ES",
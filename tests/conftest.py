@@ -12,9 +12,14 @@ def assert_eq_fields_cover_instance(obj):
     Pass any object whose class defines _EQ_FIELDS and _EQ_EXCLUDE.
     Fails with a descriptive message if any instance attribute is unaccounted
     for, or if either frozenset references an attribute that no longer exists.
+    Classes using __slots__ instead of __dict__ are checked against their
+    slot names.
     """
     cls = type(obj)
-    all_attrs = set(obj.__dict__.keys())
+    if hasattr(obj, "__dict__"):
+        all_attrs = set(obj.__dict__.keys())
+    else:
+        all_attrs = set(cls.__slots__)
     accounted = cls._EQ_FIELDS | cls._EQ_EXCLUDE
     missing = all_attrs - accounted
     phantom = accounted - all_attrs
@@ -5,18 +5,28 @@ from datetime import datetime, timedelta, date
 from dhtrader import (
     bot,
     check_tf_th_compatibility,
+    clear_dt_caches,
     diff_dicts,
     dow_name,
     dt_as_dt,
     dt_as_str,
     dt_as_time,
     dt_from_epoch,
+    dt_strs_to_epochs,
     dt_to_epoch,
+    epochs_to_dt_strs,
+    Event,
+    expected_candle_datetimes,
+    expected_candle_epochs,
     log_say,
+    next_candle_start,
+    next_candle_start_epochs,
     OperationTimer,
     rangify_candle_times,
     sort_dict,
+    Symbol,
     this_candle_start,
+    this_candle_start_epochs,
     timeframe_delta,
     valid_timeframe,
     valid_trading_hours,
@@ -338,6 +348,38 @@ def test_dt_from_epoch():
     assert dt_as_str(result) == "2099-01-15 10:30:00"
 
 
+@pytest.mark.suppress_stdout
+def test_dt_string_conversions_match_datetime():
+    """Verify cached string parsing and the array converters agree with
+    datetime arithmetic, including across both DST transitions."""
+    clear_dt_caches()
+    # Canonical and shorthand strings parse the same as before caching
+    assert dt_as_dt("2099-01-15 10:30:00") == datetime(2099, 1, 15, 10, 30)
+    assert dt_as_dt("99-1-15 9:30:00") == datetime(2099, 1, 15, 9, 30)
+    assert dt_as_str(datetime(2099, 1, 15, 10, 30, 5, 123)) == (
+        "2099-01-15 10:30:05")
+    for bad in ["", "2099-13-01 00:00:00", "2099-01-15T10:30:00", "x"]:
+        with pytest.raises(ValueError):
+            dt_as_dt(bad)
+    # Minutes spanning the spring gap and the repeated fall hour
+    for day in ["2024-03-10 00:00:00", "2024-11-03 00:00:00"]:
+        start = dt_to_epoch(day)
+        epochs = list(range(start, start + 86400, 60))
+        strs = epochs_to_dt_strs(epochs)
+        assert strs.tolist() == [dt_as_str(dt_from_epoch(e))
+                                 for e in epochs]
+        assert dt_strs_to_epochs(strs).tolist() == [dt_to_epoch(s)
+                                                    for s in strs.tolist()]
+    # A gap minute resolves as dt_to_epoch does, and non-canonical
+    # strings fall back to the scalar parser
+    mixed = ["2024-03-10 02:30:00", "2024-11-03 01:30:00",
+             "99-1-15 9:30:00", " 2099-01-15 10:30:00 "]
+    assert dt_strs_to_epochs(mixed).tolist() == [dt_to_epoch(m)
+                                                 for m in mixed]
+    with pytest.raises(ValueError):
+        dt_strs_to_epochs(["2099-01-15 10:30:00", "2099-02-30 00:00:00"])
+
+
 @pytest.mark.suppress_stdout
 def test_timeframe_delta():
     """Verify timeframe_delta returns correct timedelta for each timeframe."""
@@ -461,6 +503,105 @@ def test_this_candle_start():
         this_candle_start("2099-01-15 10:00:00", "invalid")
 
 
+@pytest.mark.suppress_stdout
+@pytest.mark.parametrize("start,trading_hours,timeframe,expected", [
+    ("2024-07-12 16:58:30", "eth", "1m", "2024-07-12 16:59:00"),
+    # Weekend and overnight closures are jumped in one step
+    ("2024-07-12 16:59:00", "eth", "1m", "2024-07-14 18:00:00"),
+    ("2024-07-12 16:30:00", "eth", "e1h", "2024-07-14 18:00:00"),
+    ("2024-07-15 15:57:00", "rth", "5m", "2024-07-16 09:30:00"),
+    # Closure events push past their end to the next aligned start
+    ("2024-07-12 15:57:00", "rth", "5m", "2024-07-15 12:05:00"),
+    ("2024-07-12 15:50:00", "rth", "15m", "2024-07-15 12:15:00"),
+    ("2024-07-12 15:50:00", "rth", "r1h", "2024-07-15 12:30:00"),
+])
+def test_next_candle_start(start, trading_hours, timeframe, expected):
+    """Verify next_candle_start skips closed periods and closure events."""
+    symbol = Symbol(ticker="ES", name="ES", leverage_ratio=50,
+                    tick_size=0.25)
+    events = [Event(start_dt="2024-07-15 09:00:00",
+                    end_dt="2024-07-15 12:00:00",
+                    symbol="ES",
+                    category="Closed",
+                    tags=["test"],
+                    notes="next-candle-check",
+                    )]
+    result = next_candle_start(dt=start,
+                               trading_hours=trading_hours,
+                               symbol=symbol,
+                               timeframe=timeframe,
+                               events=events,
+                               )
+    assert dt_as_str(result) == expected
+    with pytest.raises(TypeError):
+        next_candle_start(dt=start, trading_hours=trading_hours,
+                          symbol="ES", timeframe=timeframe)
+
+
+@pytest.mark.suppress_stdout
+def test_candle_start_epochs_match_scalar():
+    """Verify batch candle start variants match the scalar functions."""
+    symbol = Symbol(ticker="ES", name="ES", leverage_ratio=50,
+                    tick_size=0.25)
+    start = dt_to_epoch("2024-07-11 00:00:00")
+    # Every 7 minutes 13 seconds over several days including a weekend
+    epochs = list(range(start, start + (5 * 86400), 433))
+    for tf in ["1m", "5m", "15m", "r1h", "e1h", "e1d", "e1w"]:
+        expected = [dt_to_epoch(this_candle_start(dt_from_epoch(e), tf))
+                    for e in epochs]
+        assert this_candle_start_epochs(epochs, tf).tolist() == expected
+    for tf, th in [("1m", "eth"), ("5m", "rth"), ("15m", "eth"),
+                   ("r1h", "rth"), ("e1h", "eth"), ("e1d", "eth")]:
+        sample = epochs[::7]
+        expected = [dt_to_epoch(next_candle_start(dt=dt_from_epoch(e),
+                                                  trading_hours=th,
+                                                  symbol=symbol,
+                                                  timeframe=tf,
+                                                  ))
+                    for e in sample]
+        result = next_candle_start_epochs(sample,
+                                          trading_hours=th,
+                                          symbol=symbol,
+                                          timeframe=tf,
+                                          )
+        assert result.tolist() == expected
+    # Datetime strings are accepted as well as epochs
+    assert this_candle_start_epochs(["2024-07-11 10:37:45"], "15m")[0] == (
+        dt_to_epoch("2024-07-11 10:30:00"))
+
+
+@pytest.mark.suppress_stdout
+@pytest.mark.parametrize("start,end", [
+    # Spring forward weekend
+    ("2024-03-08 10:02:00", "2024-03-12 00:00:00"),
+    # Fall back weekend
+    ("2024-11-01 10:00:00", "2024-11-05 13:00:00"),
+    # Holiday week with closure events, one ending mid-bucket
+    ("2024-07-01 00:00:00", "2024-07-14 00:00:00"),
+])
+def test_expected_candle_epochs_match_datetimes(start, end):
+    """Verify expected_candle_epochs matches expected_candle_datetimes."""
+    symbol = Symbol(ticker="ES", name="ES", leverage_ratio=50,
+                    tick_size=0.25)
+    events = [Event(start_dt="2024-07-04 12:03:00",
+                    end_dt="2024-07-05 09:00:00",
+                    symbol="ES", category="Closed", notes="Holiday"),
+              Event(start_dt="2024-07-10 10:00:00",
+                    end_dt="2024-07-10 10:07:30",
+                    symbol="ES", category="Closed", notes="Halt"),
+              ]
+    for tf in ["1m", "5m", "15m", "r1h", "e1h", "e1d", "e1w"]:
+        expected = [dt_to_epoch(d) for d in expected_candle_datetimes(
+            start_dt=start, end_dt=end, timeframe=tf, symbol=symbol,
+            events=events)]
+        result = expected_candle_epochs(start_dt=start, end_dt=end,
+                                        timeframe=tf, symbol=symbol,
+                                        events=events)
+        assert result.tolist() == expected
+    with pytest.raises(TypeError):
+        expected_candle_epochs(start, end, "1m", "ES")
+
+
 @pytest.mark.suppress_stdout
 def test_rangify_candle_times():
     """Verify rangify_candle_times aggregates consecutive times into ranges."""
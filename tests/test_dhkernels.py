@@ -0,0 +1,152 @@
+"""Tests for dhkernels array calculation kernels."""
+from statistics import fmean
+import numpy as np
+import pytest
+from dhtrader.dhkernels import (
+    ema, ema_sweep, round_values, rsi, rsi_averages, rsi_sweep,
+    rsi_sweep_averages, sma, sma_sweep)
+
+TICKS = [5000 + (((i * 7919) % 103) * 0.25) for i in range(60)]
+CENTS = [44.34 + (((i * 31) % 17) * 0.07) for i in range(60)]
+
+
+def loop_rsi(closes, period, smoothing):
+    """Return RSI per candle from a plain loop over closes."""
+    def calc(g, lo):
+        if g == 0 and lo == 0:
+            return 50.0
+        if lo == 0:
+            return 100.0
+        if g == 0:
+            return 0.0
+        return 100.0 - (100.0 / (1.0 + (g / lo)))
+    deltas = [closes[i] - closes[i - 1] for i in range(1, len(closes))]
+    gains = [max(d, 0.0) for d in deltas]
+    losses = [max(-d, 0.0) for d in deltas]
+    g = fmean(gains[:period])
+    lo = fmean(losses[:period])
+    results = [calc(g, lo)]
+    if smoothing == "simple":
+        for idx in range(period + 1, len(closes)):
+            results.append(calc(fmean(gains[idx - period:idx]),
+                                fmean(losses[idx - period:idx])))
+        return results
+    alpha = 1 / period if smoothing == "wilder" else 2 / (period + 1)
+    for idx in range(period, len(deltas)):
+        g = (gains[idx] * alpha) + (g * (1 - alpha))
+        lo = (losses[idx] * alpha) + (lo * (1 - alpha))
+        results.append(calc(g, lo))
+    return results
+
+
+@pytest.mark.parametrize("values", [TICKS, CENTS])
+def test_sma_matches_window_means(values):
+    """Verify sma() holds the fmean of each trailing window."""
+    for length in [1, 5, 60]:
+        out = sma(values, length)
+        assert len(out) == len(values)
+        assert np.isnan(out[:length - 1]).all()
+        assert out[length - 1:].tolist() == [
+            fmean(values[i - length + 1:i + 1])
+            for i in range(length - 1, len(values))]
+    assert np.isnan(sma(values, 61)).all()
+
+
+@pytest.mark.parametrize("values", [TICKS, CENTS])
+def test_ema_matches_loop(values):
+    """Verify ema() matches a plain loop seeded by a rounded mean."""
+    for length, smoothing in [(1, 2), (9, 2), (20, 3)]:
+        prior = round(fmean(values[:length]), 2)
+        expected = []
+        for v in values[length:]:
+            prior = ((v * (smoothing / (length + 1)))
+                     + (prior * (1 - (smoothing / (length + 1)))))
+            expected.append(prior)
+        out = ema(values, length, smoothing)
+        assert np.isnan(out[:length]).all()
+        assert out[length:].tolist() == expected
+    assert np.isnan(ema(values, 60)).all()
+
+
+@pytest.mark.parametrize("values", [TICKS, CENTS, [10.0] * 20])
+def test_rsi_matches_loop(values):
+    """Verify rsi() matches a plain loop for every smoothing mode."""
+    for smoothing in ["wilder", "simple", "exponential"]:
+        for period in [1, 5, 14]:
+            out = rsi(values, period, smoothing)
+            assert len(out) == len(values)
+            assert np.isnan(out[:period]).all()
+            assert out[period:].tolist() == loop_rsi(values, period,
+                                                     smoothing)
+
+
+@pytest.mark.parametrize("values", [TICKS, CENTS, [10.0] * 20])
+@pytest.mark.parametrize("lengths", [[1, 2, 9, 19, 20, 59, 60, 61],
+                                     list(range(1, 62, 3))])
+def test_sweeps_match_single_kernels(values, lengths):
+    """Verify each sweep row equals its single kernel exactly.
+
+    The longer lengths step their recurrences forward as arrays and the
+    shorter ones as a plain loop per row.
+    """
+    smoothings = [2 + (k % 2) for k in range(len(lengths))]
+    modes = [["wilder", "simple", "exponential"][k % 3]
+             for k in range(len(lengths))]
+    sweeps = [sma_sweep(values, lengths),
+              ema_sweep(values, lengths, smoothings),
+              rsi_sweep(values, lengths, modes),
+              *rsi_sweep_averages(values, lengths, modes)]
+    for k, length in enumerate(lengths):
+        singles = [sma(values, length),
+                   ema(values, length, smoothings[k]),
+                   rsi(values, length, modes[k]),
+                   *rsi_averages(values, length, modes[k])]
+        for swept, single in zip(sweeps, singles):
+            assert swept.shape == (len(lengths), len(values))
+            assert np.array_equal(swept[k], single, equal_nan=True)
+    with pytest.raises(ValueError):
+        ema_sweep(values, lengths, [2, 3])
+
+
+@pytest.mark.parametrize("values", [TICKS, CENTS])
+def test_kernels_carry_on_from_prior(values):
+    """Verify carrying on from a prior matches one call over all values."""
+    full_ema = ema(values, 9)
+    full_gain, full_loss = rsi_averages(values, 5, "wilder")
+    for split in [10, 30, 59]:
+        assert np.array_equal(
+            ema(values[split:], 9, prior=full_ema[split - 1]),
+            full_ema[split:])
+        prior = (values[split - 1], full_gain[split - 1],
+                 full_loss[split - 1])
+        gain, loss = rsi_averages(values[split:], 5, "wilder", prior=prior)
+        assert np.array_equal(gain, full_gain[split:])
+        assert np.array_equal(loss, full_loss[split:])
+        assert np.array_equal(rsi(values[split:], 5, "wilder", prior=prior),
+                              rsi(values, 5, "wilder")[split:])
+    with pytest.raises(ValueError):
+        rsi_averages(values, 5, "simple", prior=prior)
+
+
+def test_kernels_reject_bad_lengths_and_modes():
+    """Verify kernels raise ValueError for unusable arguments."""
+    with pytest.raises(ValueError):
+        sma(TICKS, 0)
+    with pytest.raises(ValueError):
+        ema(TICKS, 2.5)
+    with pytest.raises(ValueError):
+        rsi(TICKS, -1)
+    with pytest.raises(ValueError):
+        rsi(TICKS, 14, "fancy")
+
+
+def test_round_values_matches_round():
+    """Verify round_values() rounds like round() and keeps NaN."""
+    values = [2.675, 1.005, -0.125, 6853.004999, 1e12 + 0.005,
+              float("nan")]
+    out = round_values(values)
+    assert out[:5].tolist() == [round(v, 2) for v in values[:5]]
+    assert np.isnan(out[5])
+    spread = [i / 1000 for i in range(-20000, 20000)] + CENTS
+    assert round_values(spread).tolist() == [round(v, 2) for v in spread]
+    assert round_values([[1.005], [2.675]]).shape == (2, 1)
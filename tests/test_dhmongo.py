@@ -9,6 +9,7 @@ from dhtrader.dhmongo import (
     delete_tradeseries,
     finish_progbar,
     get_backtests_by_field,
+    get_candle_arrays,
     get_candles,
     get_events,
     get_indicator,
@@ -27,7 +28,7 @@ from dhtrader.dhmongo import (
     store_tradeseries,
     update_progbar,
 )
-from dhtrader.dhcommon import dt_to_epoch
+from dhtrader.dhcommon import dt_as_str, dt_from_epoch, dt_to_epoch
 
 # ---------------------------------------------------------------------------
 # Marker values used across all storage tests.
@@ -226,6 +227,57 @@ def test_get_candles_empty_range():
     assert len(results) == 0
 
 
+@pytest.mark.storage
+@pytest.mark.suppress_stdout
+def test_get_candle_arrays_matches_get_candles(cleanup_dhmongo_storage):
+    """Verify get_candle_arrays returns the same values as get_candles.
+
+    Storage Usage: store_candle writes, get_candles and get_candle_arrays
+    read, cleanup fixture deletes by name.
+    """
+    test_epoch = dt_to_epoch(_TEST_MARKER_DT)
+    # Store out of order to confirm arrays come back sorted by epoch
+    for i in [2, 0, 1]:
+        epoch = test_epoch + (i * 60)
+        test_dt = dt_as_str(dt_from_epoch(epoch))
+        store_candle(
+            c_datetime=test_dt,
+            c_timeframe="1m",
+            c_open=9000.0 + i,
+            c_high=9010.0 + i,
+            c_low=8990.0 + i,
+            c_close=9005.0 + i,
+            c_volume=100 + i,
+            c_symbol="ES",
+            c_epoch=epoch,
+            c_date=test_dt[:10],
+            c_time=test_dt[11:19],
+            name=_TEST_DELETEME_NAME,
+        )
+    docs = get_candles(start_epoch=test_epoch,
+                       end_epoch=test_epoch + 120,
+                       timeframe="1m",
+                       symbol="ES",
+                       )
+    arrays = get_candle_arrays(start_epoch=test_epoch,
+                               end_epoch=test_epoch + 120,
+                               timeframe="1m",
+                               symbol="ES",
+                               batch_size=2,
+                               )
+    assert len(arrays["c_epoch"]) == 3
+    for field, values in arrays.items():
+        assert values.tolist() == [d[field] for d in docs]
+    # Empty ranges return empty arrays
+    far_epoch = dt_to_epoch("2098-01-01 00:00:00")
+    empty = get_candle_arrays(start_epoch=far_epoch,
+                              end_epoch=far_epoch,
+                              timeframe="1m",
+                              symbol="ES",
+                              )
+    assert all(len(v) == 0 for v in empty.values())
+
+
 @pytest.mark.storage
 @pytest.mark.suppress_stdout
 def test_store_and_get_trade_roundtrip(cleanup_dhmongo_storage):
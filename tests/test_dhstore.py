@@ -12,23 +12,30 @@ from dhtrader import (
     COLL_PATTERNS,
     delete_backtests_by_field,
     delete_custom_documents_by_field,
+    delete_events_by_field,
+    dt_to_epoch,
+    Event,
     get_all_custom_documents,
     get_backtests_by_field,
     get_custom_documents_by_field,
+    get_events,
     get_trades_by_field,
     get_tradeseries_by_field,
     list_custom_documents,
+    refresh_events_cache,
     review_custom_documents,
     review_trades,
     review_tradeseries,
     store_backtests,
     store_custom_documents,
+    store_event,
     store_trades,
     store_tradeseries,
     Trade,
     TradeSeries,
 )
 import dhtrader.dhmongo as _dhm
+import dhtrader.dhstore as _dhs
 from .conftest import is_valid_uuid
 
 
@@ -965,3 +972,51 @@ def test_custom_document_review_empty_collection_does_not_raise(
     )
     # Should print a summary header and no docs without raising.
     review_custom_documents(_TEST_COLL, "name", _TEST_MARKER)
+
+
+# ===========================================================================
+# Events cache tests
+# ===========================================================================
+
+_TEST_EVENT_NAME = "DELETEME_EVENTS_CACHE_TESTS"
+
+
+@pytest.mark.storage
+@pytest.mark.suppress_stdout
+def test_get_events_cache_invalidation():
+    """Verify cached get_events slices by range and sees every write made
+    through store_event, delete_events_by_field, and the refresh hook."""
+    delete_events_by_field(symbol="ES", field="name", value=_TEST_EVENT_NAME)
+    query = {"symbol": "ES", "start_epoch": 0,
+             "end_epoch": dt_to_epoch("2100-01-01 00:00:00"),
+             "categories": ["DELETEME_cache"]}
+    assert get_events(**query) == []
+    for day in [3, 1, 2]:
+        store_event(Event(start_dt=f"2099-01-0{day} 12:00:00",
+                          end_dt=f"2099-01-0{day} 18:00:00",
+                          symbol="ES", category="DELETEME_cache",
+                          name=_TEST_EVENT_NAME))
+    # A store refreshes the cache and ranges are sliced in memory, in the
+    # same storage order an uncached read returns
+    cached = get_events(**query)
+    assert [e.start_dt[:10] for e in cached] == [
+        "2099-01-03", "2099-01-01", "2099-01-02"]
+    uncached = get_events(use_cache=False, **query)
+    assert [e.start_dt for e in cached] == [e.start_dt for e in uncached]
+    narrow = dict(query, start_epoch=cached[1].start_epoch,
+                  end_epoch=cached[2].start_epoch)
+    assert [e.start_dt[:10] for e in get_events(**narrow)] == [
+        "2099-01-01", "2099-01-02"]
+    # Repeat reads are served from the cache without touching storage
+    version = _dhs.EVENTS_VERSIONS["ES"]
+    assert get_events(**query)[0] is cached[0]
+    # Writes made behind the cache's back need the refresh hook
+    _dhm.delete_events_by_field(symbol="ES", field="start_dt",
+                                value="2099-01-01 12:00:00")
+    assert len(get_events(**query)) == 3
+    refresh_events_cache(symbol="ES")
+    assert _dhs.EVENTS_VERSIONS["ES"] == version + 1
+    assert len(get_events(**query)) == 2
+    # Deleting refreshes the cache as well
+    delete_events_by_field(symbol="ES", field="name", value=_TEST_EVENT_NAME)
+    assert get_events(**query) == []
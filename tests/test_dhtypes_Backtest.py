@@ -4,10 +4,10 @@ import json
 import pytest
 from dhtrader import (
     Backtest, Chart, delete_backtests, delete_backtests_by_field,
-    delete_trades_by_field, delete_tradeseries_by_field, dt_as_dt,
-    get_backtests_by_field, get_trades_by_field, get_tradeseries_by_field,
-    store_backtests, store_trades, store_tradeseries, Symbol, Trade,
-    TradeSeries)
+    delete_trades_by_field, delete_tradeseries_by_field, dt_as_dt, Event,
+    EventIndex, get_backtests_by_field, get_trades_by_field,
+    get_tradeseries_by_field, store_backtests, store_trades,
+    store_tradeseries, Symbol, Trade, TradeSeries)
 
 
 def create_trade(open_dt="2099-01-02 12:00:00",
@@ -1052,6 +1052,31 @@ def test_delete_backtests(cleanup_backtest_storage):
     assert len(stored2) == 0
 
 
+@pytest.mark.suppress_stdout
+def test_Backtest_get_autoclose_time_by_date():
+    """Verify early closures move autoclose and an EventIndex matches a list.
+    """
+    bt = create_backtest()
+    events = [Event(start_dt="2099-01-02 13:00:00",
+                    end_dt="2099-01-03 18:00:00",
+                    symbol="ES", category="Closed", notes="Early close"),
+              Event(start_dt="2099-01-05 16:30:00",
+                    end_dt="2099-01-05 18:00:00",
+                    symbol="ES", category="Closed", notes="Late close"),
+              ]
+    index = EventIndex(events)
+    for closed_events in [events, index]:
+        # Closure before the default moves autoclose 5 minutes earlier
+        assert bt.get_autoclose_time_by_date(
+            datetime.date(2099, 1, 2), closed_events, "15:55:00") == (
+            datetime.time(12, 55))
+        # Closure after the default or on another date leaves it alone
+        for day in [5, 6]:
+            assert bt.get_autoclose_time_by_date(
+                datetime.date(2099, 1, day), closed_events, "15:55:00") == (
+                datetime.time(15, 55))
+
+
 def test_Backtest_eq_covers_all_attributes(assert_eq_fields_cover_instance):
     """_EQ_FIELDS | _EQ_EXCLUDE must exactly match instance __dict__."""
     sym = Symbol(
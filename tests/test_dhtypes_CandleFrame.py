@@ -0,0 +1,293 @@
+"""Tests for CandleFrame creation, indexing, and Chart integration."""
+import csv
+import json
+import numpy as np
+import pytest
+from dhtrader import (
+    Candle, CandleFrame, Chart, dt_as_str, dt_from_epoch, dt_to_epoch,
+    this_candle_start)
+
+
+def make_candles(start="2099-01-02 16:50:00", count=21):
+    """Return a list of sequential 1m ES Candles starting at start."""
+    start_epoch = dt_to_epoch(start)
+    candles = []
+    for i in range(count):
+        price = 5000 + i
+        epoch = start_epoch + (i * 60)
+        candles.append(Candle(c_datetime=dt_from_epoch(epoch),
+                              c_timeframe="1m",
+                              c_open=price,
+                              c_high=price + 2,
+                              c_low=price - 1.25,
+                              c_close=price + (i % 3) - 1,
+                              c_volume=100 + i,
+                              c_symbol="ES",
+                              ))
+    return candles
+
+
+@pytest.fixture
+def candles():
+    """Create and return a list of 1m ES Candles spanning a close."""
+    return make_candles()
+
+
+@pytest.fixture
+def frame(candles):
+    """Create and return a CandleFrame built from the candles fixture."""
+    return CandleFrame.from_candles(candles)
+
+
+@pytest.mark.suppress_stdout
+def test_CandleFrame_create_and_verify_common_methods(frame):
+    """Test CandleFrame __init__ values, __eq__, __ne__, __str__,
+    __repr__, to_clean_dict, to_json, and pretty.
+
+    CandleFrame does not define brief.
+    """
+    assert isinstance(frame, CandleFrame)
+    # __init__
+    assert frame.c_timeframe == "1m"
+    assert frame.c_symbol.ticker == "ES"
+    assert len(frame) == 21
+    assert frame.c_epoch.dtype == np.int64
+    assert frame.c_open.dtype == np.float64
+    assert frame.c_volume.dtype == np.int64
+    assert frame.c_open[0] == 5000.0
+    assert frame.c_volume[-1] == 120
+    expected_attrs = {
+        "c_timeframe", "c_symbol", "c_epoch", "c_open",
+        "c_high", "c_low", "c_close", "c_volume",
+    }
+    assert set(vars(frame).keys()) == expected_attrs
+    empty = CandleFrame(c_timeframe="1m", c_symbol="ES")
+    assert len(empty) == 0
+    diff = CandleFrame.from_candles(make_candles(count=5))
+    # __eq__
+    assert frame == CandleFrame.from_candles(make_candles())
+    assert not (frame == diff)
+    # __ne__
+    assert not (frame != CandleFrame.from_candles(make_candles()))
+    assert frame != diff
+    # __str__ and __repr__
+    assert str(frame) == repr(frame)
+    assert "21 values suppressed for output sanity" in str(frame)
+    # to_clean_dict
+    d = frame.to_clean_dict()
+    assert d["c_timeframe"] == "1m"
+    assert d["c_symbol"] == "ES"
+    # to_json
+    parsed = json.loads(frame.to_json(suppress_candles=False))
+    assert parsed["c_epoch"] == frame.c_epoch.tolist()
+    assert parsed["c_close"] == frame.c_close.tolist()
+    # pretty
+    assert len(frame.pretty().splitlines()) == 22
+    # Mismatched array lengths are rejected
+    with pytest.raises(ValueError):
+        CandleFrame(c_timeframe="1m", c_symbol="ES",
+                    c_epoch=[1, 2], c_open=[1.0], c_high=[1.0],
+                    c_low=[1.0], c_close=[1.0], c_volume=[1])
+
+
+@pytest.mark.suppress_stdout
+def test_CandleFrame_indexing_builds_equal_candles(candles, frame):
+    """Verify indexing and iteration rebuild Candles equal to the source."""
+    assert frame[0] == candles[0]
+    assert frame[-1] == candles[-1]
+    assert frame.to_candles() == candles
+    assert frame == candles
+    # Slices and masks return CandleFrames, not Candles
+    sliced = frame[2:5]
+    assert isinstance(sliced, CandleFrame)
+    assert sliced.to_candles() == candles[2:5]
+    masked = frame[frame.c_volume % 2 == 0]
+    evens = [c for c in candles if c.c_volume % 2 == 0]
+    assert masked.to_candles() == evens
+    assert frame.datetime_at(0) == candles[0].c_datetime
+
+
+@pytest.mark.suppress_stdout
+def test_CandleFrame_derived_arrays_match_candles(candles, frame):
+    """Verify derived arrays agree with each Candle's computed fields."""
+    directions = {1: "bullish", -1: "bearish", 0: "unchanged"}
+    for i, c in enumerate(candles):
+        assert frame.c_size[i] == c.c_size
+        assert frame.c_body_size[i] == c.c_body_size
+        assert frame.c_upper_wick_size[i] == c.c_upper_wick_size
+        assert frame.c_lower_wick_size[i] == c.c_lower_wick_size
+        assert directions[int(frame.c_direction[i])] == c.c_direction
+
+
+@pytest.mark.suppress_stdout
+def test_CandleFrame_tick_prices_round_trip(frame):
+    """Verify to_ticks and from_ticks convert OHLC exactly."""
+    ticks = frame.to_ticks()
+    assert set(ticks) == {"c_open", "c_high", "c_low", "c_close"}
+    assert ticks["c_open"].dtype == np.int32
+    assert ticks["c_low"][0] == 19995
+    rebuilt = CandleFrame.from_ticks(c_timeframe=frame.c_timeframe,
+                                     c_symbol="ES",
+                                     c_epoch=frame.c_epoch,
+                                     c_volume=frame.c_volume,
+                                     **ticks,
+                                     )
+    assert rebuilt == frame
+    frame.c_close[0] += 0.1
+    with pytest.raises(ValueError):
+        frame.to_ticks()
+
+
+@pytest.mark.suppress_stdout
+def test_CandleFrame_sort_append_and_between(candles):
+    """Verify sort, append, and between operate on the arrays."""
+    shuffled = CandleFrame.from_candles(list(reversed(candles)))
+    assert not shuffled.is_sorted()
+    shuffled.sort()
+    assert shuffled.is_sorted()
+    assert shuffled == candles
+    frame = CandleFrame.from_candles(candles[:-1])
+    frame.append(candles[-1])
+    assert frame == candles
+    start = candles[3].c_epoch
+    end = candles[6].c_epoch
+    assert frame.between(start, end).to_candles() == candles[3:7]
+    with pytest.raises(ValueError):
+        frame.append(Candle(c_datetime="2099-01-02 18:00:00",
+                            c_timeframe="5m",
+                            c_open=1, c_high=1, c_low=1, c_close=1,
+                            c_volume=1, c_symbol="ES"))
+
+
+@pytest.mark.suppress_stdout
+def test_CandleFrame_backed_Chart(candles, frame):
+    """Verify Chart methods work against a CandleFrame without a list."""
+    list_chart = Chart(c_timeframe="1m",
+                       c_trading_hours="eth",
+                       c_symbol="ES",
+                       c_start="2099-01-02 16:50:00",
+                       c_end="2099-01-02 17:10:00",
+                       c_candles=list(reversed(candles)),
+                       )
+    frame_chart = Chart(c_timeframe="1m",
+                        c_trading_hours="eth",
+                        c_symbol="ES",
+                        c_start="2099-01-02 16:50:00",
+                        c_end="2099-01-02 17:10:00",
+                        c_candles=CandleFrame.from_candles(
+                            list(reversed(candles))),
+                        )
+    list_chart.sort_candles()
+    frame_chart.sort_candles()
+    assert isinstance(frame_chart.c_candles, CandleFrame)
+    assert frame_chart.review_candles() == list_chart.review_candles()
+    assert frame_chart.earliest_candle == "2099-01-02 16:50:00"
+    assert frame_chart.latest_candle == "2099-01-02 17:10:00"
+    assert frame_chart == list_chart
+    # restrict_dates keeps the frame and matches list results
+    list_chart.restrict_dates("2099-01-02 16:55:00", "2099-01-02 17:05:00")
+    frame_chart.restrict_dates("2099-01-02 16:55:00", "2099-01-02 17:05:00")
+    assert isinstance(frame_chart.c_candles, CandleFrame)
+    assert frame_chart.candles_count == 11
+    assert frame_chart == list_chart
+    # filter_open_candles returns a frame matching the list path
+    sym = frame_chart.c_symbol
+    open_list = sym.filter_open_candles(candles=candles,
+                                        trading_hours="eth",
+                                        events=[])
+    open_frame = sym.filter_open_candles(candles=frame,
+                                         trading_hours="eth",
+                                         events=[])
+    assert isinstance(open_frame, CandleFrame)
+    assert len(open_frame) == 10
+    assert open_frame == open_list
+    # add_candle appends to the frame
+    frame_chart.add_candle(candles[-1])
+    assert isinstance(frame_chart.c_candles, CandleFrame)
+    assert frame_chart.candles_count == 12
+
+
+@pytest.mark.suppress_stdout
+def test_CandleFrame_resample_alignment():
+    """Verify resample buckets follow this_candle_start for each timeframe.
+
+    Uses two weeks of synthetic 1m candles so e1d and e1w buckets span
+    several 18:00 and Sunday 18:00 boundaries.
+    """
+    start_epoch = dt_to_epoch("2099-01-02 13:07:00")
+    epochs = np.arange(start_epoch, start_epoch + (14 * 86400), 60)
+    prices = (epochs // 60) % 97 + 5000.0
+    frame = CandleFrame(c_timeframe="1m",
+                        c_symbol="ES",
+                        c_epoch=epochs,
+                        c_open=prices,
+                        c_high=prices + 1,
+                        c_low=prices - 1,
+                        c_close=prices + 0.25,
+                        c_volume=np.ones(len(epochs)),
+                        )
+    for tf in ["5m", "15m", "r1h", "e1h", "e1d", "e1w"]:
+        rs = frame.resample(tf)
+        assert rs.c_timeframe == tf
+        assert rs.is_sorted()
+        # Every 1m candle lands in exactly one bucket
+        assert rs.c_volume.sum() == len(frame)
+        # Bucket starts match this_candle_start of each member minute
+        expected = sorted({
+            dt_to_epoch(this_candle_start(dt_from_epoch(e), tf))
+            for e in epochs.tolist()})
+        assert rs.c_epoch.tolist() == expected
+        # First bucket aggregates exactly the members of that bucket
+        members = frame.between(rs.c_epoch[0], rs.c_epoch[1] - 1)
+        assert rs.c_open[0] == members.c_open[0]
+        assert rs.c_high[0] == members.c_high.max()
+        assert rs.c_low[0] == members.c_low.min()
+        assert rs.c_close[0] == members.c_close[-1]
+    # r1h buckets are anchored on the half hour, e1d/e1w at 18:00
+    assert dt_as_str(dt_from_epoch(frame.resample("r1h").c_epoch[0])) == (
+        "2099-01-02 12:30:00")
+    assert dt_as_str(dt_from_epoch(frame.resample("e1d").c_epoch[0])) == (
+        "2099-01-01 18:00:00")
+    assert dt_as_str(dt_from_epoch(frame.resample("e1w").c_epoch[0])) == (
+        "2098-12-28 18:00:00")
+    # Only 1m frames can be resampled and unsupported timeframes fail
+    with pytest.raises(ValueError):
+        frame.resample("e1h").resample("e1d")
+    with pytest.raises(ValueError):
+        frame.resample("r1mo")
+
+
+@pytest.mark.historical
+@pytest.mark.suppress_stdout
+def test_CandleFrame_resample_historical():
+    """Verify 1m set1 candles resample to exactly the stored e1h candles."""
+    with open("testdata/set1/set1_1m_candles.csv", newline="") as f:
+        rows = list(csv.DictReader(f))
+    frame = CandleFrame(
+        c_timeframe="1m",
+        c_symbol="ES",
+        c_epoch=[int(r["c_epoch"]) for r in rows],
+        c_open=[float(r["c_open"]) for r in rows],
+        c_high=[float(r["c_high"]) for r in rows],
+        c_low=[float(r["c_low"]) for r in rows],
+        c_close=[float(r["c_close"]) for r in rows],
+        c_volume=[int(r["c_volume"]) for r in rows],
+    )
+    with open("testdata/set1/set1_e1h_candles.json") as f:
+        expected = json.load(f)
+    rs = frame.resample("e1h")
+    assert len(rs) == len(expected)
+    for field in ["c_epoch", "c_open", "c_high", "c_low", "c_close",
+                  "c_volume"]:
+        assert getattr(rs, field).tolist() == [e[field] for e in expected]
+
+
+def test_CandleFrame_eq_covers_all_attributes(
+        assert_eq_fields_cover_instance, frame):
+    """_EQ_FIELDS | _EQ_EXCLUDE must exactly match instance __dict__."""
+    assert_eq_fields_cover_instance(frame)
+
+
+def test_CandleFrame_eq_field_sensitivity(run_eq_field_sensitivity, frame):
+    """Confirm _EQ_FIELDS drives inequality and _EQ_EXCLUDE does not."""
+    run_eq_field_sensitivity(frame)
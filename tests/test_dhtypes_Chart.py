@@ -1,8 +1,39 @@
 """Tests for Chart creation, candle loading, and date restriction."""
 import json
+import numpy as np
 import pytest
 from dhtrader import (
-    Candle, Chart)
+    Candle, CandleFrame, Chart, ChartRegistry, delete_candles_by_field,
+    dt_from_epoch, dt_to_epoch, IndicatorSMA, store_candles)
+
+_STORED_CANDLE_NAME = "DELETEME_CHART_TESTS"
+
+
+@pytest.fixture
+def stored_candles():
+    """Store an hour of 2099 1m ES candles, removing them afterwards.
+
+    Deletion is scoped to _STORED_CANDLE_NAME so it can never touch
+    production candles.
+    """
+    def cleanup():
+        delete_candles_by_field(symbol="ES", timeframe="1m", field="name",
+                                value=_STORED_CANDLE_NAME)
+    cleanup()
+    start = dt_to_epoch("2099-01-05 10:00:00")
+    store_candles([Candle(c_datetime=dt_from_epoch(start + (i * 60)),
+                          c_timeframe="1m",
+                          c_open=5000 + i,
+                          c_high=5001 + i,
+                          c_low=4999 + i,
+                          c_close=5000.25 + i,
+                          c_volume=100 + i,
+                          c_symbol="ES",
+                          name=_STORED_CANDLE_NAME,
+                          )
+                   for i in range(60)])
+    yield
+    cleanup()
 
 
 @pytest.mark.suppress_stdout
@@ -41,10 +72,12 @@ def test_Chart_create_and_verify_common_methods():
     assert chart.candles_count == 0
     assert chart.earliest_candle is None
     assert chart.latest_candle is None
+    assert chart._epoch_index is None
     expected_attrs = {
         "autoload", "c_candles", "c_end", "c_start", "c_symbol",
         "c_timeframe", "c_trading_hours", "candles_count",
         "earliest_candle", "latest_candle", "show_progress",
+        "_epoch_index",
     }
     actual_attrs = set(vars(chart).keys())
     added = actual_attrs - expected_attrs
@@ -170,6 +203,349 @@ def test_Chart_restrict_dates():
                           new_end_dt="2024-09-27 12:00:00")
 
 
+@pytest.mark.storage
+@pytest.mark.suppress_stdout
+def test_Chart_load_candles_as_frame():
+    """Verify load_candles(as_frame=True) matches the Candle list path.
+
+    Storage Usage: load_candles reads candles and events.
+    """
+    kwargs = {"c_timeframe": "e1h",
+              "c_trading_hours": "eth",
+              "c_symbol": "ES",
+              "c_start": "2025-12-01 00:00:00",
+              "c_end": "2025-12-06 00:00:00",
+              }
+    list_chart = Chart(**kwargs, autoload=True)
+    frame_chart = Chart(**kwargs)
+    frame_chart.load_candles(as_frame=True)
+    assert isinstance(frame_chart.c_candles, CandleFrame)
+    assert frame_chart.candles_count > 0
+    assert frame_chart.candles_count == list_chart.candles_count
+    assert frame_chart.earliest_candle == list_chart.earliest_candle
+    assert frame_chart.latest_candle == list_chart.latest_candle
+    assert frame_chart == list_chart
+
+
+@pytest.mark.storage
+@pytest.mark.suppress_stdout
+def test_Chart_load_candles_chunked_and_prefetched(stored_candles):
+    """Verify chunked and prefetched loads match a single storage read.
+
+    Storage Usage: load_candles reads candles and events, store_candles
+    writes 2099 candles scoped by name.
+    """
+    kwargs = {"c_timeframe": "1m",
+              "c_trading_hours": "eth",
+              "c_symbol": "ES",
+              "c_start": "2099-01-05 10:00:00",
+              "c_end": "2099-01-05 10:59:00",
+              }
+    for as_frame in [False, True]:
+        whole = Chart(**kwargs)
+        whole.load_candles(as_frame=as_frame)
+        assert whole.candles_count == 60
+        # 25 minute chunks split the hour into three reads
+        chunked = Chart(**kwargs)
+        chunked.load_candles(as_frame=as_frame, chunk_days=25 / 1440)
+        assert chunked == whole
+        assert isinstance(chunked.c_candles, CandleFrame) == as_frame
+        fetched = Chart(**kwargs)
+        fetched.load_candles(as_frame=as_frame,
+                             candles=fetched.fetch_candles(as_frame=as_frame))
+        assert fetched == whole
+
+
+@pytest.mark.storage
+@pytest.mark.suppress_stdout
+def test_ChartRegistry_shares_loaded_charts(stored_candles):
+    """Verify ChartRegistry loads once and serves covered ranges as views.
+
+    Storage Usage: get_chart loads candles and events, store_candles
+    writes 2099 candles scoped by name.
+    """
+    registry = ChartRegistry()
+    kwargs = {"c_timeframe": "1m",
+              "c_trading_hours": "eth",
+              "c_symbol": "ES",
+              }
+    full = registry.get_chart(**kwargs,
+                              c_start="2099-01-05 10:00:00",
+                              c_end="2099-01-05 10:59:00",
+                              as_frame=True,
+                              )
+    assert full.candles_count == 60
+    expected = Chart(**kwargs,
+                     c_start="2099-01-05 10:10:00",
+                     c_end="2099-01-05 10:19:00",
+                     )
+    expected.load_candles(as_frame=True)
+    part = registry.get_chart(**kwargs,
+                              c_start="2099-01-05 10:10:00",
+                              c_end="2099-01-05 10:19:00",
+                              as_frame=True,
+                              )
+    assert registry.stats == {"hits": 1, "misses": 1, "evictions": 0}
+    assert part is not full
+    assert part == expected
+    # Covered ranges share the held arrays and cannot modify them
+    assert np.shares_memory(part.c_candles.c_close, full.c_candles.c_close)
+    assert not part.c_candles.c_close.flags.writeable
+    # Indicators over a covered range reuse the held Candle list
+    smas = [IndicatorSMA(description="Test SMA",
+                         timeframe="1m",
+                         trading_hours="eth",
+                         symbol="ES",
+                         calc_version="1.0.0",
+                         calc_details="test",
+                         start_dt="2099-01-05 10:00:00",
+                         end_dt=end,
+                         parameters={"length": length,
+                                     "method": "close"},
+                         chart_registry=registry,
+                         )
+            for length, end in [(9, "2099-01-05 10:59:00"),
+                                (21, "2099-01-05 10:29:00")]]
+    assert smas[0].candle_chart == Chart(**kwargs,
+                                         c_start="2099-01-05 10:00:00",
+                                         c_end="2099-01-05 10:59:00",
+                                         autoload=True,
+                                         )
+    assert smas[1].candle_chart.candles_count == 30
+    assert smas[1].candle_chart.c_candles[0] is (
+        smas[0].candle_chart.c_candles[0])
+    assert registry.stats == {"hits": 2, "misses": 2, "evictions": 0}
+    assert len(registry) == 2
+    # Least recently used Charts are evicted beyond max_candles
+    small = ChartRegistry(max_candles=100)
+    for as_frame in [True, False]:
+        small.get_chart(**kwargs,
+                        c_start="2099-01-05 10:00:00",
+                        c_end="2099-01-05 10:59:00",
+                        as_frame=as_frame,
+                        )
+    assert small.stats["evictions"] == 1
+    assert len(small) == 1
+    # Discarding drops only matching Charts
+    assert registry.discard(symbol="ES", timeframe="5m") == 0
+    assert registry.discard(symbol="ES") == 2
+    assert len(registry) == 0
+
+
+@pytest.mark.suppress_stdout
+def test_Chart_resample():
+    """Verify Chart.resample builds higher timeframe Charts from 1m.
+
+    2099-01-02 is a Friday in the 2099 test era: RTH is 09:30-16:00 and
+    ETH closes at 17:00.
+    """
+    candles = []
+    for i in range(8 * 60):
+        c_dt = f"2099-01-02 {9 + i // 60:02d}:{i % 60:02d}:00"
+        candles.append(Candle(c_datetime=c_dt,
+                              c_timeframe="1m",
+                              c_open=5000 + i,
+                              c_high=5001 + i,
+                              c_low=4999 + i,
+                              c_close=5000.5 + i,
+                              c_volume=1,
+                              c_symbol="ES",
+                              ))
+    chart = Chart(c_timeframe="1m",
+                  c_trading_hours="eth",
+                  c_symbol="ES",
+                  c_start="2099-01-02 09:00:00",
+                  c_end="2099-01-02 16:59:00",
+                  c_candles=candles,
+                  )
+    # Same trading hours, no filtering needed
+    e1h = chart.resample("e1h")
+    assert isinstance(e1h, Chart)
+    assert isinstance(e1h.c_candles, CandleFrame)
+    assert e1h.c_timeframe == "e1h"
+    assert e1h.c_trading_hours == "eth"
+    assert e1h.candles_count == 8
+    assert e1h.earliest_candle == "2099-01-02 09:00:00"
+    assert e1h.c_candles[0].c_open == 5000
+    assert e1h.c_candles[0].c_close == 5059.5
+    assert e1h.c_candles[0].c_volume == 60
+    # RTH r1h candles from eth minutes, anchored on the half hour
+    r1h = chart.resample("r1h", trading_hours="rth", events=[])
+    assert r1h.c_trading_hours == "rth"
+    assert [c.c_datetime[11:] for c in r1h.c_candles] == [
+        "09:30:00", "10:30:00", "11:30:00", "12:30:00", "13:30:00",
+        "14:30:00", "15:30:00"]
+    # 15:30 bucket closes at 16:00 so only holds 30 minutes
+    assert r1h.c_candles[-1].c_volume == 30
+    # Buckets starting before c_start are partial and dropped
+    chart.restrict_dates("2099-01-02 09:10:00", "2099-01-02 16:59:00")
+    assert chart.resample("e1h").earliest_candle == "2099-01-02 10:00:00"
+    with pytest.raises(ValueError):
+        chart.resample("r1h")
+    rth_chart = chart.resample("5m", trading_hours="rth", events=[])
+    with pytest.raises(ValueError):
+        rth_chart.resample("e1h", trading_hours="eth")
+
+
+def make_1m_chart():
+    """Return a 2099 1m Chart of 30 candles with every 5th minute missing.
+    """
+    candles = []
+    for i in range(30):
+        if i % 5 == 4:
+            continue
+        candles.append(Candle(c_datetime=f"2099-01-02 12:{i:02d}:00",
+                              c_timeframe="1m",
+                              c_open=5000 + i,
+                              c_high=5001 + i,
+                              c_low=4999 + i,
+                              c_close=5000.5 + i,
+                              c_volume=i,
+                              c_symbol="ES",
+                              ))
+    return Chart(c_timeframe="1m",
+                 c_trading_hours="eth",
+                 c_symbol="ES",
+                 c_start="2099-01-02 12:00:00",
+                 c_end="2099-01-02 12:29:00",
+                 c_candles=candles,
+                 )
+
+
+@pytest.mark.suppress_stdout
+@pytest.mark.parametrize("as_frame", [False, True])
+def test_Chart_epoch_index_lookups(as_frame):
+    """Verify epoch index slicing and lookups on list and frame charts."""
+    chart = make_1m_chart()
+    if as_frame:
+        chart.c_candles = CandleFrame.from_candles(chart.c_candles)
+    epochs = chart.epoch_index()
+    assert len(epochs) == 24
+    assert list(epochs) == sorted(epochs)
+    # Index is cached for list charts until candles change
+    assert chart.epoch_index() is epochs
+    # slice is inclusive on both ends and shares candles/arrays
+    sliced = chart.slice("2099-01-02 12:02:00", "2099-01-02 12:10:00")
+    assert [c.c_datetime[14:16] for c in sliced] == [
+        "02", "03", "05", "06", "07", "08", "10"]
+    if as_frame:
+        assert isinstance(sliced, CandleFrame)
+        assert np.shares_memory(sliced.c_epoch, chart.c_candles.c_epoch)
+    else:
+        assert sliced[0] is chart.c_candles[2]
+    # Epoch ints are accepted as well as datetimes and strings
+    assert len(chart.slice(epochs[0], epochs[-1])) == 24
+    # candle_at finds the candle spanning a datetime, None in gaps
+    assert chart.candle_at("2099-01-02 12:03:30").c_datetime == (
+        "2099-01-02 12:03:00")
+    assert chart.candle_at("2099-01-02 12:04:30") is None
+    assert chart.candle_at("2099-01-02 11:59:00") is None
+    # previous/next/nearest lookups
+    assert chart.previous_candle("2099-01-02 12:05:00").c_datetime == (
+        "2099-01-02 12:03:00")
+    assert chart.previous_candle("2099-01-02 12:00:00") is None
+    assert [c.c_datetime[14:16] for c in chart.previous_candles(
+        "2099-01-02 12:10:00", count=3)] == ["06", "07", "08"]
+    assert len(chart.previous_candles("2099-01-02 12:01:00", count=3)) == 1
+    assert chart.next_candle("2099-01-02 12:03:00").c_datetime == (
+        "2099-01-02 12:05:00")
+    assert chart.next_candle("2099-01-02 12:29:00") is None
+    assert chart.nearest_candle("2099-01-02 12:03:40").c_datetime == (
+        "2099-01-02 12:03:00")
+    assert chart.nearest_candle("2099-01-02 12:04:40").c_datetime == (
+        "2099-01-02 12:05:00")
+    assert chart.nearest_candle("2099-01-03 00:00:00").c_datetime == (
+        "2099-01-02 12:28:00")
+    # candles_during gets the 1m candles inside a higher timeframe candle
+    tf_candle = Candle(c_datetime="2099-01-02 12:05:00",
+                       c_timeframe="5m",
+                       c_open=1, c_high=1, c_low=1, c_close=1,
+                       c_volume=1, c_symbol="ES")
+    assert [c.c_datetime[14:16] for c in chart.candles_during(tf_candle)] == [
+        "05", "06", "07", "08"]
+    # restrict_dates bisects the index
+    chart.restrict_dates("2099-01-02 12:05:00", "2099-01-02 12:20:00")
+    assert chart.candles_count == 13
+    assert chart.earliest_candle == "2099-01-02 12:05:00"
+    assert chart.latest_candle == "2099-01-02 12:20:00"
+    assert len(chart.epoch_index()) == 13
+
+
+@pytest.mark.suppress_stdout
+def test_Chart_epoch_index_sorts_and_refreshes():
+    """Verify the index sorts unsorted candles and follows list changes."""
+    chart = make_1m_chart()
+    chart.c_candles.reverse()
+    epochs = chart.epoch_index()
+    assert list(epochs) == sorted(epochs)
+    assert chart.c_candles[0].c_datetime == "2099-01-02 12:00:00"
+    chart.add_candle(Candle(c_datetime="2099-01-02 12:30:00",
+                            c_timeframe="1m",
+                            c_open=1, c_high=1, c_low=1, c_close=1,
+                            c_volume=1, c_symbol="ES"))
+    assert len(chart.epoch_index()) == 25
+    assert chart.next_candle("2099-01-02 12:28:00").c_datetime == (
+        "2099-01-02 12:30:00")
+    # Cache is not serialized
+    assert "_epoch_index" not in chart.to_clean_dict()
+
+
+@pytest.mark.suppress_stdout
+@pytest.mark.parametrize("as_frame", [False, True])
+def test_Chart_add_candles(as_frame):
+    """Verify add_candles appends ordered batches and merges unordered ones.
+    """
+    full = make_1m_chart()
+    candles = list(full.c_candles)
+    chart = make_1m_chart()
+    chart.c_candles = candles[:10]
+    if as_frame:
+        chart.c_candles = CandleFrame.from_candles(chart.c_candles)
+    chart.review_candles()
+    index_before = chart.epoch_index()
+    # Ordered batch after the last candle is appended with the index kept
+    chart.add_candles(candles[10:15])
+    assert chart.candles_count == 15
+    assert chart.latest_candle == candles[14].c_datetime
+    if not as_frame:
+        assert chart._epoch_index is not None
+    assert list(chart.epoch_index()[:10]) == list(index_before)
+    # Unordered batch, including a frame batch, is merged in one pass
+    batch = list(reversed(candles[15:]))
+    if as_frame:
+        batch = CandleFrame.from_candles(batch)
+    chart.add_candles(batch)
+    assert chart.candles_count == 24
+    assert chart == full
+    # Batches that land inside the range merge into place
+    chart.c_candles = candles[5:] if not as_frame else (
+        CandleFrame.from_candles(candles[5:]))
+    chart.review_candles()
+    chart.add_candles([candles[3], candles[0], candles[4]])
+    assert [c.c_datetime for c in chart.c_candles][:4] == [
+        candles[0].c_datetime, candles[3].c_datetime,
+        candles[4].c_datetime, candles[5].c_datetime]
+    assert chart.earliest_candle == candles[0].c_datetime
+    # sort=False appends as given and extends c_start/c_end
+    chart.add_candles([Candle(c_datetime="2099-01-02 11:00:00",
+                              c_timeframe="1m",
+                              c_open=1, c_high=1, c_low=1, c_close=1,
+                              c_volume=1, c_symbol="ES")], sort=False)
+    assert chart.c_candles[-1].c_datetime == "2099-01-02 11:00:00"
+    assert chart.c_start == "2099-01-02 11:00:00"
+    # Empty batches are a no-op; bad types and timeframes are rejected
+    count = chart.candles_count
+    chart.add_candles([])
+    assert chart.candles_count == count
+    with pytest.raises(TypeError):
+        chart.add_candles([candles[0], "not a candle"])
+    with pytest.raises(ValueError):
+        chart.add_candles([Candle(c_datetime="2099-01-02 13:00:00",
+                                  c_timeframe="5m",
+                                  c_open=1, c_high=1, c_low=1, c_close=1,
+                                  c_volume=1, c_symbol="ES")])
+
+
 def test_Chart_eq_covers_all_attributes(assert_eq_fields_cover_instance):
     """_EQ_FIELDS | _EQ_EXCLUDE must exactly match instance __dict__."""
     ch = Chart(
@@ -0,0 +1,77 @@
+"""Tests for Day aggregation and batch building with DayBuilder."""
+import datetime
+import numpy as np
+import pytest
+from dhtrader import (
+    CandleFrame, Chart, Day, DayBuilder, dt_to_epoch)
+
+
+def make_frame(start="2099-01-02 13:07:00", days=3, drop=()):
+    """Return a 1m ES CandleFrame of synthetic minutes from start.
+
+    Datetimes listed in drop are left out to create session gaps.
+    """
+    start_epoch = dt_to_epoch(start)
+    epochs = np.arange(start_epoch, start_epoch + (days * 86400), 60)
+    epochs = epochs[~np.isin(epochs, [dt_to_epoch(d) for d in drop])]
+    prices = ((epochs // 60) * 7919) % 103 + 5000.0
+    return CandleFrame(c_timeframe="1m",
+                       c_symbol="ES",
+                       c_epoch=epochs,
+                       c_open=prices,
+                       c_high=prices + ((epochs // 60) % 5),
+                       c_low=prices - ((epochs // 60) % 3),
+                       c_close=prices + 0.25,
+                       c_volume=(epochs // 60) % 17 + 1,
+                       )
+
+
+@pytest.mark.suppress_stdout
+def test_DayBuilder_matches_Day_recalc_from_1m():
+    """Verify batch-built Days match Days recalculated from their 1m chart.
+    """
+    # Missing 09:30 and 16:00 minutes leave those opens and closes unset
+    frame = make_frame(drop=["2099-01-03 09:30:00", "2099-01-04 16:00:00"])
+    chart = Chart(c_timeframe="1m",
+                  c_trading_hours="eth",
+                  c_symbol="ES",
+                  c_start="2099-01-02 13:07:00",
+                  c_end="2099-01-05 13:06:00",
+                  c_candles=frame.to_candles(),
+                  )
+    built = DayBuilder(chart).days(include_charts=True)
+    assert [d.d_date for d in built] == [datetime.date(2099, 1, day)
+                                         for day in [2, 3, 4, 5]]
+    fields = ["d_open_eth", "d_open_rth", "d_high_eth", "d_high_rth",
+              "d_low_eth", "d_low_rth", "d_close_eth", "d_close_rth",
+              "d_volume_eth", "d_volume_rth"]
+    for day in built:
+        day_chart = day.get_chart("1m")
+        assert day_chart.c_start[:10] == str(day.d_date)
+        expected = Day(d_symbol=day.d_symbol,
+                       d_date=day.d_date,
+                       d_charts=[Chart(c_timeframe="1m",
+                                       c_trading_hours="eth",
+                                       c_symbol="ES",
+                                       c_start=day_chart.c_start,
+                                       c_end=day_chart.c_end,
+                                       c_candles=day_chart.c_candles
+                                       .to_candles(),
+                                       )],
+                       )
+        for f in fields:
+            assert getattr(day, f) == getattr(expected, f), f
+    assert built[0].d_open_eth is None
+    assert built[0].d_open_rth is None
+    assert built[1].d_open_eth is not None
+    assert built[1].d_open_rth is None
+    assert built[2].d_close_rth is None
+    assert built[3].d_close_eth is None
+    # The table holds the same values column by column
+    table = DayBuilder(frame).table()
+    assert table["d_date"].dtype == np.dtype("datetime64[D]")
+    assert table["d_volume_eth"].tolist() == [d.d_volume_eth for d in built]
+    assert np.isnan(table["d_open_rth"][1])
+    # Only 1m candles can be built into Days
+    with pytest.raises(ValueError):
+        DayBuilder(frame.resample("e1h"))
@@ -1,8 +1,12 @@
 """Tests for Event creation and datetime containment logic."""
 import json
+import random
 import pytest
+from datetime import datetime, timedelta
 from dhtrader import (
+    dt_as_str,
     Event,
+    EventIndex,
     DEFAULT_OBJ_NAME)
 
 
@@ -105,3 +109,55 @@ def test_Event_contains_datetime(event):
     # Just after end is False
     assert not event.contains_datetime("2099-01-02 18:00:01")
     assert not event.contains_datetime("2099-01-03 13:00:00")
+
+
+@pytest.mark.suppress_stdout
+def test_EventIndex_matches_event_scans():
+    """Verify EventIndex lookups match scanning Events one by one, and that
+    Symbol methods give the same answers for an index as for a list."""
+    rng = random.Random(14)
+    base = datetime(2099, 1, 1)
+    events = []
+    for i in range(40):
+        start = base + timedelta(minutes=rng.randrange(0, 60 * 24 * 30))
+        end = start + timedelta(minutes=rng.randrange(0, 60 * 36))
+        events.append(Event(start_dt=start, end_dt=end, symbol="ES",
+                            category="Closed", notes=f"Event {i}"))
+    index = EventIndex(events)
+    assert len(index) == 40
+    assert list(index) == events
+    assert not EventIndex()
+    for _ in range(300):
+        t = base + timedelta(minutes=rng.randrange(0, 60 * 24 * 32))
+        expected = [e for e in events if e.contains_datetime(t)]
+        assert index.containing(t) == expected
+        assert index.contains(t) == bool(expected)
+        later = t + timedelta(minutes=rng.randrange(0, 600))
+        assert index.overlaps(t, later) == any(
+            e.start_dt <= dt_as_str(later) and e.end_dt >= dt_as_str(t)
+            for e in events)
+        assert index.starting_on(t.date()) == [
+            e for e in events if e.start_dt[:10] == str(t.date())]
+        # Datetimes and date or datetime strings give the same Events
+        assert index.starting_on(t) == index.starting_on(t.date())
+        assert index.starting_on(dt_as_str(t)) == index.starting_on(
+            t.date())
+        assert index.starting_on(str(t.date())) == index.starting_on(
+            t.date())
+    # Symbol methods accept the index wherever they accept a list
+    symbol = events[0].symbol
+    for _ in range(100):
+        t = base + timedelta(minutes=rng.randrange(0, 60 * 24 * 30))
+        assert symbol.market_is_open(trading_hours="eth", target_dt=t,
+                                     events=index) == (
+            symbol.market_is_open(trading_hours="eth", target_dt=t,
+                                  events=events))
+        for boundary in ["open", "close"]:
+            for order in ["next", "previous"]:
+                result = symbol.get_market_boundary(
+                    target_dt=t, trading_hours="eth", boundary=boundary,
+                    order=order, events=index)
+                assert result == symbol.get_market_boundary(
+                    target_dt=t, trading_hours="eth", boundary=boundary,
+                    order=order, events=events)
+                assert not any(e.contains_datetime(result) for e in events)
@@ -1,12 +1,16 @@
 """Tests for Indicator, IndicatorSMA, IndicatorEMA, and IndicatorRSI."""
 import json
+from statistics import fmean
 import pytest
 from dhtrader import (
-    Candle, Chart,
-    delete_indicators_by_name,
+    Candle, CandleFrame, Chart, delete_candles_by_field,
+    delete_indicators_by_name, dt_from_epoch, dt_to_epoch,
     get_indicator, get_indicator_datapoints,
     get_indicators_by_name, Indicator, IndicatorDataPoint,
-    IndicatorEMA, IndicatorRSI, IndicatorSMA, store_indicator, Symbol)
+    IndicatorDataPoints, IndicatorEMA, IndicatorRSI, IndicatorSMA,
+    IndicatorSweep, store_candles, store_indicator, Symbol)
+
+_STORED_CANDLE_NAME = "DELETEME_INDICATOR_TESTS"
 
 
 @pytest.mark.storage
@@ -732,6 +736,164 @@ def test_Indicator_store_retrieve_delete(cleanup_indicator_storage):
     assert len(dps) == 0
 
 
+@pytest.fixture
+def stored_candles():
+    """Store an hour of 2099 1m ES candles, removing them afterwards.
+
+    Deletion is scoped to _STORED_CANDLE_NAME so it can never touch
+    production candles.
+    """
+    def cleanup():
+        delete_candles_by_field(symbol="ES", timeframe="1m", field="name",
+                                value=_STORED_CANDLE_NAME)
+    cleanup()
+    start = dt_to_epoch("2099-01-05 10:00:00")
+    closes = [5000 + (((i * 7919) % 103) * 0.25) for i in range(60)]
+    store_candles([Candle(c_datetime=dt_from_epoch(start + (i * 60)),
+                          c_timeframe="1m",
+                          c_open=close,
+                          c_high=close + 1,
+                          c_low=close - 1,
+                          c_close=close,
+                          c_volume=100 + i,
+                          c_symbol="ES",
+                          name=_STORED_CANDLE_NAME,
+                          )
+                   for i, close in enumerate(closes)])
+    yield
+    cleanup()
+
+
+@pytest.mark.storage
+@pytest.mark.suppress_stdout
+def test_Indicator_update_continues_from_stored_state(
+        stored_candles, cleanup_indicator_storage):
+    """Verify update() appends exactly what a full calculate() would.
+
+    An indicator calculated over the first half hour, stored, and
+    retrieved must carry on from its stored state over the second half
+    hour to the same datapoints and state as one calculation over the
+    whole hour.
+
+    Storage Usage: store_candles, store_indicator, get_indicator,
+                   get_indicator_datapoints, delete_indicators_by_name.
+    """
+    name = "TestUpdate-DELETEME"
+    cleanup_indicator_storage(name)
+    half = "2099-01-05 10:29:00"
+    variants = [(IndicatorSMA, {"length": 5, "method": "close"}),
+                (IndicatorEMA, {"length": 3}),
+                (IndicatorRSI, {"period": 5}),
+                (IndicatorRSI, {"period": 5, "smoothing": "simple"}),
+                (IndicatorRSI, {"period": 5, "smoothing": "exponential"}),
+                ]
+    for indicator_class, parameters in variants:
+        def make(end_dt):
+            return indicator_class(name=name,
+                                   description="Test update",
+                                   timeframe="1m",
+                                   trading_hours="eth",
+                                   symbol="ES",
+                                   calc_version="1.0.0",
+                                   calc_details="test",
+                                   start_dt="2099-01-05 10:00:00",
+                                   end_dt=end_dt,
+                                   parameters=parameters,
+                                   )
+        full = make("2099-01-05 10:59:00")
+        full.calculate()
+        assert full.state["dt"] == "2099-01-05 10:59:00"
+        part = make(half)
+        part.calculate()
+        store_indicator(part)
+        stored = get_indicator(ind_id=part.ind_id)
+        assert stored.state == part.state
+        stored.end_dt = "2099-01-05 10:59:00"
+        new_dps = stored.update()
+        assert new_dps == [dp for dp in full.datapoints if dp.dt > half]
+        assert stored.state == full.state
+        store_indicator(stored)
+        assert get_indicator_datapoints(
+            ind_id=part.ind_id,
+            earliest_dt="2099-01-05 10:00:00",
+            latest_dt="2099-01-05 10:59:00",
+            ) == full.datapoints
+        assert stored.update() == []
+        # Calculating again after update() still covers the whole hour,
+        # whether candle_chart was loaded before update() or not.
+        # get_indicator() does not restore start_dt, so set it here
+        stored.start_dt = "2099-01-05 10:00:00"
+        stored.calculate()
+        assert stored.datapoints == full.datapoints
+        part.end_dt = "2099-01-05 10:59:00"
+        part.update()
+        assert part.candle_chart == full.candle_chart
+        part.calculate()
+        assert part.datapoints == full.datapoints
+        assert part == full
+        # Without a state update() calculates from start_dt
+        fresh = make("2099-01-05 10:59:00")
+        assert fresh.update() == full.datapoints
+        assert fresh.state == full.state
+
+
+@pytest.mark.storage
+@pytest.mark.suppress_stdout
+def test_IndicatorSweep_indicators_update_from_state(stored_candles):
+    """Verify Indicators filled by a sweep carry on with update().
+
+    Each swept Indicator must record the state its own calculate() would
+    have, so update() over the second half hour appends only the new
+    datapoints rather than calculating from start_dt again.
+
+    Storage Usage: store_candles (via fixture), Chart.load_candles.
+    """
+    half = "2099-01-05 10:29:00"
+    sweeps = [(IndicatorSMA, [{"length": n, "method": "close"}
+                              for n in [1, 5]]),
+              (IndicatorEMA, [{"length": 3}, {"length": 5}]),
+              (IndicatorRSI, [{"period": 5},
+                              {"period": 5, "smoothing": "simple"},
+                              {"period": 5, "smoothing": "exponential"}]),
+              ]
+    for indicator_class, parameter_sets in sweeps:
+        # update() extends the chart its sweep shares, so each sweep
+        # starts from its own half hour chart
+        chart = Chart(c_timeframe="1m",
+                      c_trading_hours="eth",
+                      c_symbol="ES",
+                      c_start="2099-01-05 10:00:00",
+                      c_end=half,
+                      autoload=True,
+                      )
+        sweep = IndicatorSweep(indicator_class=indicator_class,
+                               candle_chart=chart,
+                               parameter_sets=parameter_sets,
+                               description="Test sweep update",
+                               calc_version="1.0.0",
+                               calc_details="test",
+                               )
+        sweep.calculate()
+        for swept, parameters in zip(sweep.indicators, parameter_sets):
+            full = indicator_class(description="Test sweep update",
+                                   timeframe="1m",
+                                   trading_hours="eth",
+                                   symbol="ES",
+                                   calc_version="1.0.0",
+                                   calc_details="test",
+                                   start_dt="2099-01-05 10:00:00",
+                                   end_dt="2099-01-05 10:59:00",
+                                   parameters=parameters,
+                                   )
+            full.calculate()
+            assert swept.state["dt"] == half
+            swept.end_dt = "2099-01-05 10:59:00"
+            new_dps = swept.update()
+            assert new_dps == [dp for dp in full.datapoints if dp.dt > half]
+            assert swept.datapoints == full.datapoints
+            assert swept.state == full.state
+
+
 # #############################################################################
 # IndicatorDataPoint
 # #############################################################################
@@ -850,6 +1012,63 @@ def _make_indicator_chart():
     return chart
 
 
+@pytest.mark.suppress_stdout
+def test_Indicator_calculate_high_of_day_series():
+    """Verify the parent class series is the high of each day so far."""
+    start = dt_to_epoch("2099-01-02 20:00:00")
+    candles = [Candle(c_datetime=dt_from_epoch(start + (i * 37 * 60)),
+                      c_timeframe="1m",
+                      c_open=5000,
+                      c_high=5000 + (((i * 7919) % 103) * 0.25),
+                      c_low=4990,
+                      c_close=5000,
+                      c_volume=100,
+                      c_symbol="ES",
+                      )
+               for i in range(150)]
+    chart = Chart(c_timeframe="1m",
+                  c_trading_hours="eth",
+                  c_symbol="ES",
+                  c_start=candles[0].c_datetime,
+                  c_end=candles[-1].c_datetime,
+                  c_candles=candles,
+                  )
+    ind = Indicator(name="DELETEME",
+                    description="HOD test",
+                    timeframe="1m",
+                    trading_hours="eth",
+                    symbol="ES",
+                    calc_version="1.0.0",
+                    calc_details="test",
+                    start_dt=chart.c_start,
+                    end_dt=chart.c_end,
+                    autoload_chart=False,
+                    candle_chart=chart,
+                    )
+    ind.calculate()
+    # The same high of the day a plain loop over the candles gives
+    expected = []
+    for c in candles:
+        if expected and c.c_date == expected[-1][0]:
+            expected.append((c.c_date, max(expected[-1][1], c.c_high)))
+        else:
+            expected.append((c.c_date, c.c_high))
+    assert [dp.value for dp in ind.datapoints] == [e[1] for e in expected]
+    dts = [c.c_datetime for c in candles]
+    assert [dp.dt for dp in ind.datapoints] == dts
+    assert ind.calculate_values()[0] == dts
+    values = ind.calculate_values()[1]
+    assert values.tolist() == [e[1] for e in expected]
+    # Carrying on from a state part way through a day matches one pass
+    epochs, highs = ind._chart_values("c_high")
+    full, _, full_state = ind._calculate_series(epochs, highs)
+    _, _, state = ind._calculate_series(epochs[:70], highs[:70])
+    rest, _, rest_state = ind._calculate_series(epochs[70:], highs[70:],
+                                                state)
+    assert rest.tolist() == full[70:].tolist()
+    assert rest_state == full_state
+
+
 @pytest.mark.suppress_stdout
 def test_Indicator_create_and_verify_common_methods():
     """Test Indicator __init__ values, __eq__, __ne__, __str__, __repr__,
@@ -914,11 +1133,12 @@ def test_Indicator_create_and_verify_common_methods():
     assert ind.class_name == "Indicator"
     assert ind.autoload_chart is False
     assert ind.candle_chart == chart
+    assert ind.state is None
     expected_attrs = {
         "autoload_chart", "calc_details", "calc_version",
         "candle_chart", "class_name", "datapoints",
         "description", "end_dt", "ind_id", "name",
-        "parameters", "start_dt", "symbol", "timeframe",
+        "parameters", "start_dt", "state", "symbol", "timeframe",
         "trading_hours",
     }
     actual_attrs = set(vars(ind).keys())
@@ -1035,11 +1255,12 @@ def test_IndicatorSMA_create_and_verify_common_methods():
     assert sma.class_name == "IndicatorSMA"
     assert sma.autoload_chart is False
     assert sma.candle_chart == chart
+    assert sma.state is None
     expected_attrs = {
         "autoload_chart", "calc_details", "calc_version",
         "candle_chart", "class_name", "datapoints",
         "description", "end_dt", "ind_id", "length",
-        "method", "name", "parameters", "start_dt",
+        "method", "name", "parameters", "start_dt", "state",
         "symbol", "timeframe", "trading_hours",
     }
     actual_attrs = set(vars(sma).keys())
@@ -1157,12 +1378,13 @@ def test_IndicatorEMA_create_and_verify_common_methods():
     assert ema.class_name == "IndicatorEMA"
     assert ema.autoload_chart is False
     assert ema.candle_chart == chart
+    assert ema.state is None
     expected_attrs = {
         "autoload_chart", "calc_details", "calc_version",
         "candle_chart", "class_name", "datapoints",
         "description", "end_dt", "ind_id", "length",
         "method", "name", "parameters", "smoothing",
-        "start_dt", "symbol", "timeframe", "trading_hours",
+        "start_dt", "state", "symbol", "timeframe", "trading_hours",
     }
     actual_attrs = set(vars(ema).keys())
     added = actual_attrs - expected_attrs
@@ -1299,12 +1521,13 @@ def test_IndicatorRSI_create_and_verify_common_methods():
     assert rsi.class_name == "IndicatorRSI"
     assert rsi.autoload_chart is False
     assert rsi.candle_chart == chart
+    assert rsi.state is None
     expected_attrs = {
         "autoload_chart", "calc_details", "calc_version",
         "candle_chart", "class_name", "datapoints",
         "description", "end_dt", "ind_id", "method",
         "name", "parameters", "period", "smoothing",
-        "start_dt", "symbol", "timeframe", "trading_hours",
+        "start_dt", "state", "symbol", "timeframe", "trading_hours",
     }
     actual_attrs = set(vars(rsi).keys())
     added = actual_attrs - expected_attrs
@@ -1459,6 +1682,154 @@ def shared_assertions_Indicator_spotcheck_ES_eth_e1h_RSI_close_p14_swilder(
         dt="2026-05-06 16:00:00").value == 75.16
 
 
+@pytest.mark.suppress_stdout
+def test_IndicatorSMA_calculate_matches_window_means():
+    """Verify SMA values equal rounded fmean of each trailing window.
+
+    Covers tick aligned closes, summed exactly as integers, and cent
+    closes that fall back to a sum per window, for list and CandleFrame
+    backed charts.
+    """
+    ticks = [5000 + (((i * 7919) % 103) * 0.25) for i in range(40)]
+    cents = [44.34 + (((i * 31) % 17) * 0.07) for i in range(40)]
+    for closes in [ticks, cents]:
+        chart = _make_rsi_chart_from_closes(closes)
+        frame_chart = Chart(c_timeframe="1m",
+                            c_trading_hours="eth",
+                            c_symbol="ES",
+                            c_start=chart.c_start,
+                            c_end=chart.c_end,
+                            c_candles=CandleFrame.from_candles(
+                                chart.c_candles),
+                            )
+        for length in [1, 3, 9, 40, 41]:
+            expected = [round(fmean(closes[i - length + 1:i + 1]), 2)
+                        for i in range(length - 1, len(closes))]
+            for c in [chart, frame_chart]:
+                sma = IndicatorSMA(description="Test SMA",
+                                   timeframe="1m",
+                                   trading_hours="eth",
+                                   symbol="ES",
+                                   calc_version="1.0.0",
+                                   calc_details="test",
+                                   start_dt=chart.c_start,
+                                   end_dt=chart.c_end,
+                                   autoload_chart=False,
+                                   candle_chart=c,
+                                   parameters={"length": length,
+                                               "method": "close"},
+                                   )
+                dts, values = sma.calculate_values()
+                assert values.tolist() == expected
+                sma.calculate()
+                assert [dp.value for dp in sma.datapoints] == expected
+                assert [dp.dt for dp in sma.datapoints] == [
+                    can.c_datetime for can in chart.c_candles[length - 1:]]
+
+
+@pytest.mark.suppress_stdout
+def test_IndicatorSweep_matches_separate_indicators():
+    """Verify a sweep builds the same Indicators as separate calculations.
+
+    Each variant must get its own ind_id suffix and exactly the
+    datapoints its Indicator calculates on its own.
+    """
+    closes = [5000 + (((i * 7919) % 103) * 0.25) for i in range(60)]
+    chart = _make_rsi_chart_from_closes(closes)
+    sweeps = [(IndicatorSMA, [{"length": n, "method": "close"}
+                              for n in [1, 5, 20]]),
+              (IndicatorEMA, [{"length": 5}, {"length": 9},
+                              {"length": 9, "smoothing": 3},
+                              {"length": 12}]),
+              (IndicatorRSI, [{"period": 14},
+                              {"period": 5, "smoothing": "simple"},
+                              {"period": 9, "smoothing": "exponential"},
+                              {"period": 60}]),
+              ]
+    for indicator_class, parameter_sets in sweeps:
+        sweep = IndicatorSweep(indicator_class=indicator_class,
+                               candle_chart=chart,
+                               parameter_sets=parameter_sets,
+                               description="Test sweep",
+                               calc_version="1.0.0",
+                               calc_details="test",
+                               )
+        assert len(sweep) == len(parameter_sets)
+        dts, values = sweep.calculate_values()
+        assert values.shape == (len(parameter_sets), len(closes))
+        assert sweep.calculate()
+        for swept, parameters in zip(sweep.indicators, parameter_sets):
+            single = indicator_class(description="Test sweep",
+                                     timeframe="1m",
+                                     trading_hours="eth",
+                                     symbol="ES",
+                                     calc_version="1.0.0",
+                                     calc_details="test",
+                                     start_dt=chart.c_start,
+                                     end_dt=chart.c_end,
+                                     autoload_chart=False,
+                                     candle_chart=chart,
+                                     parameters=parameters,
+                                     )
+            single.calculate()
+            assert swept.ind_id == single.ind_id
+            assert swept.datapoints == single.datapoints
+            assert swept.state == single.state
+            assert swept == single
+    # Only the supported subclasses and a Chart can be swept
+    with pytest.raises(TypeError):
+        IndicatorSweep(Indicator, chart, [{}], "x", "1.0.0", "test")
+    with pytest.raises(TypeError):
+        IndicatorSweep(IndicatorEMA, chart.c_candles, [{"length": 9}],
+                       "x", "1.0.0", "test")
+    with pytest.raises(ValueError):
+        IndicatorSweep(IndicatorEMA, chart, [], "x", "1.0.0", "test")
+
+
+@pytest.mark.historical
+@pytest.mark.suppress_stdout
+def test_IndicatorEMA_calculate_matches_set1_datapoints():
+    """Verify e1h 9 EMA values match stored set1 datapoints exactly."""
+    with open("testdata/set1/set1_e1h_candles.json") as f:
+        rows = json.load(f)
+    frame = CandleFrame(c_timeframe="e1h",
+                        c_symbol="ES",
+                        c_epoch=[r["c_epoch"] for r in rows],
+                        c_open=[r["c_open"] for r in rows],
+                        c_high=[r["c_high"] for r in rows],
+                        c_low=[r["c_low"] for r in rows],
+                        c_close=[r["c_close"] for r in rows],
+                        c_volume=[r["c_volume"] for r in rows],
+                        )
+    with open("testdata/set1/set1_ind_dps_e1h9ema.json") as f:
+        expected = {d["dt"]: d["value"] for d in json.load(f)}
+    for candles in [frame, frame.to_candles()]:
+        ema = IndicatorEMA(description="Test EMA",
+                           timeframe="e1h",
+                           trading_hours="eth",
+                           symbol="ES",
+                           calc_version="1.0.0",
+                           calc_details="test",
+                           start_dt=rows[0]["c_datetime"],
+                           end_dt=rows[-1]["c_datetime"],
+                           autoload_chart=False,
+                           candle_chart=Chart(c_timeframe="e1h",
+                                              c_trading_hours="eth",
+                                              c_symbol="ES",
+                                              c_start=rows[0]["c_datetime"],
+                                              c_end=rows[-1]["c_datetime"],
+                                              c_candles=candles,
+                                              ),
+                           parameters={"length": 9},
+                           )
+        ema.calculate()
+        assert ema.datapoints[0].dt == rows[36]["c_datetime"]
+        common = [dp for dp in ema.datapoints if dp.dt in expected]
+        assert len(common) > 300
+        for dp in common:
+            assert dp.value == expected[dp.dt], dp.dt
+
+
 @pytest.mark.storage
 @pytest.mark.suppress_stdout
 def test_Indicator_calculated_spotcheck_ES_eth_e1h_RSI_close_p14_swilder():
@@ -1520,6 +1891,111 @@ def test_IndicatorDataPoint_eq_field_sensitivity(
     run_eq_field_sensitivity(obj)
 
 
+def make_datapoints(count=5):
+    """Return IndicatorDataPoint objects one minute apart from 2099."""
+    start = dt_to_epoch("2099-01-02 12:00:00")
+    return [IndicatorDataPoint(dt=dt_from_epoch(start + (i * 60)),
+                               value=5000.25 + i,
+                               ind_id="test_id",
+                               name="test",
+                               )
+            for i in range(count)]
+
+
+def test_IndicatorDataPoints_views_append_sort_and_lookup():
+    """Verify the columnar store matches a list of IndicatorDataPoints."""
+    dps = make_datapoints()
+    store = IndicatorDataPoints.from_datapoints(dps)
+    assert len(store) == 5
+    assert store == dps
+    assert dps == store
+    assert store[1] == dps[1]
+    assert store[-1] == dps[-1]
+    assert store[1:3] == dps[1:3]
+    assert store.to_clean_dicts() == [d.to_clean_dict() for d in dps]
+    # Views are copies
+    store[0].value = 1.0
+    assert store[0] == dps[0]
+    with pytest.raises(IndexError):
+        store[5]
+    with pytest.raises(ValueError):
+        store.epochs[0] = 0
+    # Out of order appends are still found and then sorted away
+    store = IndicatorDataPoints()
+    for dp in [dps[3], dps[1], dps[4], dps[0]]:
+        store.append(dp)
+    assert store.ind_id == "test_id"
+    assert store.index_of(dps[1].epoch) == 1
+    assert store.index_of(dps[2].epoch) is None
+    store.sort()
+    assert store == [dps[0], dps[1], dps[3], dps[4]]
+    assert store.index_of(dps[3].epoch) == 2
+    store.extend(IndicatorDataPoints.from_datapoints(dps[2:3]))
+    assert store.index_of(dps[2].epoch) == 4
+    # Adding keeps a collection unless other ind_ids give a plain list
+    added = store + [dps[2]]
+    assert isinstance(added, IndicatorDataPoints)
+    assert added == store.to_datapoints() + [dps[2]]
+    assert len(store) == 5
+    added = dps[:2] + store[:1]
+    assert isinstance(added, IndicatorDataPoints)
+    assert added == dps[:2] + [dps[0]]
+    other = IndicatorDataPoint(dt=dps[0].dt, value=1.0,
+                               ind_id="other_id", name="test")
+    mixed = store + [other]
+    assert isinstance(mixed, list)
+    assert mixed == store.to_datapoints() + [other]
+    mixed = [other] + store
+    assert isinstance(mixed, list)
+    assert mixed == [other] + store.to_datapoints()
+    # None values are rejected rather than stored as NaN
+    with pytest.raises(ValueError):
+        store.append(IndicatorDataPoint(dt=dps[0].dt, value=None,
+                                        ind_id="test_id", name="test"))
+    with pytest.raises(ValueError):
+        IndicatorDataPoints(ind_id="test_id", epochs=[1, 2],
+                            values=[1.0, None])
+    assert len(store) == 5
+    assert IndicatorDataPoints() == IndicatorDataPoints(ind_id="other")
+    with pytest.raises(ValueError):
+        store.append(IndicatorDataPoint(dt=dps[0].dt, value=1.0,
+                                        ind_id="other_id", name="test"))
+    # Indicator keeps its datapoints in a store and finds them by epoch
+    ind = Indicator(name="test",
+                    description="Store test",
+                    timeframe="1m",
+                    trading_hours="eth",
+                    symbol="ES",
+                    calc_version="1.0.0",
+                    calc_details="test",
+                    ind_id="test_id",
+                    autoload_chart=False,
+                    datapoints=list(reversed(dps)),
+                    )
+    assert isinstance(ind.datapoints, IndicatorDataPoints)
+    assert ind.datapoints == dps
+    assert ind.get_datapoint(dps[2].dt) == dps[2]
+    assert ind.prev_datapoint(dps[2].dt) == dps[1]
+    assert ind.get_datapoint("2099-01-03 12:00:00") is None
+    assert ind.datapoint_indexes_by_dt()[dps[4].dt] == 4
+
+
+def test_IndicatorDataPoints_eq_covers_all_attributes(
+    assert_eq_fields_cover_instance,
+):
+    """_EQ_FIELDS | _EQ_EXCLUDE must exactly match instance __dict__."""
+    assert_eq_fields_cover_instance(
+        IndicatorDataPoints.from_datapoints(make_datapoints()))
+
+
+def test_IndicatorDataPoints_eq_field_sensitivity(
+    run_eq_field_sensitivity,
+):
+    """Confirm _EQ_FIELDS drives inequality and _EQ_EXCLUDE does not."""
+    run_eq_field_sensitivity(
+        IndicatorDataPoints.from_datapoints(make_datapoints()))
+
+
 def test_Indicator_eq_covers_all_attributes(assert_eq_fields_cover_instance):
     """_EQ_FIELDS | _EQ_EXCLUDE must exactly match instance __dict__."""
     sym = Symbol(
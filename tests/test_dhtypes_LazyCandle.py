@@ -0,0 +1,124 @@
+"""Tests for LazyCandle creation, lazy derivation, and Candle parity."""
+import json
+import pytest
+from dhtrader import (
+    Candle, Chart, LazyCandle)
+
+
+def candle_args(**overrides):
+    """Return default kwargs shared by Candle and LazyCandle fixtures."""
+    args = {"c_datetime": "2099-01-02 12:00:00",
+            "c_timeframe": "1m",
+            "c_open": 5000,
+            "c_high": 5007.75,
+            "c_low": 4995.5,
+            "c_close": 5002,
+            "c_volume": 1501,
+            "c_symbol": "ES",
+            }
+    args.update(overrides)
+    return args
+
+
+@pytest.fixture
+def lazy():
+    """Create and return a default ES 1m LazyCandle fixture."""
+    return LazyCandle(**candle_args())
+
+
+@pytest.mark.suppress_stdout
+def test_LazyCandle_create_and_verify_common_methods(lazy):
+    """Test LazyCandle __init__ values, __eq__, __ne__, __str__, __repr__,
+    to_clean_dict, to_json, pretty, and brief against Candle output.
+    """
+    candle = Candle(**candle_args())
+    assert isinstance(lazy, LazyCandle)
+    assert not hasattr(lazy, "__dict__")
+    # __init__
+    assert lazy.c_datetime == "2099-01-02 12:00:00"
+    assert lazy.c_open == 5000.0
+    assert lazy.c_volume == 1501
+    assert lazy.c_symbol.ticker == "ES"
+    assert lazy.c_tags == []
+    # __eq__ and __ne__, including against regular Candles both ways
+    diff = LazyCandle(**candle_args(c_close=5003))
+    assert lazy == LazyCandle(**candle_args())
+    assert lazy == candle
+    assert candle == lazy
+    assert not (lazy != candle)
+    assert not (candle != lazy)
+    assert lazy != diff
+    assert candle != diff
+    # __str__, __repr__, to_json, to_clean_dict, pretty, and brief all
+    # match Candle exactly
+    assert str(lazy) == str(candle)
+    assert repr(lazy) == repr(candle)
+    assert lazy.to_json() == candle.to_json()
+    assert lazy.to_clean_dict() == candle.to_clean_dict()
+    assert isinstance(json.loads(lazy.to_json()), dict)
+    assert lazy.pretty() == candle.pretty()
+    assert lazy.brief() == candle.brief()
+    assert lazy.to_candle() == candle
+    assert isinstance(lazy.to_candle(), Candle)
+
+
+@pytest.mark.suppress_stdout
+def test_LazyCandle_derived_fields_are_lazy(lazy):
+    """Verify derived fields stay unset until read and then match Candle."""
+    candle = Candle(**candle_args())
+    derived = ["c_epoch", "c_date", "c_time", "c_end_datetime"]
+    derived += sorted(LazyCandle._OHLC_DERIVED)
+    # Slots are empty until first access
+    for f in derived:
+        with pytest.raises(AttributeError):
+            object.__getattribute__(lazy, f)
+    for f in derived:
+        assert getattr(lazy, f) == getattr(candle, f)
+        # Cached in the slot after first access
+        assert object.__getattribute__(lazy, f) == getattr(candle, f)
+    # Passed values are used rather than derived
+    passed = LazyCandle(**candle_args(c_epoch=123, c_date="x", c_time="y"))
+    assert passed.c_epoch == 123
+    assert passed.c_date == "x"
+    assert passed.c_time == "y"
+    # Zero size and direction variants match Candle
+    for overrides in [{"c_close": 4999}, {"c_close": 5000},
+                      {"c_open": 5000, "c_high": 5000, "c_low": 5000,
+                       "c_close": 5000}]:
+        assert (LazyCandle(**candle_args(**overrides))
+                == Candle(**candle_args(**overrides)))
+    with pytest.raises(AttributeError):
+        lazy.not_a_field
+
+
+@pytest.mark.suppress_stdout
+def test_LazyCandle_contains(lazy):
+    """Verify contains_price and contains_datetime match Candle."""
+    assert lazy.contains_price(5000)
+    assert not lazy.contains_price(9999)
+    assert lazy.contains_datetime("2099-01-02 12:00:30")
+    assert not lazy.contains_datetime("2099-01-02 12:01:00")
+
+
+@pytest.mark.suppress_stdout
+def test_LazyCandle_in_Chart(lazy):
+    """Verify a Chart accepts LazyCandles alongside Candles."""
+    chart = Chart(c_timeframe="1m",
+                  c_trading_hours="eth",
+                  c_symbol="ES",
+                  )
+    chart.add_candle(lazy)
+    assert chart.candles_count == 1
+    assert chart.earliest_candle == "2099-01-02 12:00:00"
+    assert len(chart.pretty(suppress_candles=False).splitlines()) == 38
+
+
+def test_LazyCandle_eq_covers_all_attributes(
+        assert_eq_fields_cover_instance, lazy):
+    """_EQ_FIELDS | _EQ_EXCLUDE must exactly match instance __slots__."""
+    assert_eq_fields_cover_instance(lazy)
+
+
+def test_LazyCandle_eq_field_sensitivity(run_eq_field_sensitivity, lazy):
+    """Confirm _EQ_FIELDS drives inequality and _EQ_EXCLUDE does not."""
+    run_eq_field_sensitivity(lazy)
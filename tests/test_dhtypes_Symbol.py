@@ -1,6 +1,7 @@
 """Tests for Symbol market hours, serialization, and era detection."""
 import datetime as dt
 import json
+import numpy as np
 import pytest
 from dhtrader import (
     dt_as_dt, dt_as_str, dt_to_epoch, Event, MARKET_ERAS, Symbol)
@@ -183,6 +184,176 @@ def test_filter_open_candles_matches_market_is_open(symbol):
     assert [c.c_datetime for c in filtered] == [c.c_datetime for c in expected]
 
 
+@pytest.mark.suppress_stdout
+def test_filter_open_epochs_matches_is_open_epoch(symbol):
+    """Verify the vectorized epoch mask matches per-epoch checks."""
+    events = [
+        Event(
+            start_dt="2099-01-05 12:00:00",
+            end_dt="2099-01-05 13:00:00",
+            symbol="ES",
+            category="Closed",
+            tags=["test"],
+            notes="bulk-epoch-check",
+        ),
+    ]
+    # Every minute of a week plus second-level edges of the event
+    start = dt_to_epoch("2099-01-04 00:00:00")
+    epochs = list(range(start, start + (7 * 86400), 60))
+    epochs += [dt_to_epoch("2099-01-05 11:59:59"),
+               dt_to_epoch("2099-01-05 13:00:01"),
+               start - 1,
+               ]
+    context = symbol.build_market_hours_context(
+        trading_hours="eth",
+        events=events,
+        start_dt=dt_as_dt("2099-01-03 00:00:00"),
+        end_dt=dt_as_dt("2099-01-11 00:00:00"),
+    )
+    for th in ["eth", "rth"]:
+        mask = symbol.filter_open_epochs(epochs=epochs,
+                                         trading_hours=th,
+                                         events=events,
+                                         )
+        th_context = symbol.build_market_hours_context(
+            trading_hours=th,
+            events=events,
+            start_dt=dt_as_dt("2099-01-03 00:00:00"),
+            end_dt=dt_as_dt("2099-01-11 00:00:00"),
+        )
+        expected = [symbol.is_open_epoch(target_epoch=e, context=th_context)
+                    for e in epochs]
+        assert mask.tolist() == expected
+    # A prebuilt context is used as given
+    mask = symbol.filter_open_epochs(epochs=epochs,
+                                     trading_hours="eth",
+                                     context=context,
+                                     )
+    assert mask.tolist() == [symbol.is_open_epoch(target_epoch=e,
+                                                  context=context)
+                             for e in epochs]
+    assert len(symbol.filter_open_epochs(epochs=[],
+                                         trading_hours="eth")) == 0
+
+
+@pytest.mark.suppress_stdout
+@pytest.mark.parametrize("start_dt,end_dt", [
+    # Era boundaries
+    ("2012-11-15 00:00:00", "2012-11-20 23:59:59"),
+    ("2015-09-17 00:00:00", "2015-09-22 23:59:59"),
+    # DST changes
+    ("2024-03-08 00:00:00", "2024-03-12 23:59:59"),
+    ("2024-11-01 00:00:00", "2024-11-05 23:59:59"),
+])
+def test_Symbol_trading_calendar_matches_context(symbol, start_dt, end_dt):
+    """Verify calendar bitmap lookups match context range checks."""
+    events = [
+        Event(
+            start_dt=dt_as_dt(start_dt) + dt.timedelta(days=1, hours=3),
+            end_dt=dt_as_dt(start_dt) + dt.timedelta(days=1, hours=5,
+                                                     seconds=30),
+            symbol="ES",
+            category="Closed",
+            tags=["test"],
+            notes="calendar-check",
+        ),
+    ]
+    start = dt_to_epoch(start_dt)
+    end = dt_to_epoch(end_dt)
+    # Every minute plus some epochs between minutes
+    epochs = list(range(start, end, 60)) + list(range(start + 1, end, 599))
+    for th in ["eth", "rth"]:
+        context = symbol.build_market_hours_context(trading_hours=th,
+                                                    events=events,
+                                                    start_dt=start_dt,
+                                                    end_dt=end_dt,
+                                                    )
+        calendar = symbol.get_trading_calendar(trading_hours=th,
+                                               events=events,
+                                               start_dt=start_dt,
+                                               end_dt=end_dt,
+                                               )
+        assert "open_minutes" in calendar
+        expected = [symbol.is_open_epoch(target_epoch=e, context=context)
+                    for e in epochs]
+        mask = symbol.filter_open_epochs(epochs=epochs,
+                                         trading_hours=th,
+                                         context=calendar,
+                                         )
+        assert mask.tolist() == expected
+        assert [symbol.is_open_epoch(target_epoch=e, context=calendar)
+                for e in epochs] == expected
+
+
+@pytest.mark.suppress_stdout
+def test_Symbol_get_trading_calendar_caching(symbol, tmp_path):
+    """Verify calendars are reused, keyed by events, and persisted."""
+    cal = symbol.get_trading_calendar(trading_hours="eth",
+                                      start_dt="2024-01-02 00:00:00",
+                                      end_dt="2024-01-03 00:00:00",
+                                      )
+    # Requests inside the default span compile the whole span once
+    assert cal["start_epoch"] == dt_to_epoch("2008-01-01 00:00:00")
+    assert symbol.get_trading_calendar(
+        trading_hours="eth", start_dt="2019-06-01 00:00:00") is cal
+    assert symbol.get_trading_calendar(trading_hours="rth") is not cal
+    event = Event(start_dt="2024-01-02 12:00:00",
+                  end_dt="2024-01-02 13:00:00",
+                  symbol="ES",
+                  category="Closed",
+                  tags=["test"],
+                  notes="calendar-cache-check",
+                  )
+    with_event = symbol.get_trading_calendar(trading_hours="eth",
+                                             events=[event])
+    assert with_event is not cal
+    noon = dt_to_epoch("2024-01-02 12:30:00")
+    assert symbol.is_open_epoch(target_epoch=noon, context=cal)
+    assert not symbol.is_open_epoch(target_epoch=noon, context=with_event)
+    # Requests outside the default span compile only what was asked and
+    # are kept alongside the default span
+    far = symbol.get_trading_calendar(trading_hours="eth",
+                                      start_dt="2099-01-05 00:00:00",
+                                      end_dt="2099-01-06 00:00:00",
+                                      )
+    assert far["minute_count"] == 2 * 1440
+    assert symbol.get_trading_calendar(
+        trading_hours="eth", start_dt="2099-01-05 12:00:00") is far
+    assert symbol.get_trading_calendar(
+        trading_hours="eth", start_dt="2024-06-01 00:00:00") is cal
+    assert symbol.calendar_cache_info() == {
+        "hits": 3, "misses": 4, "maxsize": 16, "currsize": 4}
+    # Least recently used calendars are evicted beyond the max size
+    for day in range(10, 30):
+        symbol.get_trading_calendar(trading_hours="rth",
+                                    start_dt=f"2098-01-{day} 00:00:00")
+    info = symbol.calendar_cache_info()
+    assert info["currsize"] == 16
+    assert info["misses"] == 24
+    assert symbol.get_trading_calendar(
+        trading_hours="eth", start_dt="2024-06-01 00:00:00") is not cal
+    symbol.clear_calendar_cache()
+    assert symbol.calendar_cache_info() == {
+        "hits": 0, "misses": 0, "maxsize": 16, "currsize": 0}
+    # Cache files are loaded when they match and rebuilt when stale
+    cache_file = tmp_path / "es_eth.npz"
+    saved = Symbol(ticker="ES", name="ES", leverage_ratio=50,
+                   tick_size=0.25).get_trading_calendar(
+                       trading_hours="eth", cache_file=cache_file)
+    assert cache_file.exists()
+    loaded = Symbol(ticker="ES", name="ES", leverage_ratio=50,
+                    tick_size=0.25).get_trading_calendar(
+                        trading_hours="eth", cache_file=cache_file)
+    assert loaded is not saved
+    assert (loaded["open_minutes"] == saved["open_minutes"]).all()
+    assert loaded["closed_ranges"] == saved["closed_ranges"]
+    stale = Symbol(ticker="ES", name="ES", leverage_ratio=50,
+                   tick_size=0.25).get_trading_calendar(
+                       trading_hours="eth", events=[event],
+                       cache_file=cache_file)
+    assert not symbol.is_open_epoch(target_epoch=noon, context=stale)
+
+
 @pytest.mark.suppress_stdout
 def test_Symbol_market_is_open(symbol):
     """Verify Symbol.market_is_open() for eth and rth across various times."""
@@ -1292,6 +1463,26 @@ def test_Symbol_get_era(symbol):
         sym.get_era("2007-12-31 12:00:00")
 
 
+@pytest.mark.suppress_stdout
+def test_Symbol_get_era_ids_matches_get_era(symbol):
+    """Verify vectorized get_era_ids() agrees with get_era() per epoch,
+    including the minutes either side of each era boundary."""
+    epochs = list(range(dt_to_epoch("2008-01-01 00:00:00"),
+                        dt_to_epoch("2100-01-01 00:00:00"), 86400 * 7 + 3607))
+    for era in MARKET_ERAS:
+        start = dt_to_epoch(dt.datetime.combine(era["start_date"], dt.time()))
+        epochs.extend([start - 60, start, start + 60])
+    epochs = [e for e in epochs if e >= dt_to_epoch("2008-01-01 00:00:00")]
+    ids = symbol.get_era_ids(epochs)
+    for e, i in zip(epochs, ids.tolist()):
+        assert MARKET_ERAS[i] is symbol.get_era(dt.datetime.fromtimestamp(e))
+    # Dates are accepted as well as datetimes and strings
+    assert symbol.get_era(dt.date(2012, 11, 17))["name"] == (
+        "2012holidays_thru_2015holidays")
+    with pytest.raises(ValueError, match="No market era defined"):
+        symbol.get_era_ids([dt_to_epoch("2007-12-31 23:59:00")])
+
+
 @pytest.mark.suppress_stdout
 def test_Symbol_get_times_for_era(symbol):
     """Verify Symbol.get_times_for_era() returns correct hours."""
@@ -1546,6 +1737,67 @@ def test_Symbol_get_market_boundary_historical_eras(symbol):
     assert dt_as_str(result2) == "2012-11-19 09:30:00"
 
 
+@pytest.mark.suppress_stdout
+def test_Symbol_lookup_market_boundary_matches_date_arithmetic(symbol):
+    """Verify bisect boundary lookups match get_market_boundary()."""
+    events = [
+        Event(start_dt="2024-07-03 13:15:00",
+              end_dt="2024-07-05 09:00:00",
+              symbol="ES",
+              category="Closed",
+              tags=["test"],
+              notes="boundary-check",
+              ),
+    ]
+    targets = [dt_as_dt("2024-06-28 00:00:00") + dt.timedelta(minutes=m)
+               for m in range(0, 14 * 1440, 337)]
+    # Exact boundaries are excluded in both directions
+    targets += [dt_as_dt("2024-07-01 18:00:00"),
+                dt_as_dt("2024-07-01 16:59:00"),
+                dt_as_dt("2024-07-01 09:30:00"),
+                ]
+    for t in targets:
+        for th in ["eth", "rth"]:
+            for boundary in ["open", "close"]:
+                for order in ["next", "previous"]:
+                    for evs in [None, events]:
+                        expected = symbol.get_market_boundary(
+                            target_dt=t,
+                            trading_hours=th,
+                            boundary=boundary,
+                            order=order,
+                            events=evs,
+                        )
+                        assert symbol.lookup_market_boundary(
+                            target_dt=t,
+                            trading_hours=th,
+                            boundary=boundary,
+                            order=order,
+                            events=evs,
+                        ) == expected
+    opens = symbol.get_session_boundaries(trading_hours="eth",
+                                          boundary="open")
+    assert (opens[1:] > opens[:-1]).all()
+    # Across an era change boundaries use the era of target_dt, as
+    # get_market_boundary() does, rather than the era of their own date
+    result = symbol.get_previous_close(target_dt="2012-11-18 12:00:00",
+                                       trading_hours="eth")
+    assert dt_as_str(result) == "2012-11-16 17:15:00"
+    result = symbol.get_next_close(target_dt="2015-09-18 20:00:00",
+                                   trading_hours="eth")
+    assert dt_as_str(result) == "2015-09-21 17:15:00"
+    # The first week of the first era is answered without a calendar
+    # reaching back before it
+    result = symbol.get_next_close(target_dt="2008-01-02 05:33:53",
+                                   trading_hours="eth")
+    assert dt_as_str(result) == "2008-01-02 17:29:00"
+    result = symbol.get_previous_open(target_dt="2008-01-01 12:00:00",
+                                      trading_hours="eth")
+    assert dt_as_str(result) == "2007-12-31 18:00:00"
+    with pytest.raises(ValueError):
+        symbol.get_session_boundaries(trading_hours="eth", boundary="x")
+
+
 @pytest.mark.suppress_stdout
 def test_Symbol_init(symbol):
     """Verify Symbol initialization and attributes."""
@@ -1566,6 +1818,7 @@ def test_Symbol_init(symbol):
     assert hasattr(sym, "rth_week_open")
     assert hasattr(sym, "rth_week_close")
     assert hasattr(sym, "_closed_hours_cache")
+    assert hasattr(sym, "_calendar_cache")
 
     # Test that leverage_ratio and tick_size are converted to float
     # and alternate ticker and name values apply correctly
@@ -1740,11 +1993,14 @@ def test_Symbol_create_and_verify_common_methods(symbol):
     assert sym.rth_week_close == {
         "day_of_week": 4, "time": dt.time(16, 0)}
     assert sym._closed_hours_cache == {}
+    assert sym._calendar_cache == {}
+    assert sym._calendar_cache_stats == {"hits": 0, "misses": 0}
     expected_attrs = {
-        "_closed_hours_cache", "eth_close_time", "eth_open_time",
-        "eth_week_close", "eth_week_open", "leverage_ratio", "name",
-        "rth_close_time", "rth_open_time", "rth_week_close",
-        "rth_week_open", "tick_size", "ticker",
+        "_calendar_cache", "_calendar_cache_stats", "_closed_hours_cache",
+        "eth_close_time", "eth_open_time", "eth_week_close",
+        "eth_week_open", "leverage_ratio", "name", "rth_close_time",
+        "rth_open_time", "rth_week_close", "rth_week_open", "tick_size",
+        "ticker",
     }
     actual_attrs = set(vars(sym).keys())
     added = actual_attrs - expected_attrs
@@ -1802,6 +2058,47 @@ def test_Symbol_create_and_verify_common_methods(symbol):
     assert '"ES"' in p
 
 
+@pytest.mark.suppress_stdout
+def test_Symbol_price_ticks_round_trip(symbol):
+    """Verify price_to_ticks and ticks_to_price for scalars and arrays."""
+    assert symbol.price_to_ticks(5000.25) == 20001
+    assert isinstance(symbol.price_to_ticks(5000.25), int)
+    assert symbol.price_to_ticks(-1.5) == -6
+    assert symbol.ticks_to_price(20001) == 5000.25
+    prices = np.array([4999.75, 5000.0, 5000.25])
+    ticks = symbol.price_to_ticks(prices)
+    assert ticks.dtype == np.int32
+    assert ticks.tolist() == [19999, 20000, 20001]
+    assert symbol.ticks_to_price(ticks).tolist() == prices.tolist()
+    # Cent ticks return the float nearest each exact price
+    cents = Symbol(ticker="ES", name="ES", leverage_ratio=1, tick_size=0.01)
+    assert cents.price_to_ticks(100.29 + 0.01) == 10030
+    assert cents.ticks_to_price(10030) == 100.3
+    # Tick sizes that are not a whole fraction of a point still work
+    odd = Symbol(ticker="ES", name="ES", leverage_ratio=1, tick_size=1.5)
+    assert odd.price_to_ticks([3.0, 4.5]).tolist() == [2, 3]
+    assert odd.ticks_to_price(3) == 4.5
+    # Prices off the tick grid, non-finite, or too large are rejected
+    with pytest.raises(ValueError):
+        symbol.price_to_ticks(5000.1)
+    with pytest.raises(ValueError):
+        symbol.price_to_ticks([5000.0, 5000.1])
+    with pytest.raises(ValueError):
+        symbol.price_to_ticks([5000.0, np.nan])
+    with pytest.raises(ValueError):
+        symbol.price_to_ticks([1e9])
+    # price_to_ticks_or_none() returns None for them instead
+    assert symbol.price_to_ticks_or_none(5000.25) == 20001
+    assert isinstance(symbol.price_to_ticks_or_none(-1.5), int)
+    assert symbol.price_to_ticks_or_none(5000.1) is None
+    assert symbol.price_to_ticks_or_none(float("nan")) is None
+    assert cents.price_to_ticks_or_none(100.29 + 0.01) == 10030
+    assert odd.price_to_ticks_or_none(4.5) == 3
+    assert odd.price_to_ticks_or_none(4.0) is None
+    with pytest.raises(ValueError):
+        symbol.price_to_ticks(float("nan"))
+
+
 def test_Symbol_eq_covers_all_attributes(assert_eq_fields_cover_instance):
     """_EQ_FIELDS | _EQ_EXCLUDE must exactly match instance __dict__."""
     sym = Symbol(
@@ -898,6 +898,29 @@ def test_Trade_tick_and_target_calculations_correct():
                          prof_ticks=None,
                          prof_target=None,
                          )
+    # Targets off the tick grid cannot be converted to whole ticks
+    with pytest.raises(ValueError):
+        create_trade(direction="long",
+                     entry_price=5000,
+                     prof_ticks=None,
+                     prof_target=5005.1,
+                     )
+    # Ticks and targets are matched in whole ticks, so float drift in
+    # 100.29 + 0.01 does not reject an accurate cent tick target
+    cents = Symbol(ticker="ES", name="ES", leverage_ratio=1, tick_size=0.01)
+    t = Trade(open_dt="2099-01-08 12:00:00",
+              direction="long",
+              timeframe="5m",
+              trading_hours="rth",
+              entry_price=100.29,
+              stop_ticks=29,
+              stop_target=100,
+              prof_ticks=1,
+              prof_target=100.3,
+              symbol=cents,
+              )
+    assert t.prof_ticks == 1
+    assert t.stop_ticks == 29
 
 
 @pytest.mark.suppress_stdout
@@ -921,6 +944,35 @@ def test_Trade_gain_loss():
     assert t.gain_loss(contracts=5) == -6250
 
 
+@pytest.mark.suppress_stdout
+def test_Trade_impacts_with_prices_off_tick_grid():
+    """Verify impacts of prices between ticks use plain float moves."""
+    t = create_trade(entry_price=5000.1, stop_ticks=10, prof_ticks=10)
+    t.close(price=5001.0, dt="2099-01-08 12:45:00")
+    balance = t.balance_impact(balance_open=10000,
+                               contracts=1,
+                               contract_value=50,
+                               contract_fee=1.0,
+                               )
+    assert balance["gain_loss"] == 44.0
+    assert balance["balance_close"] == 10044.0
+    drawdown = t.drawdown_impact(drawdown_open=10000,
+                                 drawdown_limit=12000,
+                                 contracts=1,
+                                 contract_value=50,
+                                 contract_fee=1.0,
+                                 )
+    assert drawdown["drawdown_close"] == 10044.0
+    t = create_trade(entry_price=100.29, stop_ticks=10, prof_ticks=10)
+    t.close(price=100.30, dt="2099-01-08 12:45:00")
+    balance = t.balance_impact(balance_open=10000,
+                               contracts=1,
+                               contract_value=50,
+                               contract_fee=1.0,
+                               )
+    assert balance["gain_loss"] == -0.5
+
+
 @pytest.mark.suppress_stdout
 def test_Trade_duration():
     """Verify Trade.duration() calculation."""
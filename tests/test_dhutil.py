@@ -12,6 +12,7 @@ from dhtrader import (
     store_candles_from_csv,
     delete_candles_by_field,
     get_candles,
+    rebuild_candles_from_1m,
     remediate_candle_gaps,
 )
 
@@ -334,6 +335,43 @@ def test_store_candles_from_csv_and_compare(cleanup_2099_candles):
     assert "c_volume" not in vol_diff["minor_diffs"]
 
 
+@pytest.mark.storage
+@pytest.mark.suppress_stdout
+def test_rebuild_candles_from_1m(cleanup_2099_candles):
+    """Verify rebuild_candles_from_1m aggregates stored 1m candles.
+
+    Storage Usage: store_candles_from_csv writes, rebuild_candles_from_1m
+    reads 1m candles with dry_run=True so nothing else is stored.
+    """
+    store_candles_from_csv(
+        filepath=TEST_2099_GOOD_CSV,
+        start_dt=TEST_2099_START,
+        end_dt=TEST_2099_END,
+        timeframe=TEST_2099_TIMEFRAME,
+        symbol=TEST_2099_SYMBOL,
+        name=_TEST_CANDLE_NAME,
+    )
+    ones = read_candles_from_csv(start_dt=TEST_2099_START,
+                                 end_dt=TEST_2099_END,
+                                 filepath=TEST_2099_GOOD_CSV,
+                                 )
+    rebuilt = rebuild_candles_from_1m(timeframe="5m",
+                                      start_dt=TEST_2099_START,
+                                      end_dt=TEST_2099_END,
+                                      symbol=TEST_2099_SYMBOL,
+                                      dry_run=True,
+                                      )
+    assert [c.c_datetime for c in rebuilt] == ["2099-01-06 18:00:00",
+                                               "2099-01-06 18:05:00"]
+    for c, group in zip(rebuilt, [ones[:5], ones[5:]]):
+        assert c.c_timeframe == "5m"
+        assert c.c_open == group[0].c_open
+        assert c.c_high == max(g.c_high for g in group)
+        assert c.c_low == min(g.c_low for g in group)
+        assert c.c_close == group[-1].c_close
+        assert c.c_volume == sum(g.c_volume for g in group)
+
+
 @pytest.mark.storage
 @pytest.mark.suppress_stdout
 def test_remediate_candle_gaps(cleanup_2099_candles):